@@ -0,0 +1,295 @@
+"""
+ALT - A*, Landmarks and the Triangle inequality.
+
+Preprocessing picks k landmark vertices and stores the shortest distance from every landmark to
+every vertex. For any landmark L the triangle inequality gives |d(L, t) - d(L, v)| <= d(v, t),
+so the best of these over all landmarks is a lower bound A* can use as its heuristic. Paying for
+k full Dijkstra runs once makes each later point-to-point query settle far fewer vertices.
+
+The tables are array('d') buffers indexed by a dense vertex id (the order of graph._structure),
+and can be saved and reloaded so a fixed map only has to be preprocessed once. The file holds
+only data - a header, the vertex labels as JSON and the raw tables - so loading one from
+elsewhere cannot run code.
+"""
+
+import random
+import struct
+import sys
+from array import array
+
+from graph.binary_io import labels_to_json, labels_from_json
+from pq import APQBinaryHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest, astar_source_to_dest
+
+ALT_FILE_MAGIC = b'ALTI'
+# 1 was a pickle; 2 is the data-only layout below
+ALT_FILE_VERSION = 2
+
+# magic, version, byte order (0 little, 1 big), n, k, labels bytes - then the labels JSON
+# padded to 8 bytes, k int64 landmark ids, and k tables of n float64
+_HEADER = struct.Struct('<4sII QQQ')
+
+
+class ALTIndex:
+    """ Landmark distance tables for one undirected Graph. """
+
+    def __init__(self, graph, landmarks, tables):
+        """ Wrap prebuilt tables - use ALTIndex.build() or ALTIndex.load() instead.
+
+        Args:
+            graph -- the Graph the tables were computed on
+            landmarks -- list of landmark Vertex objects
+            tables -- list of array('d'), tables[i][id] is the distance from landmarks[i]
+        """
+        self._graph = graph
+        self._vertices = list(graph._structure)
+        self._ids = {v: i for i, v in enumerate(self._vertices)}
+        self._landmarks = landmarks
+        self._tables = tables
+
+    @classmethod
+    def build(cls, graph, k, pq_class=APQBinaryHeap, selection='farthest', seed=None):
+        """ Select k landmarks and compute their distance tables.
+
+        Args:
+            graph -- the Graph to preprocess
+            k -- number of landmarks
+            pq_class -- the queue used for the preprocessing Dijkstra runs
+            selection -- 'farthest' picks each landmark as far as possible from the ones already
+                         chosen; 'avoid' picks them in the regions the current landmarks cover
+                         worst (Goldberg and Werneck's avoid heuristic)
+            seed -- seed for the random root vertex, for repeatable builds
+        """
+        if selection not in ('farthest', 'avoid'):
+            raise ValueError("selection must be 'farthest' or 'avoid', not " + repr(selection))
+        if getattr(graph, 'is_directed', lambda: False)():
+            # The bounds use d(L, v) = d(v, L), which one-way edges break.
+            raise ValueError('ALTIndex needs an undirected graph')
+        index = cls(graph, [], [])
+        if not index._vertices:
+            return index
+        rng = random.Random(seed)
+        k = min(k, len(index._vertices))
+        while len(index._landmarks) < k:
+            if selection == 'avoid' and index._landmarks:
+                landmark = index._avoid_landmark(rng, pq_class)
+            else:
+                landmark = index._farthest_landmark(rng, pq_class)
+            if landmark is None:
+                break
+            index._add_landmark(landmark, pq_class)
+        return index
+
+    #--------------------------------------------------#
+    #Preprocessing
+
+    def _table_for(self, source, pq_class):
+        """ Run a full Dijkstra from source into an array('d') indexed by vertex id. """
+        table = array('d', [float('inf')]) * len(self._vertices)
+        closed = dijkstra_source_to_dest(source, None, self._graph, pq_class)
+        ids = self._ids
+        for v, (distance, predecessor) in closed.items():
+            table[ids[v]] = distance
+        return table
+
+    def _add_landmark(self, landmark, pq_class):
+        self._landmarks.append(landmark)
+        self._tables.append(self._table_for(landmark, pq_class))
+
+    def _farthest_landmark(self, rng, pq_class):
+        """ Return the reachable vertex furthest from the landmarks chosen so far. """
+        if self._tables:
+            # min distance to any landmark, per vertex
+            coverage = array('d', self._tables[0])
+            for table in self._tables[1:]:
+                for i, distance in enumerate(table):
+                    if distance < coverage[i]:
+                        coverage[i] = distance
+        else:
+            coverage = self._table_for(rng.choice(self._vertices), pq_class)
+        best, best_id = -1, None
+        for i, distance in enumerate(coverage):
+            if best < distance < float('inf'):
+                best, best_id = distance, i
+        if best_id is None or best == 0:
+            return None
+        return self._vertices[best_id]
+
+    def _avoid_landmark(self, rng, pq_class):
+        """ Pick a landmark in the part of the tree from a random root the bounds cover worst. """
+        root = rng.choice(self._vertices)
+        closed = dijkstra_source_to_dest(root, None, self._graph, pq_class)
+
+        # weight(v) - how far the current landmark bound for (root, v) falls short of the truth
+        children = {v: [] for v in closed}
+        for v, (distance, predecessor) in closed.items():
+            if predecessor is not None:
+                children[predecessor].append(v)
+        landmark_ids = set(self._ids[l] for l in self._landmarks)
+
+        # Subtree sizes bottom-up. closed is in settle order, which puts every vertex after its
+        # parent, so walking it backwards reaches children first - sorting by distance does not,
+        # as a zero weight edge leaves a child level with its parent. Any subtree holding a
+        # landmark is already well covered and scores 0.
+        size = {}
+        has_landmark = {}
+        for v in reversed(list(closed)):
+            total = closed[v][0] - self._bound_ids(self._ids[root], self._ids[v])
+            contains = self._ids[v] in landmark_ids
+            for child in children[v]:
+                total += size[child]
+                contains = contains or has_landmark[child]
+            has_landmark[v] = contains
+            size[v] = 0 if contains else total
+
+        # Walk down from the root along the heaviest child until we hit a leaf.
+        current = root
+        while children[current]:
+            heaviest = max(children[current], key=lambda v: size[v])
+            if size[heaviest] <= 0:
+                break
+            current = heaviest
+        if current == root or self._ids[current] in landmark_ids:
+            return self._farthest_landmark(rng, pq_class)
+        return current
+
+    #--------------------------------------------------#
+    #Queries
+
+    def landmarks(self):
+        """ Return the list of landmark vertices. """
+        return list(self._landmarks)
+
+    def _bound_ids(self, v, w):
+        """ Lower bound on d(v, w) for vertex ids v and w. """
+        best = 0
+        for table in self._tables:
+            bound = abs(table[w] - table[v])
+            # inf - inf is nan, which is never > best, so unreachable pairs are skipped
+            if bound > best:
+                best = bound
+        return best
+
+    def lower_bound(self, v, w):
+        """ Return a lower bound on the shortest distance between vertices v and w. """
+        return self._bound_ids(self._ids[v], self._ids[w])
+
+    def _active_tables(self, start, end, active):
+        """ Return the tables of the active landmarks giving the best bound for start -> end. """
+        if active is None or active >= len(self._tables):
+            return self._tables
+        s, t = self._ids[start], self._ids[end]
+        ranked = sorted(self._tables, key=lambda table: abs(table[t] - table[s]), reverse=True)
+        return ranked[:active]
+
+    def heuristic(self, end, start=None, active=None):
+        """ Return an A* heuristic(vertex, end) backed by the landmark tables.
+
+        Args:
+            end -- the target vertex the heuristic is for
+            start -- the source vertex, needed only to choose active landmarks
+            active -- if set, only use this many landmarks with the best start -> end bound
+        """
+        tables = self._tables if start is None else self._active_tables(start, end, active)
+        ids = self._ids
+        t = ids[end]
+        # Pull the target column out once - only the vertex side changes between calls.
+        targets = [(table, table[t]) for table in tables]
+
+        def heuristic(vertex, target):
+            v = ids[vertex]
+            best = 0
+            for table, to_target in targets:
+                bound = abs(to_target - table[v])
+                if bound > best:
+                    best = bound
+            return best
+
+        return heuristic
+
+    def query(self, start, end, pq_class=APQBinaryHeap, active=None):
+        """ Answer a point-to-point query with A* on the landmark bounds.
+
+        Returns the same closed dictionary astar_source_to_dest does.
+        """
+        heuristic = self.heuristic(end, start, active)
+        return astar_source_to_dest(start, end, self._graph, pq_class, heuristic)
+
+    #--------------------------------------------------#
+    #Persistence
+
+    def save(self, filename):
+        """ Write the landmarks and tables to filename.
+
+        Vertex labels must be ones labels_to_json can store - str, int, float,
+        bool, None or tuples of them - or ValueError is raised.
+        """
+        labels = labels_to_json([v.element() for v in self._vertices])
+        byte_order = 0 if sys.byteorder == 'little' else 1
+        header = _HEADER.pack(ALT_FILE_MAGIC, ALT_FILE_VERSION, byte_order,
+                              len(self._vertices), len(self._tables), len(labels))
+        with open(filename, 'wb') as file:
+            file.write(header)
+            file.write(labels.ljust((len(labels) + 7) // 8 * 8, b'\0'))
+            file.write(array('q', [self._ids[l] for l in self._landmarks]).tobytes())
+            for table in self._tables:
+                file.write(table.tobytes())
+
+    @classmethod
+    def load(cls, filename, graph):
+        """ Read tables written by save() and attach them to graph.
+
+        The graph must have the same vertex labels as the one the tables were built on.
+        Rows are matched by position when the labels come in the saved order, otherwise
+        by label - which needs the labels to be unique, or ValueError is raised.
+        """
+        with open(filename, 'rb') as file:
+            data = file.read()
+        if len(data) < _HEADER.size or data[:4] != ALT_FILE_MAGIC:
+            raise ValueError(filename + ' is not an ALT file')
+        magic, version, byte_order, n, k, labels_size = _HEADER.unpack_from(data)
+        if version != ALT_FILE_VERSION:
+            raise ValueError('unsupported ALT file version: ' + repr(version))
+        if byte_order != (0 if sys.byteorder == 'little' else 1):
+            raise ValueError(filename + ' was saved on a machine with the other byte order')
+        start_landmarks = _HEADER.size + (labels_size + 7) // 8 * 8
+        start_tables = start_landmarks + 8 * k
+        if len(data) != start_tables + 8 * k * n:
+            raise ValueError(filename + ' has the wrong size for its header')
+        labels = labels_from_json(data[_HEADER.size:_HEADER.size + labels_size])
+        landmarks = array('q')
+        landmarks.frombytes(data[start_landmarks:start_tables])
+        if len(labels) != n or any(not 0 <= saved_id < n for saved_id in landmarks):
+            raise ValueError(filename + ' is corrupt')
+        if len(labels) != graph.num_vertices():
+            raise ValueError('ALT file has ' + str(len(labels)) + ' vertices, graph has '
+                             + str(graph.num_vertices()))
+
+        index = cls(graph, [], [])
+        if labels == [v.element() for v in index._vertices]:
+            # Same vertex order as when saved - map by position, which also copes with repeated labels.
+            order = list(range(n))
+        else:
+            # Re-map the saved vertex order onto this graph's order, by label.
+            by_label = {}
+            for v in index._vertices:
+                by_label.setdefault(v.element(), v)
+            if len(by_label) != n or len(set(labels)) != n:
+                raise ValueError('vertex labels are not unique and the vertex order differs'
+                                 ' from the ALT file, so its rows cannot be matched up')
+            order = []
+            for label in labels:
+                v = by_label.get(label)
+                if v is None:
+                    raise ValueError('vertex ' + repr(label) + ' from ALT file not in graph')
+                order.append(index._ids[v])
+        for saved_id in landmarks:
+            index._landmarks.append(index._vertices[order[saved_id]])
+        for i in range(k):
+            saved = array('d')
+            saved.frombytes(data[start_tables + 8 * n * i:start_tables + 8 * n * (i + 1)])
+            table = array('d', [float('inf')]) * len(order)
+            for saved_id, distance in enumerate(saved):
+                table[order[saved_id]] = distance
+            index._tables.append(table)
+        return index
@@ -0,0 +1,181 @@
+"""
+Batch shortest-path queries over a pool of worker processes.
+
+dijkstra_source_to_dest runs on one core, so a long list of independent queries (run_question6.py
+is hundreds of them) takes as long as all of them end to end. BatchExecutor spreads the queries
+over a multiprocessing Pool instead.
+
+Handing the Graph to every worker would pickle a million-odd Vertex and Edge objects per process.
+Instead the graph is frozen to CSR once, and its three arrays are copied into a single
+multiprocessing.shared_memory block:
+
+    [ offsets (n + 1 int64) | targets (2m int64) | weights (2m float64) ]
+
+Each worker attaches to the block by name when the pool starts and wraps it in a CSRGraph whose
+arrays are memoryviews onto the shared pages, so no worker holds its own copy of the graph. Only
+(source id, target id) go out to a worker and (distance, path ids) come back.
+
+The block and the pool are released by close() (or the with block), and otherwise when the
+executor is garbage collected or the interpreter exits - a block left linked stays allocated
+until reboot on Linux.
+"""
+
+import weakref
+from multiprocessing import Pool, shared_memory
+
+from pq import PQLazyHeap
+from graph import CSRGraph
+from dijkstra_algos.dijkstra import _dijkstra_csr
+
+
+# Set in each worker process by _attach_worker.
+_worker_graph = None
+_worker_memory = None
+_worker_pq_class = None
+
+
+def _share_csr(csr):
+    """ Copy csr's arrays into a new shared memory block, laid out as described above.
+
+    Returns (block, num_vertices, num_slots) - everything _attach_csr needs besides the name.
+    The caller owns the block and must close() and unlink() it.
+    """
+    num_vertices = csr.num_vertices()
+    num_slots = len(csr._targets)
+    end_offsets = 8 * (num_vertices + 1)
+    end_targets = end_offsets + 8 * num_slots
+    size = end_targets + 8 * num_slots
+    # A zero-size block is not allowed, even for a graph with no edges.
+    memory = shared_memory.SharedMemory(create=True, size=max(size, 1))
+    buf = memory.buf
+    buf[:end_offsets] = csr._offsets.tobytes()
+    buf[end_offsets:end_targets] = csr._targets.tobytes()
+    buf[end_targets:size] = csr._weights.tobytes()
+    del buf
+    return memory, num_vertices, num_slots
+
+
+def _attach_csr(name, num_vertices, num_slots):
+    """ Attach to a block made by _share_csr and return (block, CSRGraph over its pages). """
+    memory = shared_memory.SharedMemory(name=name)
+    buf = memory.buf
+    end_offsets = 8 * (num_vertices + 1)
+    end_targets = end_offsets + 8 * num_slots
+    offsets = buf[:end_offsets].cast('q')
+    targets = buf[end_offsets:end_targets].cast('q')
+    weights = buf[end_targets:end_targets + 8 * num_slots].cast('d')
+    # The workers only ever see vertex ids, so the labels are just the ids themselves.
+    return memory, CSRGraph(range(num_vertices), offsets, targets, weights)
+
+
+def _attach_worker(name, num_vertices, num_slots, pq_class):
+    """ Pool initializer - map the shared CSR arrays into this worker. """
+    global _worker_graph, _worker_memory, _worker_pq_class
+    _worker_memory, _worker_graph = _attach_csr(name, num_vertices, num_slots)
+    _worker_pq_class = pq_class
+
+
+def _run_query(task):
+    """ Answer one (index, source id, target id) task in a worker. """
+    index, start, end = task
+    closed = _dijkstra_csr(start, end, _worker_graph, _worker_pq_class, True)
+    if end not in closed:
+        return index, float('inf'), None
+    path = []
+    vertex = end
+    while vertex is not None:
+        path.append(vertex)
+        vertex = closed[vertex][1]
+    path.reverse()
+    return index, closed[end][0], path
+
+
+def _release(pool, memory):
+    """ Stop pool and free memory - the finalizer of a BatchExecutor, so it must not hold one. """
+    pool.terminate()
+    pool.join()
+    memory.close()
+    memory.unlink()
+
+
+class BatchExecutor:
+    """ A pool of worker processes answering shortest-path queries on one shared graph. """
+
+    def __init__(self, graph, processes=None, pq_class=PQLazyHeap):
+        """ Export graph to shared memory and start the workers.
+
+        Args:
+            graph -- The Graph instance containing vertices and weighted edges, or a CSRGraph
+            processes -- number of workers, os.cpu_count() if None
+            pq_class -- the queue each worker runs Dijkstra with
+        """
+        if isinstance(graph, CSRGraph):
+            csr = graph
+            self._vertices = None
+            self._ids = None
+        else:
+            csr = CSRGraph.from_graph(graph)
+            # from_graph numbers vertices in _structure order, so this maps ids back to Vertex.
+            self._vertices = list(graph._structure)
+            self._ids = {v: i for i, v in enumerate(self._vertices)}
+
+        self._memory, num_vertices, num_slots = _share_csr(csr)
+        try:
+            self._pool = Pool(processes, initializer=_attach_worker,
+                              initargs=(self._memory.name, num_vertices, num_slots, pq_class))
+        except BaseException:
+            self._memory.close()
+            self._memory.unlink()
+            raise
+        # Runs once - from close(), on garbage collection, or at exit, whichever comes first.
+        self._finalizer = weakref.finalize(self, _release, self._pool, self._memory)
+
+    def _to_id(self, vertex):
+        return vertex if self._ids is None else self._ids[vertex]
+
+    def _to_vertex(self, vertex_id):
+        return vertex_id if self._vertices is None else self._vertices[vertex_id]
+
+    def imap(self, queries, chunksize=1):
+        """
+        Answer every (start, end) pair in queries, yielding results as the workers finish them.
+
+        Results come back in completion order, not query order, so each is a tuple
+        (index, start, end, distance, path) where index is the query's position in queries,
+        distance is infinity and path is None if end is unreachable, and path is the list of
+        vertices (ids for a CSRGraph) from start to end.
+
+        Args:
+            queries -- iterable of (start, end) pairs
+            chunksize -- queries handed to a worker at a time; raise it for many cheap queries
+        """
+        queries = list(queries)
+        tasks = [(index, self._to_id(start), self._to_id(end))
+                 for index, (start, end) in enumerate(queries)]
+        for index, distance, path in self._pool.imap_unordered(_run_query, tasks, chunksize):
+            start, end = queries[index]
+            if path is not None:
+                path = [self._to_vertex(v) for v in path]
+            yield index, start, end, distance, path
+
+    def map(self, queries, chunksize=1):
+        """ Answer every (start, end) pair, returning [(distance, path), ...] in query order. """
+        queries = list(queries)
+        results = [None] * len(queries)
+        for index, start, end, distance, path in self.imap(queries, chunksize):
+            results[index] = (distance, path)
+        return results
+
+    def close(self):
+        """ Stop the workers and free the shared memory block. """
+        if self._finalizer.alive:
+            # Let the workers finish what they hold, then release as the finalizer would.
+            self._pool.close()
+            self._pool.join()
+            self._finalizer()
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
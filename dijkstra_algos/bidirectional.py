@@ -0,0 +1,122 @@
+from dijkstra_algos.dijkstra import _is_adaptable
+
+
+class _SearchSide:
+    """
+    One half of a bidirectional search - the forward search from the source, or the backward
+    search from the target. Holds the same lazily-filled state dijkstra_source_to_dest uses.
+    """
+
+    def __init__(self, source, structure, pq_class):
+        self.structure = structure
+        self.distances = {source: 0}
+        self.predecessors = {source: None}
+        self.closed = {}
+        self.pq = pq_class()
+        self.is_pq_adaptable = _is_adaptable(self.pq)
+        self.pq_elements = {}
+        # Key of the last vertex settled - nothing left in this side's queue can be closer.
+        self.radius = 0
+        self._push(source, 0)
+
+    def _push(self, vertex, distance):
+        """ Add vertex to the queue, or lower its key if it is already there. """
+        if not self.is_pq_adaptable:
+            self.pq.add(distance, vertex)
+        elif vertex in self.pq_elements:
+            self.pq.update_key(self.pq_elements[vertex], distance)
+        else:
+            self.pq_elements[vertex] = self.pq.add(distance, vertex)
+
+    def settle_next(self):
+        """ Pop and close the next vertex, returning it, or None if the queue ran dry. """
+        while self.pq.length() > 0:
+            current = self.pq.remove_min()
+            if current in self.closed:
+                continue   # stale duplicate from a plain PriorityQueue
+            self.closed[current] = (self.distances[current], self.predecessors[current])
+            self.radius = self.distances[current]
+            return current
+        return None
+
+
+def bidirectional_dijkstra(start, end, graph, pq_class):
+    """
+    Computes the shortest path from start to end by running a forward search from start and a
+    backward search from end at the same time, and stopping once they provably can't improve on
+    the best path seen where they meet.
+
+    Args:
+
+        start -- The starting vertex for the shortest path calculation.
+        end -- The destination vertex where the shortest path terminates.
+        graph -- The Graph or DiGraph instance containing vertices and weighted edges.
+        pq_class -- any of our queues - APQUnsortedList, APQBinaryHeap, PriorityQueue
+
+    Returns:
+        A closed dictionary in the same shape as dijkstra_source_to_dest
+        - Vertex as the key.
+        - value is a pair consisting of path length from source and preceding vertex.
+        It holds every vertex the forward search settled, plus every vertex on the path from
+        the meeting point to end, so the path can be walked back from end via the predecessors.
+        end is missing if it can't be reached from start.
+
+    """
+    if start == end:
+        return {start: (0, None)}
+
+    # The backward search walks edges in reverse - a DiGraph keeps them by end vertex in _in,
+    # and in an undirected graph reverse is the same as forward.
+    forward = _SearchSide(start, graph._structure, pq_class)
+    backward = _SearchSide(end, getattr(graph, '_in', graph._structure), pq_class)
+
+    # mu is the length of the best start -> end path seen so far, through the vertex meet.
+    infinity = float('inf')
+    mu = infinity
+    meet = None
+
+    while forward.pq.length() > 0 and backward.pq.length() > 0:
+        # Stopping criterion - every unsettled vertex is at least radius away from its side's
+        # source, so no path through one can beat mu any more.
+        if forward.radius + backward.radius >= mu:
+            break
+
+        # Grow whichever side has the smaller frontier.
+        if forward.pq.length() <= backward.pq.length():
+            side, other = forward, backward
+        else:
+            side, other = backward, forward
+
+        current = side.settle_next()
+        if current is None:
+            break
+
+        current_distance = side.distances[current]
+        for neighbour, edge in side.structure[current].items():
+            if neighbour in side.closed:
+                continue
+            new_distance = current_distance + edge.element()
+            if new_distance < side.distances.get(neighbour, infinity):
+                side.distances[neighbour] = new_distance
+                side.predecessors[neighbour] = current
+                side._push(neighbour, new_distance)
+
+            # Has the other side reached this neighbour too? Then we have a complete path.
+            if neighbour in other.distances:
+                total = side.distances[neighbour] + other.distances[neighbour]
+                if total < mu:
+                    mu = total
+                    meet = neighbour
+
+    closed = forward.closed
+    if meet is None:
+        return closed
+
+    # Stitch the backward half on, so predecessors lead from end back through meet to start.
+    closed[meet] = (forward.distances[meet], forward.predecessors[meet])
+    current = meet
+    while current != end:
+        following = backward.predecessors[current]
+        closed[following] = (mu - backward.distances[following], current)
+        current = following
+    return closed
@@ -0,0 +1,335 @@
+"""
+Contraction Hierarchies for static, undirected graphs.
+
+Preprocessing contracts the vertices one at a time, least important first. Contracting v removes
+it from the remaining graph, and adds a shortcut u--w (weight w(u, v) + w(v, w)) for each pair of
+its neighbours whose only shortest path runs through v. A local "witness" Dijkstra from u that
+avoids v decides whether a shortcut is needed. Importance is the edge difference - shortcuts
+added minus edges removed - plus the number of neighbours already contracted, which spreads the
+contraction evenly across the graph.
+
+A query is then two small Dijkstra searches, one from each end, that only ever move to a vertex
+contracted later than the current one. Shortcuts on the resulting path are unpacked back into
+the original edges.
+"""
+
+import heapq
+from array import array
+
+from pq import APQBinaryHeap
+from dijkstra_algos.bidirectional import _SearchSide
+
+
+def _pair(u, w):
+    """ Key for an undirected vertex-id pair. """
+    return (u, w) if u < w else (w, u)
+
+
+class ContractionHierarchy:
+    """ A contracted, upward-only version of one undirected Graph. """
+
+    def __init__(self, graph, order, offsets, targets, weights, middle):
+        """ Wrap a built hierarchy - use ContractionHierarchy.build() instead.
+
+        Args:
+            graph -- the Graph the hierarchy was built from
+            order -- list of vertex ids in contraction order
+            offsets, targets, weights -- CSR arrays of each vertex's upward edges
+            middle -- dict from a shortcut's vertex-id pair to the vertex it bypasses
+        """
+        self._graph = graph
+        self._vertices = list(graph._structure)
+        self._ids = {v: i for i, v in enumerate(self._vertices)}
+        self._order = order
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        self._middle = middle
+
+    @classmethod
+    def build(cls, graph, settle_limit=60):
+        """ Contract every vertex of graph and return the hierarchy.
+
+        Args:
+            graph -- the undirected Graph to preprocess
+            settle_limit -- how many vertices a witness search may settle before giving up.
+                            Giving up early only costs extra shortcuts, never correctness.
+        """
+        if getattr(graph, 'is_directed', lambda: False)():
+            raise ValueError('ContractionHierarchy needs an undirected graph')
+        vertices = list(graph._structure)
+        ids = {v: i for i, v in enumerate(vertices)}
+        n = len(vertices)
+
+        # The remaining (not yet contracted) graph: adjacency[u][w] = lightest u--w weight
+        adjacency = [dict() for _ in range(n)]
+        for v in vertices:
+            i = ids[v]
+            for w, edge in graph._structure[v].items():
+                j = ids[w]
+                weight = edge.element()
+                if i != j and weight < adjacency[i].get(j, float('inf')):
+                    adjacency[i][j] = weight
+
+        middle = {}
+        contracted_neighbours = [0] * n
+        upward = [None] * n
+        order = []
+
+        # The shortcuts each vertex's priority was worked out with. They hold until a
+        # neighbour is contracted - the only thing that changes a vertex's adjacency -
+        # so only then is the vertex stale and its priority worked out again.
+        shortcuts_for = [None] * n
+        queue = []
+        for v in range(n):
+            priority, shortcuts_for[v] = cls._priority(v, adjacency, contracted_neighbours,
+                                                       settle_limit)
+            queue.append((priority, v))
+        heapq.heapify(queue)
+        stale = set()
+
+        while queue:
+            priority, v = heapq.heappop(queue)
+            if v in stale:
+                # Lazy update - re-check the new priority against the next best.
+                stale.discard(v)
+                priority, shortcuts_for[v] = cls._priority(v, adjacency, contracted_neighbours,
+                                                           settle_limit)
+                if queue and priority > queue[0][0]:
+                    heapq.heappush(queue, (priority, v))
+                    continue
+
+            shortcuts = shortcuts_for[v]
+            shortcuts_for[v] = None
+            # Everything still adjacent to v is contracted later, so these are v's upward edges.
+            upward[v] = list(adjacency[v].items())
+            for u in adjacency[v]:
+                del adjacency[u][v]
+                contracted_neighbours[u] += 1
+                stale.add(u)
+            adjacency[v] = {}
+            for u, w, weight in shortcuts:
+                if weight < adjacency[u].get(w, float('inf')):
+                    adjacency[u][w] = weight
+                    adjacency[w][u] = weight
+                    middle[_pair(u, w)] = v
+            order.append(v)
+
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for v in range(n):
+            for w, weight in upward[v]:
+                targets.append(w)
+                weights.append(weight)
+            offsets.append(len(targets))
+        return cls(graph, order, offsets, targets, weights, middle)
+
+    #--------------------------------------------------#
+    #Preprocessing helpers
+
+    @staticmethod
+    def _witness_distances(source, excluded, limit, targets, adjacency, settle_limit):
+        """ Bounded Dijkstra from source in the remaining graph, never passing through excluded.
+
+        Stops once every vertex in targets is settled, since their distances are then final.
+        """
+        distances = {source: 0}
+        queue = [(0, source)]
+        settled = 0
+        unsettled = len(targets)
+        while queue and settled < settle_limit:
+            distance, u = heapq.heappop(queue)
+            if distance > distances[u]:
+                continue
+            if distance > limit:
+                break
+            if u in targets:
+                unsettled -= 1
+                if not unsettled:
+                    break
+            settled += 1
+            for w, weight in adjacency[u].items():
+                if w == excluded:
+                    continue
+                new_distance = distance + weight
+                if new_distance < distances.get(w, float('inf')):
+                    distances[w] = new_distance
+                    heapq.heappush(queue, (new_distance, w))
+        return distances
+
+    @classmethod
+    def _shortcuts(cls, v, adjacency, settle_limit):
+        """ Return the (u, w, weight) shortcuts contracting v would need. """
+        neighbours = list(adjacency[v].items())
+        shortcuts = []
+        for index, (u, to_u) in enumerate(neighbours):
+            others = neighbours[index + 1:]
+            if not others:
+                continue
+            limit = to_u + max(weight for w, weight in others)
+            targets = {w for w, weight in others}
+            witness = cls._witness_distances(u, v, limit, targets, adjacency, settle_limit)
+            for w, to_w in others:
+                via_v = to_u + to_w
+                if witness.get(w, float('inf')) > via_v:
+                    shortcuts.append((u, w, via_v))
+        return shortcuts
+
+    @classmethod
+    def _priority(cls, v, adjacency, contracted_neighbours, settle_limit):
+        """ Return (priority, shortcuts) - the edge difference of contracting v plus its
+        already-contracted neighbours, and the shortcuts that contracting it would need. """
+        shortcuts = cls._shortcuts(v, adjacency, settle_limit)
+        return len(shortcuts) - len(adjacency[v]) + contracted_neighbours[v], shortcuts
+
+    #--------------------------------------------------#
+    #Queries
+
+    def num_shortcuts(self):
+        """ Return the number of shortcut edges the hierarchy added. """
+        return len(self._middle)
+
+    def _meet(self, s, t, pq_class):
+        """ Run both upward searches, returning (distance, meeting id, forward, backward). """
+        # The searches walk the CSR upward arrays, not a _structure map.
+        forward = _SearchSide(s, None, pq_class)
+        backward = _SearchSide(t, None, pq_class)
+        offsets, targets, weights = self._offsets, self._targets, self._weights
+        infinity = float('inf')
+        mu = 0 if s == t else infinity
+        meet = s if s == t else None
+
+        sides = [(forward, backward), (backward, forward)]
+        turn = 0
+        while True:
+            # A side is finished once its queue is empty or it can't beat mu any more.
+            live = [pair for pair in sides if pair[0].pq.length() > 0 and pair[0].radius < mu]
+            if not live:
+                break
+            side, other = live[turn % len(live)]
+            turn += 1
+
+            current = side.settle_next()
+            if current is None:
+                continue
+            current_distance = side.distances[current]
+            if current_distance >= mu:
+                continue
+
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[k]
+                new_distance = current_distance + weights[k]
+                if new_distance < side.distances.get(neighbour, infinity):
+                    side.distances[neighbour] = new_distance
+                    side.predecessors[neighbour] = current
+                    side._push(neighbour, new_distance)
+                if neighbour in other.distances:
+                    total = side.distances[neighbour] + other.distances[neighbour]
+                    if total < mu:
+                        mu, meet = total, neighbour
+        return mu, meet, forward, backward
+
+    def _upward_space(self, s, pq_class):
+        """ Run a complete upward search from vertex id s, returning {id: upward distance}. """
+        side = _SearchSide(s, None, pq_class)
+        offsets, targets, weights = self._offsets, self._targets, self._weights
+        infinity = float('inf')
+        while True:
+            current = side.settle_next()
+            if current is None:
+                break
+            current_distance = side.distances[current]
+            for k in range(offsets[current], offsets[current + 1]):
+                neighbour = targets[k]
+                new_distance = current_distance + weights[k]
+                if new_distance < side.distances.get(neighbour, infinity):
+                    side.distances[neighbour] = new_distance
+                    side.predecessors[neighbour] = current
+                    side._push(neighbour, new_distance)
+        return {v: distance for v, (distance, predecessor) in side.closed.items()}
+
+    def many_to_many(self, sources, targets, pq_class=APQBinaryHeap):
+        """
+        Return the distance from every source to every target as a list of array('d') rows,
+        row i holding the distances from sources[i], in the order of targets.
+
+        Uses the bucket method: one upward search per target drops (column, distance) into a
+        bucket at every vertex it reaches, then one upward search per source scans the buckets
+        of the vertices it reaches. Every pair meets at the top of its shortest path, so no
+        pair-by-pair searching is needed.
+        """
+        buckets = {}
+        for column, end in enumerate(targets):
+            for v, distance in self._upward_space(self._ids[end], pq_class).items():
+                buckets.setdefault(v, []).append((column, distance))
+
+        rows = []
+        for start in sources:
+            row = array('d', [float('inf')]) * len(targets)
+            for v, distance in self._upward_space(self._ids[start], pq_class).items():
+                for column, to_target in buckets.get(v, ()):
+                    if distance + to_target < row[column]:
+                        row[column] = distance + to_target
+            rows.append(row)
+        return rows
+
+    def _unpack(self, u, w, path):
+        """ Append the original vertices from u (exclusive) to w (inclusive) onto path. """
+        stack = [(u, w)]
+        while stack:
+            a, b = stack.pop()
+            m = self._middle.get(_pair(a, b))
+            if m is None:
+                path.append(b)
+            else:
+                stack.append((m, b))
+                stack.append((a, m))
+
+    def distance(self, start, end, pq_class=APQBinaryHeap):
+        """ Return the shortest distance from start to end, or infinity if unreachable. """
+        mu, meet, forward, backward = self._meet(self._ids[start], self._ids[end], pq_class)
+        return mu
+
+    def shortest_path(self, start, end, pq_class=APQBinaryHeap):
+        """ Return the list of Vertex objects on a shortest start -> end path, or None. """
+        s, t = self._ids[start], self._ids[end]
+        mu, meet, forward, backward = self._meet(s, t, pq_class)
+        if meet is None:
+            return None
+
+        # Hierarchy path: up from s to meet, then down from meet to t.
+        up = []
+        current = meet
+        while current is not None:
+            up.append(current)
+            current = forward.predecessors[current]
+        up.reverse()
+        current = backward.predecessors[meet]
+        while current is not None:
+            up.append(current)
+            current = backward.predecessors[current]
+
+        path = [up[0]]
+        for a, b in zip(up, up[1:]):
+            self._unpack(a, b, path)
+        return [self._vertices[i] for i in path]
+
+    def query(self, start, end, pq_class=APQBinaryHeap):
+        """
+        Answer a point-to-point query, returning a closed dictionary in the same shape as
+        dijkstra_source_to_dest for just the vertices on the shortest path (empty if end can't
+        be reached), so the path can be walked back from end via the predecessors.
+        """
+        path = self.shortest_path(start, end, pq_class)
+        closed = {}
+        if path is None:
+            return closed
+        distance = 0
+        predecessor = None
+        for v in path:
+            if predecessor is not None:
+                distance += self._graph._structure[predecessor][v].element()
+            closed[v] = (distance, predecessor)
+            predecessor = v
+        return closed
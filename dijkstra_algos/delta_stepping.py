@@ -0,0 +1,211 @@
+"""
+Delta-stepping single-source shortest paths (Meyer and Sanders), vectorised with NumPy.
+
+Dijkstra settles one vertex at a time, so a full run is one long chain of Python-level queue
+operations. Delta-stepping settles a whole bucket of vertices at once - every vertex whose
+tentative distance lies in [i * delta, (i + 1) * delta). Within a bucket only light edges
+(weight <= delta) can land back in the same bucket, so those are relaxed round after round until
+the bucket stops changing; heavy edges are relaxed once, when the bucket is done. Each round is
+a handful of NumPy calls over every edge leaving the round's frontier at once.
+
+delta trades the two extremes off: a tiny delta is Dijkstra with extra steps, a huge one is
+Bellman-Ford. Around the mean edge weight works well for the grid graphs.
+
+With processes > 0, rounds whose frontier has at least min_parallel edges are split across a
+Pool. The workers attach to the graph through shared memory the same way BatchExecutor's do,
+and read the distances from a second shared block, so a round only ships vertex ids out and
+the improved (vertex, distance, predecessor) triples back.
+"""
+
+import os
+from multiprocessing import Pool, shared_memory
+
+import numpy as np
+
+from graph import CSRGraph
+from dijkstra_algos.batch import _share_csr, _attach_csr
+
+
+def _gather(frontier, offsets, mask):
+    """ Return (slots, sources) for every edge leaving frontier that mask selects. """
+    starts = offsets[frontier]
+    counts = offsets[frontier + 1] - starts
+    total = int(counts.sum())
+    sources = np.repeat(frontier, counts)
+    # slot = start of the source's row + position within the row
+    slots = np.arange(total) + np.repeat(starts - (np.cumsum(counts) - counts), counts)
+    keep = mask[slots]
+    return slots[keep], sources[keep]
+
+
+def _best_per_target(targets, candidates, sources):
+    """ Keep only the smallest candidate for each target. """
+    order = np.lexsort((candidates, targets))
+    targets, candidates, sources = targets[order], candidates[order], sources[order]
+    first = np.ones(len(targets), dtype=bool)
+    first[1:] = targets[1:] != targets[:-1]
+    return targets[first], candidates[first], sources[first]
+
+
+def _relax(frontier, offsets, targets, weights, mask, distances):
+    """
+    Relax the mask-selected edges leaving frontier against distances, without writing.
+
+    Returns (targets, new distances, predecessors) for just the vertices that improve, one
+    entry each.
+    """
+    slots, sources = _gather(frontier, offsets, mask)
+    reached = targets[slots]
+    candidates = distances[sources] + weights[slots]
+    better = candidates < distances[reached]
+    return _best_per_target(reached[better], candidates[better], sources[better])
+
+
+# Set in each worker process by _attach_worker.
+_worker = None
+
+
+def _attach_worker(name, num_vertices, num_slots, distances_name, delta):
+    """ Pool initializer - map the shared graph and distances into this worker. """
+    global _worker
+    memory, csr = _attach_csr(name, num_vertices, num_slots)
+    distances_memory = shared_memory.SharedMemory(name=distances_name)
+    weights = np.frombuffer(csr._weights, dtype=np.float64)
+    _worker = {
+        'memory': (memory, distances_memory),
+        'offsets': np.frombuffer(csr._offsets, dtype=np.int64),
+        'targets': np.frombuffer(csr._targets, dtype=np.int64),
+        'weights': weights,
+        'light': weights <= delta,
+        'heavy': weights > delta,
+        'distances': np.ndarray(num_vertices, dtype=np.float64, buffer=distances_memory.buf),
+    }
+
+
+def _relax_in_worker(task):
+    """ Relax the light (or heavy) edges leaving one chunk of the frontier. """
+    frontier, light = task
+    w = _worker
+    mask = w['light'] if light else w['heavy']
+    return _relax(frontier, w['offsets'], w['targets'], w['weights'], mask, w['distances'])
+
+
+def delta_stepping(start, graph, delta=None, processes=0, min_parallel=65536):
+    """
+    Computes the shortest distance from start to every reachable vertex by delta-stepping.
+
+    Args:
+
+        start -- The starting vertex (a vertex id for a CSRGraph).
+        graph -- The Graph instance containing vertices and weighted edges, or a CSRGraph.
+        delta -- the bucket width; the mean edge weight if None. Must be positive.
+        processes -- worker processes to split large rounds over; 0 to do it all in this
+                     process, None for os.cpu_count()
+        min_parallel -- the fewest edges a round must relax to be worth sending to the workers
+
+    Returns:
+        A closed dictionary in the same shape as dijkstra_source_to_dest - where vertex is key,
+        and value is a pair (length, preceding vertex). The distances are floats.
+
+    """
+    if isinstance(graph, CSRGraph):
+        csr = graph
+        vertices = None
+    else:
+        csr = CSRGraph.from_graph(graph)
+        # from_graph numbers vertices in _structure order
+        vertices = list(graph._structure)
+        start = vertices.index(start)
+
+    n = csr.num_vertices()
+    offsets = np.frombuffer(csr._offsets, dtype=np.int64)
+    targets = np.frombuffer(csr._targets, dtype=np.int64)
+    weights = np.frombuffer(csr._weights, dtype=np.float64)
+    if delta is None:
+        delta = float(weights.mean()) if len(weights) else 1.0
+    if delta <= 0:
+        raise ValueError('delta must be positive, not ' + repr(delta))
+    light_mask = weights <= delta
+    heavy_mask = ~light_mask
+
+    pool = None
+    memories = ()
+    if processes != 0:
+        graph_memory, num_vertices, num_slots = _share_csr(csr)
+        distances_memory = shared_memory.SharedMemory(create=True, size=max(8 * n, 1))
+        memories = (graph_memory, distances_memory)
+        distances = np.ndarray(n, dtype=np.float64, buffer=distances_memory.buf)
+        pool = Pool(processes, initializer=_attach_worker,
+                    initargs=(graph_memory.name, num_vertices, num_slots,
+                              distances_memory.name, delta))
+        chunks = processes or os.cpu_count()
+    else:
+        distances = np.empty(n, dtype=np.float64)
+
+    def relax(frontier, light):
+        mask = light_mask if light else heavy_mask
+        if pool is not None and len(frontier) > 1:
+            edges = int((offsets[frontier + 1] - offsets[frontier]).sum())
+            if edges >= min_parallel:
+                parts = pool.map(_relax_in_worker,
+                                 [(part, light) for part in np.array_split(frontier, chunks)])
+                return _best_per_target(*(np.concatenate(column) for column in zip(*parts)))
+        return _relax(frontier, offsets, targets, weights, mask, distances)
+
+    try:
+        distances.fill(np.inf)
+        predecessors = np.full(n, -1, dtype=np.int64)
+        settled = np.zeros(n, dtype=bool)
+        distances[start] = 0.0
+        # Reached vertices that may not be settled yet - duplicates and settled ones are
+        # weeded out at the start of each bucket.
+        pending = np.array([start], dtype=np.int64)
+
+        while True:
+            pending = np.unique(pending[~settled[pending]])
+            if len(pending) == 0:
+                break
+            pending_distances = distances[pending]
+            upper = (np.floor(pending_distances.min() / delta) + 1) * delta
+            frontier = pending[pending_distances < upper]
+            emptied = []
+
+            # Light edges can land back in this bucket, so keep going until nothing does.
+            while len(frontier):
+                emptied.append(frontier)
+                settled[frontier] = True
+                reached, new_distances, sources = relax(frontier, True)
+                distances[reached] = new_distances
+                predecessors[reached] = sources
+                pending = np.concatenate((pending, reached))
+                frontier = reached[new_distances < upper]
+
+            # Heavy edges always land in a later bucket, so once is enough.
+            bucket = np.unique(np.concatenate(emptied))
+            reached, new_distances, sources = relax(bucket, False)
+            distances[reached] = new_distances
+            predecessors[reached] = sources
+            pending = np.concatenate((pending, reached))
+
+        reached = np.flatnonzero(settled)
+        reached_distances = distances[reached].tolist()
+        reached_predecessors = predecessors[reached].tolist()
+    finally:
+        if pool is not None:
+            pool.close()
+            pool.join()
+            del distances
+            for memory in memories:
+                memory.close()
+                memory.unlink()
+
+    closed = {}
+    if vertices is None:
+        for v, distance, predecessor in zip(reached.tolist(), reached_distances,
+                                            reached_predecessors):
+            closed[v] = (distance, predecessor if predecessor >= 0 else None)
+    else:
+        for v, distance, predecessor in zip(reached.tolist(), reached_distances,
+                                            reached_predecessors):
+            closed[vertices[v]] = (distance, vertices[predecessor] if predecessor >= 0 else None)
+    return closed
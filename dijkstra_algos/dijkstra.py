@@ -1,6 +1,7 @@
 from pq import APQUnsortedList
+from graph import CSRGraph
 
-def dijkstra_source_to_dest(start, end, graph, pq_class, break_if_end_found=False):
+def dijkstra_source_to_dest(start, end, graph, pq_class, break_if_end_found=False, profile=None):
     """
     Computes the shortest path from a given source vertex to a specified destination vertex
     using Dijkstra's algorithm with an Adaptable Priority Queue.
@@ -9,9 +10,13 @@ def dijkstra_source_to_dest(start, end, graph, pq_class, break_if_end_found=Fals
 
         start -- The starting vertex for the shortest path calculation.
         end -- The destination vertex where the shortest path terminates.
-        graph -- The Graph instance containing vertices and weighted edges.
-        apq_class -- supporting APQ and standard PQ - APQUnsortedList, APQBinaryHeap, PriorityQueue
+        graph -- The Graph instance containing vertices and weighted edges. A frozen CSRGraph
+                 is also accepted, in which case start/end and the closed keys are int vertex ids.
+        apq_class -- supporting APQ and standard PQ - APQUnsortedList, APQBinaryHeap, PriorityQueue,
+                     PQLazyHeap (heapq with lazy deletion - the fastest of the non-adaptable ones)
         break_if_end_found -- boolean controlling if the algo breaks out when finding target immediately or not.
+        profile -- a WeightProfile (see graph.weight_profiles) over this graph, whose weights
+                   are used instead of the ones stored in the graph. None for the graph's own.
 
 
     Returns:
@@ -21,14 +26,23 @@ def dijkstra_source_to_dest(start, end, graph, pq_class, break_if_end_found=Fals
 
     """
 
-    # This dictionary stores the shortest known distance from the start vertex to each vertex, initialized to infinity.
-    distances = {v: float('inf') for v in graph._structure}
-    distances[start] = 0 # and overwriting infinity 'cos its zero weight to ourself.
+    # A profile swaps the weights for its own array, looked up by edge id.
+    profile_weights = edge_index = None
+    if profile is not None:
+        profile_weights, edge_index = profile.weights_for(graph)
+
+    # Frozen graphs get their own tight loop over the flat CSR arrays.
+    if isinstance(graph, CSRGraph):
+        return _dijkstra_csr(start, end, graph, pq_class, break_if_end_found,
+                             profile_weights, edge_index)
 
-    # This dictionary tracks the previous vertex for each vertex, allowing for path reconstruction.
-    # with grid graph, each vertex has 2 neighbours, but only 1 vertex pointing to it. We don't know for each
-    #   what this is yet - so setting everyone to None.
-    predecessors = {v: None for v in graph._structure}
+    # These dictionaries are filled lazily - a vertex only gets an entry once it is first reached.
+    # Building them over every vertex in graph._structure up front made an early-break query pay
+    # O(V) setup even when it only settled a handful of vertices near the source.
+    # A vertex missing from distances is at infinity, and from predecessors has no predecessor yet.
+    infinity = float('inf')
+    distances = {start: 0}   # zero weight to ourself.
+    predecessors = {start: None}
 
     # This comes in handy as our 2 APQ implemenations use the same apis, so we can save a bit of code here.
     # the caller of this function will specify which to use.
@@ -39,7 +53,7 @@ def dijkstra_source_to_dest(start, end, graph, pq_class, break_if_end_found=Fals
     # Hence the flow of the below needs to cater for this.
 
     # We begin by creating a flag to control the flow - PQ vs APQ
-    is_pq_adaptable = pq.__class__.__name__ != "PriorityQueue"
+    is_pq_adaptable = _is_adaptable(pq)
 
     # I needed this dict to track so I could use the APQ update_key later
     # without it, I would be limited to just adding - and duplicating entries :-(
@@ -73,14 +87,17 @@ def dijkstra_source_to_dest(start, end, graph, pq_class, break_if_end_found=Fals
 
         # Look for neighbours for this current vertex - which will be east and south as we are a grid-graph
         # i.e. this loops twice - except for boundary vertexs
-        for neighbour in graph._structure[current]:
+        current_distance = distances[current]
+        for neighbour, edge in graph._structure[current].items():
 
-            # Get the edge reference to get the distance
-            edge = graph._structure[current][neighbour]
-            new_distance = distances[current] + edge.element()
+            # The edge holds the distance - unless a profile does
+            if profile_weights is None:
+                new_distance = current_distance + edge.element()
+            else:
+                new_distance = current_distance + profile_weights[edge_index[edge]]
 
-            # Have I seen before? If so is this shorter? These will be infinity set earlier for first time observation.
-            if new_distance < distances[neighbour]:
+            # Have I seen before? If so is this shorter? Unseen vertices count as infinity.
+            if new_distance < distances.get(neighbour, infinity):
                 distances[neighbour] = new_distance
                 predecessors[neighbour] = current
 
@@ -101,3 +118,147 @@ def dijkstra_source_to_dest(start, end, graph, pq_class, break_if_end_found=Fals
     return closed
 
 
+
+
+def astar_source_to_dest(start, end, graph, pq_class, heuristic):
+    """
+    Computes the shortest path from start to end using A* - Dijkstra with the queue ordered by
+    distance so far plus a heuristic estimate of the distance still to go, so the search is pulled
+    towards end instead of growing evenly in every direction.
+
+    Args:
+
+        start -- The starting vertex for the shortest path calculation.
+        end -- The destination vertex where the shortest path terminates.
+        graph -- The Graph instance containing vertices and weighted edges.
+        pq_class -- supporting APQ and standard PQ - APQUnsortedList, APQBinaryHeap, PriorityQueue
+        heuristic -- function heuristic(vertex, end) returning a lower bound on the distance from
+                     vertex to end. It must be consistent (h(v) <= weight(v, w) + h(w)), which all
+                     of the ones in dijkstra_algos.heuristics are. A zero heuristic gives Dijkstra.
+
+    Returns:
+        A closed dictionary in the same shape as dijkstra_source_to_dest, holding only the
+        vertices A* settled - the search always stops once end is reached.
+
+    """
+    infinity = float('inf')
+    distances = {start: 0}
+    predecessors = {start: None}
+    # The heuristic is only worked out once per vertex, the first time it is reached.
+    estimates = {start: heuristic(start, end)}
+
+    pq = pq_class()
+    is_pq_adaptable = _is_adaptable(pq)
+    pq_elements = {}
+    if is_pq_adaptable:
+        pq_elements[start] = pq.add(estimates[start], start)
+    else:
+        pq.add(estimates[start], start)
+
+    closed = {}
+
+    while pq.length() > 0:
+        current = pq.remove_min()
+        if current in closed:
+            continue
+        closed[current] = (distances[current], predecessors[current])
+        if current == end:
+            break
+
+        current_distance = distances[current]
+        for neighbour, edge in graph._structure[current].items():
+            # With a consistent heuristic a closed vertex is already final.
+            if neighbour in closed:
+                continue
+            new_distance = current_distance + edge.element()
+            if new_distance < distances.get(neighbour, infinity):
+                distances[neighbour] = new_distance
+                predecessors[neighbour] = current
+                if neighbour not in estimates:
+                    estimates[neighbour] = heuristic(neighbour, end)
+                priority = new_distance + estimates[neighbour]
+                if is_pq_adaptable:
+                    if neighbour in pq_elements:
+                        pq.update_key(pq_elements[neighbour], priority)
+                    else:
+                        pq_elements[neighbour] = pq.add(priority, neighbour)
+                else:
+                    pq.add(priority, neighbour)
+    return closed
+
+
+def _is_adaptable(pq):
+    """ Return True if pq is one of our APQs, i.e. it supports update_key. """
+    # Checking for the method rather than the class name, so any non-adaptable queue
+    # (PriorityQueue, PQLazyHeap) takes the add-duplicates path.
+    return hasattr(pq, 'update_key')
+
+
+def _dijkstra_csr(start, end, graph, pq_class, break_if_end_found, profile_weights=None,
+                  edge_ids=None):
+    """
+    Same algorithm as dijkstra_source_to_dest, but over a CSRGraph.
+
+    The per-vertex state lives in flat lists indexed by vertex id, and a vertex's neighbours and
+    weights are walked as two parallel slices instead of two dict lookups plus an edge.element()
+    call per edge. With profile_weights (indexed by edge id) the weight of slot k is
+    profile_weights[edge_ids[k]].
+    """
+    offsets = graph._offsets
+    targets = graph._targets
+    weights = graph._weights if profile_weights is None else profile_weights
+    n = graph.num_vertices()
+
+    # Lists, not arrays - reading a list hands back the float it already holds, where reading
+    # an array('d') boxes a new one every time.
+    distances = [float('inf')] * n
+    distances[start] = 0.0
+    predecessors = [None] * n
+    settled = bytearray(n)
+
+    pq = pq_class()
+    # The queue's methods are looked up once here rather than on every vertex and relaxation.
+    add = pq.add
+    remove_min = pq.remove_min
+    length = pq.length
+    is_pq_adaptable = _is_adaptable(pq)
+    update_key = pq.update_key if is_pq_adaptable else None
+    pq_elements = [None] * n if is_pq_adaptable else None
+    if is_pq_adaptable:
+        pq_elements[start] = add(0, start)
+    else:
+        add(0, start)
+
+    closed = {}
+
+    while length() > 0:
+        current = remove_min()
+        if settled[current]:
+            continue
+        settled[current] = 1
+
+        current_distance = distances[current]
+        closed[current] = (current_distance, predecessors[current])
+
+        if break_if_end_found and current == end:
+            break
+
+        lo = offsets[current]
+        hi = offsets[current + 1]
+        if edge_ids is None:
+            slot_weights = weights[lo:hi]
+        else:
+            slot_weights = [weights[edge_id] for edge_id in edge_ids[lo:hi]]
+        for neighbour, weight in zip(targets[lo:hi], slot_weights):
+            new_distance = current_distance + weight
+            if new_distance < distances[neighbour]:
+                distances[neighbour] = new_distance
+                predecessors[neighbour] = current
+                if is_pq_adaptable:
+                    if pq_elements[neighbour] is not None:
+                        update_key(pq_elements[neighbour], new_distance)
+                    else:
+                        pq_elements[neighbour] = add(new_distance, neighbour)
+                else:
+                    add(new_distance, neighbour)
+    return closed
@@ -0,0 +1,62 @@
+"""
+Heuristics for astar_source_to_dest.
+
+Each heuristic is a function heuristic(vertex, end) returning a lower bound on the shortest
+distance from vertex to end. All of these are consistent, so A* never has to reopen a vertex.
+"""
+
+import math
+
+
+def zero_heuristic(vertex, end):
+    """ No estimate at all - A* with this behaves exactly like Dijkstra. """
+    return 0
+
+
+def min_edge_weight(graph):
+    """ Return the smallest edge weight in graph, or 0 for a graph with no edges. """
+    weights = [edge.element() for edge in graph.edges()]
+    return min(weights) if weights else 0
+
+
+def grid_manhattan_heuristic(graph):
+    """
+    Build a heuristic for the (i, j)-labelled grids from grid_graph.py.
+
+    Every step on the grid moves one row or one column and costs at least the lightest edge,
+    so Manhattan distance times the minimum edge weight never overestimates.
+
+    Args:
+        graph -- the grid Graph the heuristic will be used on
+    """
+    min_weight = min_edge_weight(graph)
+
+    def heuristic(vertex, end):
+        i, j = vertex.element()
+        end_i, end_j = end.element()
+        return min_weight * (abs(i - end_i) + abs(j - end_j))
+
+    return heuristic
+
+
+def coordinate_heuristic(position, cost_per_unit=1, norm='euclidean'):
+    """
+    Hook for graphs whose vertices have coordinates, e.g. road networks.
+
+    Args:
+        position -- function position(vertex) returning an (x, y) pair
+        cost_per_unit -- the lowest cost of travelling one unit of distance, e.g. the minimum
+                         of weight / straight-line length over all edges
+        norm -- 'euclidean' for straight-line distance, 'manhattan' for grid-like movement
+    """
+    if norm not in ('euclidean', 'manhattan'):
+        raise ValueError("norm must be 'euclidean' or 'manhattan', not " + repr(norm))
+
+    def heuristic(vertex, end):
+        x, y = position(vertex)
+        end_x, end_y = position(end)
+        if norm == 'euclidean':
+            return cost_per_unit * math.hypot(x - end_x, y - end_y)
+        return cost_per_unit * (abs(x - end_x) + abs(y - end_y))
+
+    return heuristic
@@ -0,0 +1,66 @@
+"""
+Distance-bounded searches - service areas and isochrones.
+
+A service-area query only needs the small ball of vertices within some distance of the source,
+but dijkstra_source_to_dest has no notion of a bound, so it has to search the whole graph and
+have the result filtered afterwards. These stop as soon as the next vertex to settle is beyond
+the bound, so the cost follows the size of the ball rather than the graph.
+"""
+
+from dijkstra_algos.search import DijkstraSearch
+
+
+def dijkstra_within(start, graph, pq_class, max_distance):
+    """
+    Find every vertex within max_distance of start.
+
+    Args:
+
+        start -- The starting vertex (a vertex id for a CSRGraph).
+        graph -- The Graph instance containing vertices and weighted edges, or a CSRGraph.
+        pq_class -- any of our queues - APQUnsortedList, APQBinaryHeap, PriorityQueue, ...
+        max_distance -- the bound; vertices exactly max_distance away are included.
+
+    Returns:
+        A closed dictionary in the same shape as dijkstra_source_to_dest, holding only the
+        vertices within max_distance.
+
+    """
+    closed = {}
+    for vertex, distance, predecessor in DijkstraSearch(start, graph, pq_class, keep_closed=False):
+        # Vertices settle in distance order, so the first one past the bound ends the search.
+        if distance > max_distance:
+            break
+        closed[vertex] = (distance, predecessor)
+    return closed
+
+
+def isochrones(start, graph, pq_class, cutoffs):
+    """
+    Split the vertices around start into rings by distance, with a single bounded search.
+
+    Args:
+
+        start -- The starting vertex (a vertex id for a CSRGraph).
+        graph -- The Graph instance containing vertices and weighted edges, or a CSRGraph.
+        pq_class -- any of our queues - APQUnsortedList, APQBinaryHeap, PriorityQueue, ...
+        cutoffs -- the ring boundaries, e.g. [5, 10, 20]; they need not be sorted.
+
+    Returns:
+        A dictionary from each cutoff to a dictionary {vertex: distance} of the vertices further
+        than the next smaller cutoff but no further than this one. The union of the rings up to
+        a cutoff is what dijkstra_within gives for that cutoff.
+
+    """
+    bounds = sorted(set(cutoffs))
+    rings = {cutoff: {} for cutoff in bounds}
+    if not bounds:
+        return rings
+    ring = 0
+    for vertex, distance, predecessor in DijkstraSearch(start, graph, pq_class, keep_closed=False):
+        while ring < len(bounds) and distance > bounds[ring]:
+            ring += 1
+        if ring == len(bounds):
+            break
+        rings[bounds[ring]][vertex] = distance
+    return rings
@@ -0,0 +1,75 @@
+"""
+One-to-many and many-to-many shortest distances.
+
+Calling dijkstra_source_to_dest once per (source, target) pair repeats nearly all the work:
+every target from the same source shares one shortest-path tree. distance_matrix runs one
+search per source and stops it as soon as the last of the targets is settled - or, with fewer
+targets than sources, one backward search per target. For large
+source and target sets the 'buckets' method goes through a ContractionHierarchy instead,
+with one small upward search per source and per target.
+"""
+
+from array import array
+
+from graph import CSRGraph
+from dijkstra_algos.search import DijkstraSearch
+from dijkstra_algos.contraction import ContractionHierarchy
+
+
+def distance_matrix(sources, targets, graph, pq_class, method='search', hierarchy=None):
+    """
+    Computes the shortest distance from every source to every target.
+
+    Args:
+
+        sources -- list of source vertices (vertex ids for a CSRGraph)
+        targets -- list of target vertices
+        graph -- The Graph instance containing vertices and weighted edges, or a CSRGraph
+                 for the 'search' method
+        pq_class -- any of our queues - APQUnsortedList, APQBinaryHeap, PriorityQueue, ...
+        method -- 'search' for one early-stopping Dijkstra per source, or 'buckets' for the
+                  Contraction Hierarchies bucket method, which pays off for large sets
+        hierarchy -- a ContractionHierarchy of graph to reuse with 'buckets'; one is built if
+                     not given
+
+    Returns:
+        A list of array('d') rows - matrix[i][j] is the distance from sources[i] to
+        targets[j], infinity if unreachable.
+
+    """
+    if method == 'buckets':
+        if hierarchy is None:
+            hierarchy = ContractionHierarchy.build(graph)
+        return hierarchy.many_to_many(sources, targets, pq_class)
+    if method != 'search':
+        raise ValueError("method must be 'search' or 'buckets', not " + repr(method))
+
+    if len(targets) < len(sources) and not (isinstance(graph, CSRGraph) and graph.is_directed()):
+        # Many-to-few: search backwards from each target instead, one column at a time, over
+        # the reverse edges (a DiGraph's _in, or the same edges in an undirected graph).
+        columns = _search_rows(targets, sources, graph, pq_class, reverse=True)
+        return [array('d', [column[i] for column in columns]) for i in range(len(sources))]
+    return _search_rows(sources, targets, graph, pq_class)
+
+
+def _search_rows(sources, targets, graph, pq_class, reverse=False):
+    """ One early-stopping search per source; return a row of target distances for each. """
+    # The same target can be asked for more than once, so map each to all its columns.
+    columns = {}
+    for column, end in enumerate(targets):
+        columns.setdefault(end, []).append(column)
+
+    rows = []
+    for start in sources:
+        row = array('d', [float('inf')]) * len(targets)
+        remaining = dict(columns)
+        if remaining:
+            for vertex, distance, predecessor in DijkstraSearch(start, graph, pq_class,
+                                                                keep_closed=False,
+                                                                reverse=reverse):
+                for column in remaining.pop(vertex, ()):
+                    row[column] = distance
+                if not remaining:
+                    break    # every target settled - no need to search any further
+        rows.append(row)
+    return rows
@@ -0,0 +1,164 @@
+"""
+A Dijkstra search that can be paused and picked up again.
+
+dijkstra_source_to_dest throws its queue away when it returns, so asking for increasingly
+distant targets from one source (like target_vertices in run_question4.py) redoes the whole
+search each time. DijkstraSearch holds the queue, the pq_elements handles and the closed
+dictionary between calls, so settle_until(target) only does the work beyond where the last
+call stopped. A whole sweep of targets then costs one single-source run in total.
+
+Iterating over a search (or calling dijkstra_iter) yields (vertex, distance, predecessor) as
+each vertex is settled, in distance order, so a consumer can stop as soon as it has what it
+needs - the k nearest facilities, the first vertex matching some test, or just progress
+reports on a huge graph. With keep_closed=False nothing is kept for a settled vertex but
+its membership of a set, so the closed dictionary is never built.
+"""
+
+from graph import CSRGraph
+from dijkstra_algos.dijkstra import _is_adaptable
+
+
+class DijkstraSearch:
+    """ Resumable single-source Dijkstra over a Graph or CSRGraph. """
+
+    def __init__(self, start, graph, pq_class, keep_closed=True, reverse=False):
+        """ Set up a search from start - nothing is settled until asked for.
+
+        Args:
+            start -- the source vertex (a vertex id for a CSRGraph)
+            graph -- The Graph instance containing vertices and weighted edges, or a CSRGraph
+            pq_class -- any of our queues - APQUnsortedList, APQBinaryHeap, PriorityQueue, ...
+            keep_closed -- if False, only remember which vertices are settled, not their
+                           distances and predecessors; for streaming with iteration only
+            reverse -- if True, walk edges backwards, so the distances are to start rather
+                       than from it. Only changes anything on a DiGraph.
+        """
+        self._start = start
+        self._graph = graph
+        self._is_csr = isinstance(graph, CSRGraph)
+        if not self._is_csr:
+            self._structure = graph._structure
+            if reverse:
+                self._structure = getattr(graph, '_in', graph._structure)
+        elif reverse and graph.is_directed():
+            raise ValueError('a directed CSRGraph has no reverse adjacency - search the DiGraph')
+        # Tentative state, only for vertices reached but not yet settled.
+        self._distances = {start: 0}
+        self._predecessors = {start: None}
+        self._pq = pq_class()
+        self._is_pq_adaptable = _is_adaptable(self._pq)
+        self._pq_elements = {}
+        self._push(start, 0)
+        # Closed dictionary, same shape as dijkstra_source_to_dest returns - or, when not
+        # keeping it, a plain set of the settled vertices.
+        self._closed = {} if keep_closed else None
+        self._settled = self._closed if keep_closed else set()
+
+    def _push(self, vertex, distance):
+        """ Queue vertex, or lower its key if it is already queued. """
+        if not self._is_pq_adaptable:
+            self._pq.add(distance, vertex)
+        elif vertex in self._pq_elements:
+            self._pq.update_key(self._pq_elements[vertex], distance)
+        else:
+            self._pq_elements[vertex] = self._pq.add(distance, vertex)
+
+    def _neighbours(self, vertex):
+        """ Return (neighbour, weight) pairs for vertex. """
+        if self._is_csr:
+            return self._graph.neighbours(vertex)
+        return [(w, edge.element()) for w, edge in self._structure[vertex].items()]
+
+    def settle_next(self):
+        """
+        Settle one more vertex and relax its edges.
+
+        Returns (vertex, distance, predecessor) for the vertex settled, or None once every
+        reachable vertex is settled.
+        """
+        settled = self._settled
+        while self._pq.length() > 0:
+            current = self._pq.remove_min()
+            if current in settled:
+                continue   # stale duplicate from a non-adaptable queue
+            distance = self._distances.pop(current)
+            predecessor = self._predecessors.pop(current)
+            self._pq_elements.pop(current, None)
+            if self._closed is not None:
+                self._closed[current] = (distance, predecessor)
+            else:
+                settled.add(current)
+
+            infinity = float('inf')
+            for neighbour, weight in self._neighbours(current):
+                if neighbour in settled:
+                    continue
+                new_distance = distance + weight
+                if new_distance < self._distances.get(neighbour, infinity):
+                    self._distances[neighbour] = new_distance
+                    self._predecessors[neighbour] = current
+                    self._push(neighbour, new_distance)
+            return current, distance, predecessor
+        return None
+
+    def __iter__(self):
+        """ Yield (vertex, distance, predecessor) for each further vertex, as it is settled. """
+        while True:
+            settled = self.settle_next()
+            if settled is None:
+                return
+            yield settled
+
+    def _require_closed(self):
+        if self._closed is None:
+            raise ValueError('this DijkstraSearch was made with keep_closed=False')
+
+    def settle_until(self, target):
+        """
+        Carry the search on until target is settled (or nothing is left to settle), and return
+        the closed dictionary so far. If target was settled by an earlier call this is free.
+        """
+        self._require_closed()
+        while target not in self._closed:
+            if self.settle_next() is None:
+                break
+        return self._closed
+
+    def run(self):
+        """ Settle every reachable vertex and return the closed dictionary. """
+        self._require_closed()
+        while self.settle_next() is not None:
+            pass
+        return self._closed
+
+    def is_settled(self, vertex):
+        """ Return True if vertex's shortest distance is already known. """
+        return vertex in self._settled
+
+    def distance(self, vertex):
+        """ Return the shortest distance to vertex, settling as far as needed, or infinity. """
+        closed = self.settle_until(vertex)
+        return closed[vertex][0] if vertex in closed else float('inf')
+
+    def closed(self):
+        """ Return the closed dictionary of everything settled so far. """
+        self._require_closed()
+        return self._closed
+
+    def frontier_size(self):
+        """ Return how many entries are waiting in the queue. """
+        return self._pq.length()
+
+
+def dijkstra_iter(start, graph, pq_class):
+    """
+    Yield (vertex, distance, predecessor) for every vertex reachable from start, in order of
+    distance, as Dijkstra settles them. Stop consuming whenever you like - no more of the
+    graph is searched than was asked for, and no closed dictionary is built.
+
+    Args:
+        start -- the source vertex (a vertex id for a CSRGraph)
+        graph -- The Graph instance containing vertices and weighted edges, or a CSRGraph
+        pq_class -- any of our queues - APQUnsortedList, APQBinaryHeap, PriorityQueue, ...
+    """
+    return iter(DijkstraSearch(start, graph, pq_class, keep_closed=False))
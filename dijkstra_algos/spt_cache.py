@@ -0,0 +1,115 @@
+"""
+Shortest-path-tree cache.
+
+The benchmarks (run_question4.py, run_question6.py) run dijkstra_source_to_dest again and again
+from the same source on a graph that never changes, recomputing the identical full tree each
+time. SPTCache keeps the full closed dictionary per (graph, source), least recently used first
+out, so a repeat query is a dictionary lookup. Trees built with a different queue class or weight
+profile are cached separately.
+
+Entries remember graph.version() when they were built. Graph bumps that counter in add_edge,
+remove_edge and remove_vertex, so a tree for a graph that has since changed is never handed
+back - it is recomputed on the next request instead. Changing a weight profile's array in place is
+not tracked; call invalidate() after doing so.
+"""
+
+import weakref
+from collections import OrderedDict
+
+from pq import APQBinaryHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+
+def _graph_version(graph):
+    """ Return graph's mutation counter - frozen graphs never change, so they are always 0. """
+    version = getattr(graph, 'version', None)
+    return version() if version is not None else 0
+
+
+class SPTCache:
+    """ An LRU cache of full shortest-path trees, keyed by graph, source, queue class and profile. """
+
+    def __init__(self, pq_class=APQBinaryHeap, max_entries=16, max_vertices=None):
+        """ Create an empty cache.
+
+        Args:
+            pq_class -- the queue used to build trees on a miss, unless a call names another
+            max_entries -- the most trees kept at once
+            max_vertices -- optional budget on the total closed entries held over all trees,
+                            a stand-in for memory (each costs a dict slot and a tuple)
+        """
+        self._pq_class = pq_class
+        self._max_entries = max_entries
+        self._max_vertices = max_vertices
+        # (id(graph), source, pq_class, id(profile)) -> (weakref to graph, version,
+        #                                               weakref to profile or None, closed)
+        self._trees = OrderedDict()
+        self._vertices_held = 0
+        self.hits = 0
+        self.misses = 0
+
+    def __len__(self):
+        return len(self._trees)
+
+    def _discard(self, key):
+        graph_ref, version, profile_ref, closed = self._trees.pop(key)
+        self._vertices_held -= len(closed)
+
+    def tree(self, graph, source, pq_class=None, profile=None):
+        """ Return the full closed dictionary for source, building it on a miss.
+
+        The dictionary is shared with the cache, so callers must not modify it.
+
+        Args:
+            graph -- the graph to search
+            source -- the start vertex
+            pq_class -- the queue to build the tree with; the cache's own if None
+            profile -- a WeightProfile to search with, as for dijkstra_source_to_dest
+        """
+        if pq_class is None:
+            pq_class = self._pq_class
+        key = (id(graph), source, pq_class, id(profile) if profile is not None else None)
+        entry = self._trees.get(key)
+        if entry is not None:
+            graph_ref, version, profile_ref, closed = entry
+            if (graph_ref() is graph and version == _graph_version(graph)
+                    and (profile_ref is None or profile_ref() is profile)):
+                self._trees.move_to_end(key)
+                self.hits += 1
+                return closed
+            # graph changed (or a different graph or profile reused the id)
+            self._discard(key)
+
+        self.misses += 1
+        closed = dijkstra_source_to_dest(source, None, graph, pq_class, profile=profile)
+        profile_ref = weakref.ref(profile) if profile is not None else None
+        self._trees[key] = (weakref.ref(graph), _graph_version(graph), profile_ref, closed)
+        self._vertices_held += len(closed)
+        self._evict()
+        return closed
+
+    def _evict(self):
+        """ Drop least recently used trees until the cache is back within budget. """
+        while len(self._trees) > self._max_entries or (
+                self._max_vertices is not None
+                and self._vertices_held > self._max_vertices
+                and len(self._trees) > 1):
+            self._discard(next(iter(self._trees)))
+
+    def dijkstra_source_to_dest(self, start, end, graph, pq_class=None, break_if_end_found=False,
+                                profile=None):
+        """
+        Drop-in for dijkstra_source_to_dest, answered from the cached tree for start.
+
+        pq_class and profile are passed through and are part of the cache key; a pq_class of None
+        uses the cache's own. The full tree is always returned, so with break_if_end_found it holds
+        more than the early-break run would - but every entry an early-break run returns is in it,
+        with the same distance.
+        """
+        return self.tree(graph, start, pq_class, profile)
+
+    def invalidate(self, graph=None):
+        """ Forget the trees for graph, or every tree if graph is None. """
+        for key in list(self._trees):
+            if graph is None or key[0] == id(graph):
+                self._discard(key)
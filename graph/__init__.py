@@ -1,2 +1,7 @@
 # Just want to export our below graph implementation to use and hide all others
 from .graph import *
+from .csr_graph import CSRGraph
+from .implicit_grid import ImplicitGridGraph
+from .binary_io import save_graph, load_graph
+from .reader import read_graph
+from .weight_profiles import WeightProfiles, WeightProfile
@@ -0,0 +1,203 @@
+""" A binary file format for graphs, loaded with mmap.
+
+    Reading a text graph file rebuilds every Vertex and Edge on every run.
+    save_graph writes the CSR arrays of a graph to disk once; load_graph
+    maps the file into memory and hands back a CSRGraph whose arrays are
+    views straight onto the mapped pages. The arrays are neither parsed nor
+    copied, so loading costs the same for a million edges as for ten, and
+    every process loading the same file shares one copy in the page cache.
+    Only labels that are not plain ints or (i, j) pairs are parsed, from
+    JSON - never unpickled, so loading a file from elsewhere cannot run code.
+
+    File layout, every section starting on an 8 byte boundary:
+
+        header   -- 64 bytes, see _HEADER
+        labels   -- depends on the label kind, see _LABELS_*
+        offsets  -- n + 1 int64
+        targets  -- num_slots int64 (each undirected edge is two slots,
+                    each one-way edge of a directed graph one)
+        weights  -- num_slots float64
+
+    The arrays are stored in the byte order of the machine that saved them,
+    and load_graph refuses a file from the other byte order.
+"""
+
+import json
+import mmap
+import struct
+import sys
+from array import array
+
+from .csr_graph import CSRGraph
+
+GRAPH_FILE_MAGIC = b'CSRG'
+# 2 added the directed field and swapped pickled labels for JSON. Version 1 files are
+# refused: one saved from a directed graph before the field existed would read as undirected.
+GRAPH_FILE_VERSION = 2
+
+# magic, version, byte order (0 little, 1 big), label kind, n, num_slots, labels bytes,
+# directed (0 or 1)
+_HEADER = struct.Struct('<4sIII QQQ I')
+_HEADER_SIZE = 64
+
+# How the labels section is stored.
+_LABELS_IDS = 0      # no section - every label is its own vertex id
+_LABELS_INTS = 1     # n int64
+_LABELS_PAIRS = 2    # 2n int64, for (i, j) grid labels
+_LABELS_JSON = 3     # a JSON list, for anything else
+
+
+class _PairLabels:
+    """ A read-only sequence of (i, j) labels over a flat array of 2n ints. """
+
+    def __init__(self, flat):
+        self._flat = flat
+
+    def __len__(self):
+        return len(self._flat) // 2
+
+    def __getitem__(self, v):
+        return (self._flat[2 * v], self._flat[2 * v + 1])
+
+
+def labels_to_json(labels):
+    """ Return labels as UTF-8 JSON bytes.
+
+    Labels may be str, int, float, bool, None, or tuples of these; a tuple
+    is written as a JSON list and read back as a tuple by labels_from_json.
+    Anything else raises ValueError.
+    """
+    def check(label):
+        if isinstance(label, tuple):
+            for item in label:
+                check(item)
+        elif label is not None and not isinstance(label, (str, int, float, bool)):
+            raise ValueError('cannot store label ' + repr(label) + ' of type '
+                             + type(label).__name__ + ' in a graph file')
+    for label in labels:
+        check(label)
+    return json.dumps(list(labels)).encode('utf-8')
+
+
+def labels_from_json(data):
+    """ Return the list of labels in JSON bytes written by labels_to_json. """
+    # A label is hashable, so it was never a list - any list here was a tuple.
+    def tuples(item):
+        return tuple(tuples(x) for x in item) if isinstance(item, list) else item
+    labels = json.loads(bytes(data).decode('utf-8'))
+    if not isinstance(labels, list):
+        raise ValueError('labels section is not a JSON list')
+    return [tuples(label) for label in labels]
+
+
+def _is_int(x):
+    return type(x) is int and -2 ** 63 <= x < 2 ** 63
+
+
+def _encode_labels(labels):
+    """ Return (kind, bytes) for the labels section. """
+    if all(label == v and _is_int(label) for v, label in enumerate(labels)):
+        return _LABELS_IDS, b''
+    if all(_is_int(label) for label in labels):
+        return _LABELS_INTS, array('q', labels).tobytes()
+    if all(type(label) is tuple and len(label) == 2
+           and _is_int(label[0]) and _is_int(label[1]) for label in labels):
+        flat = array('q')
+        for i, j in labels:
+            flat.append(i)
+            flat.append(j)
+        return _LABELS_PAIRS, flat.tobytes()
+    return _LABELS_JSON, labels_to_json(labels)
+
+
+def _decode_labels(kind, section, n):
+    """ Return a label sequence over the labels section (a memoryview). """
+    if kind == _LABELS_IDS:
+        return range(n)
+    if kind == _LABELS_INTS:
+        return section.cast('q')
+    if kind == _LABELS_PAIRS:
+        return _PairLabels(section.cast('q'))
+    if kind == _LABELS_JSON:
+        labels = labels_from_json(section)
+        if len(labels) != n:
+            raise ValueError('graph file has ' + str(len(labels)) + ' labels for '
+                             + str(n) + ' vertices')
+        return labels
+    raise ValueError('unknown label kind in graph file: ' + repr(kind))
+
+
+def _copy(typecode, view):
+    copied = array(typecode)
+    copied.frombytes(view.cast('B'))
+    return copied
+
+
+def _padded(size):
+    return (size + 7) // 8 * 8
+
+
+def save_graph(graph, filename):
+    """ Write graph to filename in the binary graph format.
+
+    Args:
+        graph -- a CSRGraph, or anything with a freeze() returning one (Graph, ImplicitGridGraph)
+        filename -- the file to write
+    """
+    csr = graph if isinstance(graph, CSRGraph) else graph.freeze()
+    n = csr.num_vertices()
+    kind, labels = _encode_labels([csr.label(v) for v in csr.vertices()])
+    byte_order = 0 if sys.byteorder == 'little' else 1
+    header = _HEADER.pack(GRAPH_FILE_MAGIC, GRAPH_FILE_VERSION, byte_order, kind,
+                          n, len(csr._targets), len(labels), int(csr.is_directed()))
+    with open(filename, 'wb') as file:
+        file.write(header.ljust(_HEADER_SIZE, b'\0'))
+        file.write(labels.ljust(_padded(len(labels)), b'\0'))
+        file.write(array('q', csr._offsets).tobytes())
+        file.write(array('q', csr._targets).tobytes())
+        file.write(array('d', csr._weights).tobytes())
+
+
+def load_graph(filename, use_mmap=True):
+    """ Read a graph written by save_graph, and return it as a CSRGraph.
+
+    Args:
+        filename -- the file to read
+        use_mmap -- if True, the graph's arrays are views onto the mapped file, which
+                    must not be changed while the graph is in use. If False the file
+                    is read into ordinary arrays.
+    """
+    with open(filename, 'rb') as file:
+        if use_mmap:
+            data = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        else:
+            data = file.read()
+    if len(data) < _HEADER_SIZE:
+        raise ValueError(filename + ' is not a graph file')
+    (magic, version, byte_order, kind,
+     n, num_slots, labels_size, directed) = _HEADER.unpack_from(data)
+    if magic != GRAPH_FILE_MAGIC:
+        raise ValueError(filename + ' is not a graph file')
+    if version != GRAPH_FILE_VERSION:
+        raise ValueError('unsupported graph file version: ' + repr(version)
+                         + ' (expected ' + str(GRAPH_FILE_VERSION) + '); save the graph again')
+    if byte_order != (0 if sys.byteorder == 'little' else 1):
+        raise ValueError(filename + ' was saved on a machine with the other byte order')
+
+    start_offsets = _HEADER_SIZE + _padded(labels_size)
+    start_targets = start_offsets + 8 * (n + 1)
+    start_weights = start_targets + 8 * num_slots
+    end = start_weights + 8 * num_slots
+    if len(data) < end:
+        raise ValueError(filename + ' is truncated')
+
+    view = memoryview(data)
+    labels = _decode_labels(kind, view[_HEADER_SIZE:_HEADER_SIZE + labels_size], n)
+    offsets = view[start_offsets:start_targets].cast('q')
+    targets = view[start_targets:start_weights].cast('q')
+    weights = view[start_weights:end].cast('d')
+    if not use_mmap:
+        offsets, targets, weights = _copy('q', offsets), _copy('q', targets), _copy('d', weights)
+        if kind in (_LABELS_INTS, _LABELS_PAIRS):
+            labels = [labels[v] for v in range(n)]
+    return CSRGraph(labels, offsets, targets, weights, bool(directed))
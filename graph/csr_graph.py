@@ -0,0 +1,192 @@
+""" A read-only, compressed sparse row (CSR) version of the Graph ADT.
+
+    Graph keeps a dict of Vertex objects, each mapping to a dict of Edge
+    objects - roughly a million Python objects for a 500x500 grid. CSRGraph
+    interns every vertex to a dense int id (0..n-1) and keeps the adjacency
+    in three contiguous arrays:
+
+        _offsets[v] .. _offsets[v + 1]  -- the slots holding v's neighbours
+        _targets[k]                     -- the neighbour id in slot k
+        _weights[k]                     -- the edge weight in slot k
+
+    Each edge also gets a dense edge id - see edge_ids() - so data kept per
+    edge rather than per slot (graph.weight_profiles) is stored only once.
+
+    Build one with CSRGraph.from_graph(graph) or graph.freeze().
+
+    Freeze a graph that is searched many times and no longer changes - the
+    searches run faster, and the flat arrays can be shared and saved
+    (batch, binary_io).
+"""
+
+from array import array
+
+
+def _unpaired(v, w):
+    return ValueError('undirected graph has a slot ' + str(v) + ' -> ' + str(w)
+                      + ' but no slot ' + str(w) + ' -> ' + str(v))
+
+
+class CSRGraph:
+    """ A frozen graph with vertices interned to dense int ids. """
+
+    def __init__(self, labels, offsets, targets, weights, directed=False, edge_ids=None):
+        """ Create a CSR graph from already-built arrays.
+
+        Args:
+            labels -- list of vertex labels, indexed by vertex id
+            offsets -- array('q') of length len(labels) + 1
+            targets -- array('q') of neighbour ids
+            weights -- array('d') of edge weights, parallel to targets
+            directed -- True if slot k is only an edge from its row to targets[k];
+                        otherwise every edge is stored from both ends
+            edge_ids -- array('q') of the edge id in each slot, parallel to targets;
+                        worked out from the arrays on first use if None
+        """
+        self._directed = directed
+        self._labels = labels
+        self._offsets = offsets
+        self._targets = targets
+        self._weights = weights
+        # label -> id, the same O(1) lookup Graph._vertex_map gives us. Built on first use,
+        # so a graph that is only ever queried by id never pays for it.
+        self._ids = None
+        # slot -> edge id, also built on first use
+        self._edge_ids = edge_ids
+        self._num_edge_ids = None
+
+    @classmethod
+    def from_graph(cls, graph):
+        """ Build a CSRGraph snapshot of graph.
+
+        Vertex ids follow the insertion order of graph._structure, so for
+        the grid graphs (i, j) gets id i * m + j.
+
+        Args:
+            graph -- a Graph instance (anything with a _structure map)
+        """
+        vertices = list(graph._structure)
+        ids = {v: i for i, v in enumerate(vertices)}
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for v in vertices:
+            for w, edge in graph._structure[v].items():
+                targets.append(ids[w])
+                weights.append(edge.element())
+            offsets.append(len(targets))
+        directed = graph.is_directed() if hasattr(graph, 'is_directed') else False
+        edge_ids = None
+        if directed:
+            # A DiGraph shares one Edge between both slots of a two-way edge, which the
+            # arrays alone cannot tell apart from two one-way edges - so number them here.
+            numbers = {}
+            edge_ids = array('q', [numbers.setdefault(edge, len(numbers))
+                                   for v in vertices for edge in graph._structure[v].values()])
+        return cls([v.element() for v in vertices], offsets, targets, weights, directed, edge_ids)
+
+    def __str__(self):
+        """ Return a short summary of the graph. """
+        return ('|V| = ' + str(self.num_vertices())
+                + '; |E| = ' + str(self.num_edges()) + ' (CSR)')
+
+    #--------------------------------------------------#
+    #ADT methods to query the graph
+
+    def num_vertices(self):
+        """ Return the number of vertices in the graph. """
+        return len(self._labels)
+
+    def num_edges(self):
+        """ Return the number of edges in the graph - for a directed graph, a two-way
+        edge counts once per direction. """
+        if self._directed:
+            return len(self._targets)
+        return len(self._targets) // 2    # each edge is stored from both ends
+
+    def is_directed(self):
+        """ Return True if edges only go from their row to their target. """
+        return self._directed
+
+    def vertices(self):
+        """ Return the vertex ids, 0..n-1. """
+        return range(len(self._labels))
+
+    def get_vertex_by_label(self, element):
+        """ Return the id of the first vertex with label element, or None. """
+        if self._ids is None:
+            # Built back to front, so where labels repeat the lowest id is the one kept -
+            # the first vertex, as Graph.get_vertex_by_label gives.
+            labels = self._labels
+            self._ids = dict(zip(reversed(labels), range(len(labels) - 1, -1, -1)))
+        return self._ids.get(element, None)
+
+    def label(self, v):
+        """ Return the label of vertex id v. """
+        return self._labels[v]
+
+    def degree(self, v):
+        """ Return the degree of vertex id v. """
+        return self._offsets[v + 1] - self._offsets[v]
+
+    def neighbours(self, v):
+        """ Return a list of (neighbour id, weight) pairs for vertex id v. """
+        lo, hi = self._offsets[v], self._offsets[v + 1]
+        return list(zip(self._targets[lo:hi], self._weights[lo:hi]))
+
+    def get_edge(self, v, w):
+        """ Return the weight of the edge between v and w, or None. """
+        for k in range(self._offsets[v], self._offsets[v + 1]):
+            if self._targets[k] == w:
+                return self._weights[k]
+        return None
+
+    def edge_ids(self):
+        """ Return an array of the edge id held in each slot, parallel to the targets.
+
+        Edge ids run 0..num_edge_ids()-1 in the order the edges are first met
+        scanning the slots, and both slots of an undirected edge (or of a two-way
+        edge frozen from a DiGraph) share one id.
+        """
+        if self._edge_ids is None:
+            self._edge_ids = self._number_edges()
+        return self._edge_ids
+
+    def num_edge_ids(self):
+        """ Return the number of distinct edge ids. """
+        if self._num_edge_ids is None:
+            edge_ids = self.edge_ids()
+            self._num_edge_ids = max(edge_ids) + 1 if len(edge_ids) else 0
+        return self._num_edge_ids
+
+    def _number_edges(self):
+        """ Work out edge_ids() from the arrays, pairing up the two slots of each undirected edge. """
+        if self._directed:
+            return array('q', range(len(self._targets)))
+        offsets = self._offsets
+        targets = self._targets
+        edge_ids = array('q', bytes(8 * len(targets)))
+        # (v, w) -> the id given to slot v -> w, waiting for w's row to reach the slot w -> v
+        waiting = {}
+        count = 0
+        for v in range(len(self._labels)):
+            for k in range(offsets[v], offsets[v + 1]):
+                w = targets[k]
+                if w < v:
+                    if (w, v) not in waiting:
+                        raise _unpaired(v, w)
+                    edge_ids[k] = waiting.pop((w, v))
+                else:
+                    edge_ids[k] = count
+                    if w > v:
+                        waiting[(v, w)] = count
+                    count += 1
+        if waiting:
+            raise _unpaired(*next(iter(waiting)))
+        return edge_ids
+
+    def nbytes(self):
+        """ Return the bytes held by the adjacency arrays. """
+        return (self._offsets.itemsize * len(self._offsets)
+                + self._targets.itemsize * len(self._targets)
+                + self._weights.itemsize * len(self._weights))
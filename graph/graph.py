@@ -7,9 +7,22 @@
 
 import copy
 
+from .csr_graph import CSRGraph
+
+
+def _as_list(values):
+    """ Return values as a list - NumPy arrays become lists of plain Python numbers. """
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return list(values)
+
+
 class Vertex:
     """ A Vertex in a graph. """
-    
+
+    # No per-instance __dict__ - a grid graph has one of these per cell.
+    __slots__ = ('_element',)
+
     def __init__(self, element):
         """ Create a vertex, with data element. """
         self._element = element
@@ -37,7 +50,11 @@ class Edge:
     graphs. Methods are provided for both. It is the job of the Graph class
     to handle them as directed or undirected.
     """
-    
+
+    # No per-instance __dict__, and the two ends kept in their own slots rather than in a
+    # tuple - a grid graph has two of these per cell, so that is one object per edge, not three.
+    __slots__ = ('_start', '_end', '_element')
+
     def __init__(self, v, w, element):
         """ Create an edge between vertices v and w, with label element.
 
@@ -46,18 +63,19 @@ class Edge:
             w -- a Vertex object
             element -- the label, can be an arbitrarily complex structure.
         """
-        self._vertices = (v,w)
+        self._start = v
+        self._end = w
         self._element = element
 
     def __str__(self):
         """ Return a string representation of this edge. """
-        return ('(' + str(self._vertices[0]) + '--'
-                   + str(self._vertices[1]) + ' : '
+        return ('(' + str(self._start) + '--'
+                   + str(self._end) + ' : '
                    + str(self._element) + ')')
 
     def vertices(self):
         """ Return an ordered pair of the vertices of this edge."""
-        return self._vertices
+        return (self._start, self._end)
 
     def opposite(self, v):
         """ Return the opposite vertex to v in this edge, or None if this edge not incident on v.  
@@ -65,10 +83,10 @@ class Edge:
         Args:
             v - a Vertex object
         """
-        if self._vertices[0] == v:
-            return self._vertices[1]
-        elif self._vertices[1] == v:
-            return self._vertices[0]
+        if self._start == v:
+            return self._end
+        elif self._end == v:
+            return self._start
         else:
             return None
 
@@ -78,11 +96,11 @@ class Edge:
 
     def start(self):
         """ Return the first vertex in the ordered pair. """
-        return self._vertices[0]
+        return self._start
 
     def end(self):
         """ Return the second vertex in the ordered. pair. """
-        return self._vertices[1]
+        return self._end
 
 
 class Graph:
@@ -104,6 +122,8 @@ class Graph:
     def __init__(self):
         """ Create an initial empty graph. """
         self._structure = dict()
+        # bumped by every edge change, so caches of search results can tell they are stale
+        self._version = 0
         # adding a new dict to ultimately optimize get_vertex_by_label
         self._vertex_map = {}
 
@@ -203,7 +223,7 @@ class Graph:
         """
         v = Vertex(element)
         self._structure[v] = dict()  # create an empty dict, ready for edges
-        self._vertex_map[element] = v  # Store for quicker access
+        self._vertex_map.setdefault(element, v)  # Store for quicker access - the first one wins
         return v
 
     def add_vertex_if_new(self, element):
@@ -249,8 +269,73 @@ class Graph:
         # etc.
         self._structure[v][w] = e  
         self._structure[w][v] = e
+        self._version += 1
         return e
 
+    def add_vertices_from(self, elements):
+        """ Add a new vertex for each data element in elements, and return them in a list.
+
+        Does the same as calling add_vertex on each element in turn, without
+        the per-call overhead.
+
+        Args:
+            elements -- an iterable (or NumPy array) of vertex data elements
+        """
+        elements = _as_list(elements)
+        vertices = [Vertex(element) for element in elements]
+        self._structure.update((v, dict()) for v in vertices)
+        # As add_vertex, the first vertex with a label is the one the map keeps.
+        vertex_map = self._vertex_map
+        vertex_map.update((element, v) for element, v in zip(elements, vertices)
+                          if element not in vertex_map)
+        return vertices
+
+    def add_edges_from(self, starts, ends, elements, by_label=False):
+        """ Add an edge from starts[k] to ends[k] with element elements[k], for every k.
+
+        Does the same as calling add_edge on each triple in turn, except that
+        every vertex is checked first: if any is not in the graph, raises
+        ValueError and adds nothing. Returns the new edges in a list.
+
+        Args:
+            starts -- an iterable (or NumPy array) of Vertex objects
+            ends -- an iterable (or NumPy array) of Vertex objects, as long as starts
+            elements -- an iterable (or NumPy array) of edge elements, as long as starts
+            by_label -- if True, starts and ends hold vertex data elements
+                        (labels) instead of Vertex objects
+        """
+        starts, ends, elements = self._edges_from(starts, ends, elements, by_label)
+        structure = self._structure
+        edges = []
+        for v, w, element in zip(starts, ends, elements):
+            e = Edge(v, w, element)
+            structure[v][w] = e
+            structure[w][v] = e
+            edges.append(e)
+        self._version += 1
+        return edges
+
+    def _edges_from(self, starts, ends, elements, by_label):
+        """ Return starts, ends and elements as lists, with the ends checked as vertices. """
+        starts = _as_list(starts)
+        ends = _as_list(ends)
+        elements = _as_list(elements)
+        if not len(starts) == len(ends) == len(elements):
+            raise ValueError('starts, ends and elements have lengths ' + str(len(starts))
+                             + ', ' + str(len(ends)) + ' and ' + str(len(elements)))
+        if by_label:
+            lookup = self._vertex_map
+            try:
+                starts = [lookup[label] for label in starts]
+                ends = [lookup[label] for label in ends]
+            except KeyError as error:
+                raise ValueError('no vertex with label ' + repr(error.args[0])) from None
+        else:
+            missing = set(starts).union(ends).difference(self._structure)
+            if missing:
+                raise ValueError('vertex ' + str(missing.pop()) + ' is not in the graph')
+        return starts, ends, elements
+
     def add_edge_pairs(self, elist):
         """ Add all vertex pairs in elist as edges with empty elements. """
         for (v,w) in elist:
@@ -262,7 +347,8 @@ class Graph:
             for neighbour in list(self._structure[v]):
                 self.remove_edge(v, neighbour)
             del self._structure[v]  # Remove vertex
-            if v.element() in self._vertex_map:
+            self._version += 1
+            if self._vertex_map.get(v.element()) is v:
                 del self._vertex_map[v.element()] # need to get rid from new dict.
 
     def remove_edge(self, v, w):
@@ -270,7 +356,19 @@ class Graph:
         if v in self._structure and w in self._structure[v]:
             del self._structure[v][w]
             del self._structure[w][v]
+            self._version += 1
+
+
+    def version(self):
+        """ Return a counter that changes whenever an edge is added or removed. """
+        return self._version
 
+    def freeze(self):
+        """ Return a read-only CSRGraph snapshot of this graph.
+
+        Later changes to this graph are not reflected in the snapshot.
+        """
+        return CSRGraph.from_graph(self)
 
     #--------------------------------------------------#
     #Additional methods to explore the graph
@@ -285,9 +383,172 @@ class Graph:
                 hdv = v
         return hdv            
 
+    def is_directed(self):
+        """ Return False - every edge can be walked both ways. """
+        return False
+
     
     #End of class definition
 
+
+class DiGraph(Graph):
+    """ Represent a directed graph, e.g. a road map with one-way streets.
+
+        self._structure[v][w] is the edge from v to w, so everything that
+        walks _structure (dijkstra_source_to_dest, A*, the CSR freeze) follows
+        edges forwards without knowing the graph is directed. self._in[w][v]
+        is the same edge again, indexed by where it ends, so a search going
+        backwards from a target (bidirectional, many-to-one) can walk the
+        edges in reverse without scanning the whole graph for them.
+
+        A two-way road is one Edge object entered under both directions, so
+        it costs dict slots, not a second Edge. It still counts as two edges,
+        one per direction, as it does once frozen. Removing or replacing one
+        direction gives the other its own Edge.
+    """
+
+    def __init__(self):
+        """ Create an initial empty directed graph. """
+        super().__init__()
+        self._in = dict()
+
+    #--------------------------------------------------#
+    #ADT methods to query the graph
+
+    def num_edges(self):
+        """ Return the number of edges in the graph - a two-way edge counts once per direction. """
+        return sum(len(edges) for edges in self._structure.values())
+
+    def edges(self):
+        """ Return a list of all edges in the graph, one entry per direction.
+
+        A two-way edge is listed under both of its directions, so it appears twice.
+        """
+        edgelist = []
+        for v in self._structure:
+            edgelist.extend(self._structure[v].values())
+        return edgelist
+
+    def get_in_edges(self, v):
+        """ Return a list of all edges arriving at v, or None if v is not in the graph. """
+        if v in self._in:
+            return list(self._in[v].values())
+        return None
+
+    def degree(self, v):
+        """ Return the out-degree of vertex v. """
+        return len(self._structure[v])
+
+    def in_degree(self, v):
+        """ Return the in-degree of vertex v. """
+        return len(self._in[v])
+
+    def is_directed(self):
+        """ Return True - edges only go from their start to their end. """
+        return True
+
+    #--------------------------------------------------#
+    #ADT methods to modify the graph
+
+    def add_vertex(self, element):
+        """ Add and return a new vertex with data element. """
+        v = super().add_vertex(element)
+        self._in[v] = dict()
+        return v
+
+    def add_edge(self, v, w, element, oneway=True):
+        """ Add and return an edge, with element, from v to w.
+
+        If either v or w are not vertices in the graph, does not add, and
+        returns None. An existing edge from v to w is replaced.
+
+        Args:
+            v -- a Vertex object
+            w -- a Vertex object
+            element -- arbitrary complex structure with info for the edge
+            oneway -- if False, the edge can also be walked from w to v
+        """
+        if not v in self._structure or not w in self._structure:
+            return None
+        self._split(v, w)
+        e = Edge(v, w, element)
+        self._structure[v][w] = e
+        self._in[w][v] = e
+        if not oneway:
+            self._structure[w][v] = e
+            self._in[v][w] = e
+        self._version += 1
+        return e
+
+    def add_vertices_from(self, elements):
+        """ Add a new vertex for each data element in elements, and return them in a list. """
+        vertices = super().add_vertices_from(elements)
+        self._in.update((v, dict()) for v in vertices)
+        return vertices
+
+    def add_edges_from(self, starts, ends, elements, by_label=False, oneway=True):
+        """ Add an edge from starts[k] to ends[k] with element elements[k], for every k.
+
+        As Graph.add_edges_from, with oneway as for add_edge - either one
+        flag for every edge, or an iterable of flags, one per edge.
+        """
+        starts, ends, elements = self._edges_from(starts, ends, elements, by_label)
+        if isinstance(oneway, bool):
+            oneway = [oneway] * len(starts)
+        else:
+            oneway = _as_list(oneway)
+            if len(oneway) != len(starts):
+                raise ValueError('oneway has length ' + str(len(oneway))
+                                 + ' but there are ' + str(len(starts)) + ' edges')
+        structure = self._structure
+        in_structure = self._in
+        edges = []
+        for v, w, element, one in zip(starts, ends, elements, oneway):
+            self._split(v, w)
+            e = Edge(v, w, element)
+            structure[v][w] = e
+            in_structure[w][v] = e
+            if not one:
+                structure[w][v] = e
+                in_structure[v][w] = e
+            edges.append(e)
+        self._version += 1
+        return edges
+
+    def remove_vertex(self, v):
+        """ Remove a vertex and all edges into and out of it. """
+        if v in self._structure:
+            for w in list(self._structure[v]):
+                self.remove_edge(v, w)
+            for u in list(self._in[v]):
+                self.remove_edge(u, v)
+            del self._structure[v]
+            del self._in[v]
+            self._version += 1
+            if self._vertex_map.get(v.element()) is v:
+                del self._vertex_map[v.element()]
+
+    def remove_edge(self, v, w):
+        """ Remove the edge from v to w, if it exists. The w to v direction is kept. """
+        if v in self._structure and w in self._structure[v]:
+            self._split(v, w)
+            del self._structure[v][w]
+            del self._in[w][v]
+            self._version += 1
+
+    def _split(self, v, w):
+        """ If v -> w is a two-way edge, make sure its w -> v direction keeps an Edge of its own.
+
+        Called before v -> w is removed or replaced, so w -> v is left as it was. The
+        shared Edge already runs w -> v if it was added that way round; if not, w -> v
+        gets a new one.
+        """
+        e = self._structure[v].get(w)
+        if e is not None and e.start() is v and v is not w and self._structure[w].get(v) is e:
+            back = Edge(w, v, e.element())
+            self._structure[w][v] = back
+            self._in[v][w] = back
+
 #---------------------------------------------------------------------------#
 #Test methods
 
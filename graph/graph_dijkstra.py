@@ -7,9 +7,22 @@
 
 import copy
 
+from .csr_graph import CSRGraph
+
+
+def _as_list(values):
+    """ Return values as a list - NumPy arrays become lists of plain Python numbers. """
+    if hasattr(values, 'tolist'):
+        return values.tolist()
+    return list(values)
+
+
 class Vertex:
     """ A Vertex in a graph. """
-    
+
+    # No per-instance __dict__ - a grid graph has one of these per cell.
+    __slots__ = ('_element',)
+
     def __init__(self, element):
         """ Create a vertex, with data element. """
         self._element = element
@@ -37,7 +50,11 @@ class Edge:
     graphs. Methods are provided for both. It is the job of the Graph class
     to handle them as directed or undirected.
     """
-    
+
+    # No per-instance __dict__, and the two ends kept in their own slots rather than in a
+    # tuple - a grid graph has two of these per cell, so that is one object per edge, not three.
+    __slots__ = ('_start', '_end', '_element')
+
     def __init__(self, v, w, element):
         """ Create an edge between vertices v and w, with label element.
 
@@ -46,18 +63,19 @@ class Edge:
             w -- a Vertex object
             element -- the label, can be an arbitrarily complex structure.
         """
-        self._vertices = (v,w)
+        self._start = v
+        self._end = w
         self._element = element
 
     def __str__(self):
         """ Return a string representation of this edge. """
-        return ('(' + str(self._vertices[0]) + '--'
-                   + str(self._vertices[1]) + ' : '
+        return ('(' + str(self._start) + '--'
+                   + str(self._end) + ' : '
                    + str(self._element) + ')')
 
     def vertices(self):
         """ Return an ordered pair of the vertices of this edge."""
-        return self._vertices
+        return (self._start, self._end)
 
     def opposite(self, v):
         """ Return the opposite vertex to v in this edge, or None if this edge not incident on v.  
@@ -65,10 +83,10 @@ class Edge:
         Args:
             v - a Vertex object
         """
-        if self._vertices[0] == v:
-            return self._vertices[1]
-        elif self._vertices[1] == v:
-            return self._vertices[0]
+        if self._start == v:
+            return self._end
+        elif self._end == v:
+            return self._start
         else:
             return None
 
@@ -78,11 +96,11 @@ class Edge:
 
     def start(self):
         """ Return the first vertex in the ordered pair. """
-        return self._vertices[0]
+        return self._start
 
     def end(self):
         """ Return the second vertex in the ordered. pair. """
-        return self._vertices[1]
+        return self._end
 
 
 class Graph:
@@ -104,6 +122,8 @@ class Graph:
     def __init__(self):
         """ Create an initial empty graph. """
         self._structure = dict()
+        # bumped by every edge change, so caches of search results can tell they are stale
+        self._version = 0
 
     def __str__(self):
         """ Return a string representation of the graph. """
@@ -251,8 +271,72 @@ class Graph:
         # etc.
         self._structure[v][w] = e  
         self._structure[w][v] = e
+        self._version += 1
         return e
 
+    def add_vertices_from(self, elements):
+        """ Add a new vertex for each data element in elements, and return them in a list.
+
+        Does the same as calling add_vertex on each element in turn, without
+        the per-call overhead.
+
+        Args:
+            elements -- an iterable (or NumPy array) of vertex data elements
+        """
+        elements = _as_list(elements)
+        vertices = [Vertex(element) for element in elements]
+        self._structure.update((v, dict()) for v in vertices)
+        return vertices
+
+    def add_edges_from(self, starts, ends, elements, by_label=False):
+        """ Add an edge from starts[k] to ends[k] with element elements[k], for every k.
+
+        Does the same as calling add_edge on each triple in turn, except that
+        every vertex is checked first: if any is not in the graph, raises
+        ValueError and adds nothing. Returns the new edges in a list.
+
+        Args:
+            starts -- an iterable (or NumPy array) of Vertex objects
+            ends -- an iterable (or NumPy array) of Vertex objects, as long as starts
+            elements -- an iterable (or NumPy array) of edge elements, as long as starts
+            by_label -- if True, starts and ends hold vertex data elements
+                        (labels) instead of Vertex objects
+        """
+        starts, ends, elements = self._edges_from(starts, ends, elements, by_label)
+        structure = self._structure
+        edges = []
+        for v, w, element in zip(starts, ends, elements):
+            e = Edge(v, w, element)
+            structure[v][w] = e
+            structure[w][v] = e
+            edges.append(e)
+        self._version += 1
+        return edges
+
+    def _edges_from(self, starts, ends, elements, by_label):
+        """ Return starts, ends and elements as lists, with the ends checked as vertices. """
+        starts = _as_list(starts)
+        ends = _as_list(ends)
+        elements = _as_list(elements)
+        if not len(starts) == len(ends) == len(elements):
+            raise ValueError('starts, ends and elements have lengths ' + str(len(starts))
+                             + ', ' + str(len(ends)) + ' and ' + str(len(elements)))
+        if by_label:
+            # As get_vertex_by_label, the first vertex with a label is the one it finds.
+            lookup = {}
+            for v in self._structure:
+                lookup.setdefault(v.element(), v)
+            try:
+                starts = [lookup[label] for label in starts]
+                ends = [lookup[label] for label in ends]
+            except KeyError as error:
+                raise ValueError('no vertex with label ' + repr(error.args[0])) from None
+        else:
+            missing = set(starts).union(ends).difference(self._structure)
+            if missing:
+                raise ValueError('vertex ' + str(missing.pop()) + ' is not in the graph')
+        return starts, ends, elements
+
     def add_edge_pairs(self, elist):
         """ Add all vertex pairs in elist as edges with empty elements. """
         for (v,w) in elist:
@@ -263,13 +347,26 @@ class Graph:
             for neighbour in list(self._structure[v]):
                 self.remove_edge(v, neighbour)
             del self._structure[v]
+            self._version += 1
 
     def remove_edge(self, v, w):
         """ Remove the edge between v and w, if it exists. """
         if v in self._structure and w in self._structure[v]:
             del self._structure[v][w]
             del self._structure[w][v]
+            self._version += 1
+
 
+    def version(self):
+        """ Return a counter that changes whenever an edge is added or removed. """
+        return self._version
+
+    def freeze(self):
+        """ Return a read-only CSRGraph snapshot of this graph.
+
+        Later changes to this graph are not reflected in the snapshot.
+        """
+        return CSRGraph.from_graph(self)
 
     #--------------------------------------------------#
     #Additional methods to explore the graph
@@ -0,0 +1,193 @@
+""" A grid graph that stores nothing but its edge weights.
+
+    A Graph grid keeps a Vertex per cell and an Edge per link, plus a dict
+    per vertex - a 500x500 grid is about a million Python objects, and a
+    5000x5000 one does not fit in memory at all. In a grid, though, the
+    neighbours of (i, j) are always (i - 1, j), (i, j - 1), (i + 1, j) and
+    (i, j + 1), so ImplicitGridGraph works them out when asked and keeps
+    only two 2D weight arrays:
+
+        south[i][j]  -- the weight of (i, j) -- (i + 1, j), shape (n - 1, m)
+        east[i][j]   -- the weight of (i, j) -- (i, j + 1), shape (n, m - 1)
+
+    Vertices are dense int ids, i * m + j, like CSRGraph's. _structure is a
+    read-only view that builds a vertex's edge dict on demand, so
+    dijkstra_source_to_dest (and anything else walking graph._structure)
+    runs on it unchanged.
+"""
+
+import random
+from array import array
+
+from .graph import Edge
+from .csr_graph import CSRGraph
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def grid_weights(n, m, seed=None):
+    """ Return (south, east), the random edge weights of an n x m grid, each n x m.
+
+    south[i][j] is the weight of (i, j) -- (i + 1, j) and east[i][j] that of
+    (i, j) -- (i, j + 1); the last row of south and last column of east are drawn
+    but not used, which keeps it to one numpy.random.Generator call on a fixed
+    shape. Both generate_weighted_grid_graph and ImplicitGridGraph.random draw
+    from here, so a seed gives the same grid from either. Without numpy the
+    weights come from random.Random(seed) as lists instead, and a seed gives a
+    different (but still fixed) grid.
+
+    Args:
+        n -- number of rows
+        m -- number of columns
+        seed -- seed for the generator; if None, one is drawn from the random
+                module, so random.seed() still fixes the grid
+    """
+    max_weight = max(max(n, m) // 2, 1)
+    if seed is None:
+        seed = random.getrandbits(64)
+    if numpy is not None:
+        return numpy.random.default_rng(seed).integers(
+            1, max_weight, size=(2, n, m), dtype='int32', endpoint=True)
+    rng = random.Random(seed)
+    weights = range(1, max_weight + 1)
+    return [[rng.choices(weights, k=m) for i in range(n)] for _ in range(2)]
+
+
+class _GridStructure:
+    """ The graph._structure view of an ImplicitGridGraph: vertex id -> {neighbour id: Edge}. """
+
+    def __init__(self, grid):
+        self._grid = grid
+
+    def __len__(self):
+        return self._grid.num_vertices()
+
+    def __iter__(self):
+        return iter(self._grid.vertices())
+
+    def __contains__(self, v):
+        return isinstance(v, int) and 0 <= v < self._grid.num_vertices()
+
+    def __getitem__(self, v):
+        if v not in self:
+            raise KeyError(v)
+        return {w: Edge(v, w, weight) for w, weight in self._grid.neighbours(v)}
+
+
+class ImplicitGridGraph:
+    """ An undirected n x m grid graph with neighbours computed from (i, j). """
+
+    def __init__(self, south, east):
+        """ Create a grid from its weight arrays.
+
+        Args:
+            south -- 2D array, shape (n - 1, m), of the weights down each column
+            east -- 2D array, shape (n, m - 1), of the weights along each row
+        """
+        n = south.shape[0] + 1
+        m = east.shape[1] + 1
+        if south.shape[1] != m or east.shape[0] != n:
+            raise ValueError('south has shape ' + str(south.shape) + ' but east has shape '
+                             + str(east.shape) + '; they must be (n - 1, m) and (n, m - 1)')
+        self._n = n
+        self._m = m
+        self._south = south
+        self._east = east
+        self._structure = _GridStructure(self)
+
+    @classmethod
+    def random(cls, n, m, seed=None, dtype='int32'):
+        """ Create an n x m grid with random weights, like generate_weighted_grid_graph.
+
+        The weights come from grid_weights(n, m, seed), as generate_weighted_grid_graph's
+        do, so the two give the same graph for the same seed.
+
+        Args:
+            n -- number of rows, at least 1
+            m -- number of columns, at least 1
+            seed -- seed for grid_weights
+            dtype -- the weight arrays' dtype; int32 halves the memory of int64
+        """
+        if numpy is None:
+            raise ImportError('ImplicitGridGraph.random needs numpy')
+        south, east = grid_weights(n, m, seed).astype(dtype, copy=False)
+        return cls(south[:-1], east[:, :-1])
+
+    def __str__(self):
+        """ Return a short summary of the graph. """
+        return ('|V| = ' + str(self.num_vertices())
+                + '; |E| = ' + str(self.num_edges())
+                + ' (' + str(self._n) + 'x' + str(self._m) + ' implicit grid)')
+
+    #--------------------------------------------------#
+    #ADT methods to query the graph
+
+    def num_vertices(self):
+        """ Return the number of vertices in the graph. """
+        return self._n * self._m
+
+    def num_edges(self):
+        """ Return the number of edges in the graph. """
+        return (self._n - 1) * self._m + self._n * (self._m - 1)
+
+    def vertices(self):
+        """ Return the vertex ids, 0..n*m-1. """
+        return range(self._n * self._m)
+
+    def get_vertex_by_label(self, element):
+        """ Return the id of the vertex labelled (i, j), or None. """
+        i, j = element
+        if 0 <= i < self._n and 0 <= j < self._m:
+            return i * self._m + j
+        return None
+
+    def label(self, v):
+        """ Return the (i, j) label of vertex id v. """
+        return divmod(v, self._m)
+
+    def degree(self, v):
+        """ Return the degree of vertex id v. """
+        i, j = divmod(v, self._m)
+        return (i > 0) + (j > 0) + (i + 1 < self._n) + (j + 1 < self._m)
+
+    def neighbours(self, v):
+        """ Return a list of (neighbour id, weight) pairs for vertex id v. """
+        m = self._m
+        i, j = divmod(v, m)
+        result = []
+        # north, west, south, east - the order generate_weighted_grid_graph's dicts end up in
+        if i > 0:
+            result.append((v - m, self._south.item(i - 1, j)))
+        if j > 0:
+            result.append((v - 1, self._east.item(i, j - 1)))
+        if i + 1 < self._n:
+            result.append((v + m, self._south.item(i, j)))
+        if j + 1 < m:
+            result.append((v + 1, self._east.item(i, j)))
+        return result
+
+    def get_edge(self, v, w):
+        """ Return the weight of the edge between v and w, or None. """
+        for neighbour, weight in self.neighbours(v):
+            if neighbour == w:
+                return weight
+        return None
+
+    def nbytes(self):
+        """ Return the bytes held by the weight arrays. """
+        return self._south.nbytes + self._east.nbytes
+
+    def freeze(self):
+        """ Return a CSRGraph of this grid, with the same vertex ids. """
+        offsets = array('q', [0])
+        targets = array('q')
+        weights = array('d')
+        for v in self.vertices():
+            for w, weight in self.neighbours(v):
+                targets.append(w)
+                weights.append(weight)
+            offsets.append(len(targets))
+        return CSRGraph([self.label(v) for v in self.vertices()], offsets, targets, weights)
@@ -0,0 +1,172 @@
+""" Many weight sets over one graph topology.
+
+    Road graphs get searched under several weightings - time of day, vehicle
+    class - that share every vertex and edge and differ only in the weights.
+    With Graph the weight lives in each Edge's element, so every weighting
+    meant a whole copy of the graph. WeightProfiles keeps the graph once,
+    gives each edge a dense edge id, and stores a profile as nothing more
+    than an array('d') indexed by edge id - 8 bytes per edge per profile.
+
+        profiles = WeightProfiles(graph)
+        profiles.add_profile('rush hour', lambda v, w, weight: weight * 2)
+        dijkstra_source_to_dest(start, end, graph, pq_class,
+                                profile=profiles.profile('rush hour'))
+
+    Edge ids follow the order edges are first met walking graph._structure,
+    the same numbering CSRGraph.edge_ids() gives graph.freeze().
+"""
+
+from array import array
+
+from .csr_graph import CSRGraph
+from .implicit_grid import ImplicitGridGraph
+
+
+def _graph_version(graph):
+    """ Return graph.version(), or 0 for a graph that never changes (CSRGraph). """
+    version = getattr(graph, 'version', None)
+    return version() if version is not None else 0
+
+
+class WeightProfile:
+    """ One named set of edge weights, indexed by edge id. """
+
+    def __init__(self, owner, name, weights):
+        self._owner = owner
+        self._name = name
+        self._weights = weights
+
+    def __len__(self):
+        return len(self._weights)
+
+    def name(self):
+        """ Return the name this profile was added under. """
+        return self._name
+
+    def profiles(self):
+        """ Return the WeightProfiles this profile belongs to. """
+        return self._owner
+
+    def weights(self):
+        """ Return the weight array, indexed by edge id. Changes to it apply to later searches. """
+        return self._weights
+
+    def weight(self, edge_id):
+        """ Return the weight of edge id edge_id. """
+        return self._weights[edge_id]
+
+    def weights_for(self, graph):
+        """ Return (weights, edge_index) for a search over graph with this profile.
+
+        The weight of an edge is weights[edge_index[x]], where x is the Edge for a
+        Graph and the slot number for a CSRGraph. Raises ValueError if the profile
+        is not over graph, or graph has gained or lost edges since it was.
+
+        Args:
+            graph -- the graph about to be searched
+        """
+        owner = self._owner
+        if graph is not owner._graph:
+            raise ValueError('weight profile belongs to a different graph')
+        if _graph_version(graph) != owner._version:
+            raise ValueError('graph has changed since its weight profiles were built')
+        if owner._edge_index is None:
+            return self._weights, graph.edge_ids()
+        return self._weights, owner._edge_index
+
+
+class WeightProfiles:
+    """ Named weight profiles sharing the topology of one graph. """
+
+    def __init__(self, graph):
+        """ Number the edges of graph, ready for profiles to be added.
+
+        Args:
+            graph -- a Graph, DiGraph or CSRGraph. Adding or removing edges afterwards
+                     invalidates the profiles; searches then raise ValueError.
+        """
+        if isinstance(graph, ImplicitGridGraph):
+            # Its Edges are made afresh on every look-up, so they cannot be keyed by identity.
+            raise ValueError('WeightProfiles cannot number the edges of an ImplicitGridGraph;'
+                             ' use WeightProfiles(grid.freeze()) instead')
+        self._graph = graph
+        self._version = _graph_version(graph)
+        self._profiles = {}
+        if isinstance(graph, CSRGraph):
+            self._edge_index = None
+            self._num_edges = graph.num_edge_ids()
+        else:
+            # Edge -> edge id. Both ends of an undirected edge hold the same Edge object.
+            self._edge_index = {}
+            for v in graph._structure:
+                for edge in graph._structure[v].values():
+                    self._edge_index.setdefault(edge, len(self._edge_index))
+            self._num_edges = len(self._edge_index)
+
+    def graph(self):
+        """ Return the graph the profiles are over. """
+        return self._graph
+
+    def num_edges(self):
+        """ Return the number of edge ids, i.e. the length of every profile. """
+        return self._num_edges
+
+    def edges(self):
+        """ Return a list of (edge id, v, w, weight) for every edge, in edge id order.
+
+        v and w are the graph's own vertices (int ids for a CSRGraph), and weight
+        is the one stored in the graph.
+        """
+        result = [None] * self._num_edges
+        graph = self._graph
+        if self._edge_index is None:
+            offsets, targets, weights = graph._offsets, graph._targets, graph._weights
+            edge_ids = graph.edge_ids()
+            for v in graph.vertices():
+                for k in range(offsets[v], offsets[v + 1]):
+                    if result[edge_ids[k]] is None:
+                        result[edge_ids[k]] = (edge_ids[k], v, targets[k], weights[k])
+        else:
+            for edge, edge_id in self._edge_index.items():
+                v, w = edge.vertices()
+                result[edge_id] = (edge_id, v, w, edge.element())
+        return result
+
+    def add_profile(self, name, weights=None):
+        """ Add a profile and return it, replacing any profile already called name.
+
+        Args:
+            name -- the profile's name
+            weights -- a sequence of num_edges() weights indexed by edge id, or a
+                       function weight(v, w, base_weight) called once per edge, or
+                       None for a copy of the weights stored in the graph
+        """
+        if weights is None:
+            weights = array('d', [weight for _, _, _, weight in self.edges()])
+        elif callable(weights):
+            weights = array('d', [weights(v, w, weight) for _, v, w, weight in self.edges()])
+        else:
+            weights = array('d', weights.tolist() if hasattr(weights, 'tolist') else weights)
+            if len(weights) != self._num_edges:
+                raise ValueError('profile ' + repr(name) + ' has ' + str(len(weights))
+                                 + ' weights but the graph has ' + str(self._num_edges) + ' edges')
+        profile = WeightProfile(self, name, weights)
+        self._profiles[name] = profile
+        return profile
+
+    def profile(self, name):
+        """ Return the profile called name; KeyError if there is none. """
+        return self._profiles[name]
+
+    def profile_names(self):
+        """ Return the names of the profiles, in the order they were added. """
+        return list(self._profiles)
+
+    def remove_profile(self, name):
+        """ Remove the profile called name. """
+        del self._profiles[name]
+
+    def nbytes(self):
+        """ Return the bytes held by the profiles' weight arrays. """
+        return sum(profile._weights.itemsize * len(profile._weights)
+                   for profile in self._profiles.values())
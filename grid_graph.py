@@ -1,13 +1,19 @@
-import random
 from graph.graph_dijkstra import Graph
+from graph.implicit_grid import grid_weights
 
-def generate_weighted_grid_graph(n, m):
+def generate_weighted_grid_graph(n, m, seed=None, graph_class=Graph):
     """
     Generates a weighted grid graph of size n x m.
 
     Parameters:
     n (int): Number of rows in the grid.
     m (int): Number of columns in the grid.
+    seed (int): Seed for the edge weights. The same seed always gives the same graph,
+                and the same one ImplicitGridGraph.random(n, m, seed) gives; without
+                numpy installed the graph for a seed is a different one. If None, one
+                is drawn from the random module, so random.seed() still fixes the graph.
+    graph_class (type): The graph class to build - graph_dijkstra's Graph by default,
+                or any class with the same add_vertices_from and add_edges_from.
 
     Returns:
     Graph: An instance of a grid-graph representing the weighted grid.
@@ -18,23 +24,40 @@ def generate_weighted_grid_graph(n, m):
     this predecessor is either located to the north or west
     """
     
-    graph = Graph()
-    max_weight = max(n, m) // 2
-
-    vertices = {}
-    for i in range(n):
-        for j in range(m):
-            # Going to use the (i,j) as a tuple to identify each vertex
-            vertices[(i, j)] = graph.add_vertex((i, j))
-
-    for i in range(n):
-        for j in range(m):
-            if i + 1 < n:
-                weight = random.randint(1, max_weight)
-                graph.add_edge(vertices[(i, j)], vertices[(i + 1, j)], weight)
-            if j + 1 < m:
-                weight = random.randint(1, max_weight)
-                graph.add_edge(vertices[(i, j)], vertices[(i, j + 1)], weight)
+    graph = graph_class()
+
+    # south[i][j] is the weight of (i, j) -- (i + 1, j) and east[i][j] of (i, j) -- (i, j + 1).
+    # Plain ints make quicker edge weights than numpy scalars.
+    weights = grid_weights(n, m, seed)
+    south, east = weights.tolist() if hasattr(weights, 'tolist') else weights
+
+    # Going to use the (i,j) as a tuple to identify each vertex
+    flat = graph.add_vertices_from([(i, j) for i in range(n) for j in range(m)])
+    vertices = [flat[i * m:(i + 1) * m] for i in range(n)]
+
+    # Line the edges up in the order the add_edge loop used to add them - south then east
+    # from each vertex in turn - and add them in one go. Each row is laid out with slice
+    # assignment: south edges in the even places, east edges in the odd ones between them.
+    starts, ends, weights = [], [], []
+    for i in range(n - 1):
+        row, below = vertices[i], vertices[i + 1]
+        size = 2 * m - 1
+        row_starts, row_ends, row_weights = [None] * size, [None] * size, [None] * size
+        row_starts[0::2] = row
+        row_starts[1::2] = row[:-1]
+        row_ends[0::2] = below
+        row_ends[1::2] = row[1:]
+        row_weights[0::2] = south[i]
+        row_weights[1::2] = east[i][:-1]
+        starts += row_starts
+        ends += row_ends
+        weights += row_weights
+    if n > 0:
+        # the bottom row only has east edges
+        starts += vertices[-1][:-1]
+        ends += vertices[-1][1:]
+        weights += east[-1][:-1]
+    graph.add_edges_from(starts, ends, weights)
 
     return graph
 
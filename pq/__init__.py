@@ -3,3 +3,9 @@ from .apq_binary_heap import APQBinaryHeap
 from .priority_queue_binary_heap import PQBinaryHeap
 from .priority_queue_unsorted import PriorityQueue
 
+from .apq_bucket import BucketAPQ
+from .apq_radix_heap import RadixHeapAPQ
+from .apq_pairing_heap import APQPairingHeap
+from .apq_dary_heap import APQDaryHeap
+from .priority_queue_heapq import PQLazyHeap
+from .indexed_heap import IndexedMinHeap
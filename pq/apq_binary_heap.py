@@ -1,5 +1,7 @@
 class Element:
     """A key, value and index."""
+    __slots__ = ('_key', '_value', '_index')
+
     def __init__(self, k, v, i):
         # O(1)
         self._key = k
@@ -0,0 +1,189 @@
+class Element:
+    """A key, value, bucket and index within the bucket."""
+    __slots__ = ('_key', '_value', '_bucket', '_index')
+
+    def __init__(self, k, v, b, i):
+        # O(1)
+        self._key = k
+        self._value = v
+        self._bucket = b
+        self._index = i
+
+    # O(1)
+    def __eq__(self, other):
+        return self._key == other._key
+
+    # O(1)
+    def __lt__(self, other):
+        return self._key < other._key
+
+    # O(1)
+    def _wipe(self):
+        self._key = None
+        self._value = None
+        self._bucket = None
+        self._index = None
+
+
+class BucketAPQ(object):
+    """
+    Dial's bucket queue, with circular buckets.
+
+    Made for non-negative integer keys that are extracted in monotone order, which is exactly
+    how Dijkstra uses its queue when the edge weights are integers. Every queued key lies in
+    [cursor, cursor + span), where cursor is at or below the smallest queued key, so key % span
+    picks a bucket without collisions. All the elements in one bucket share the same key.
+    remove_min scans forward from the cursor, so with monotone keys the scanning over a whole
+    run costs no more than the largest key.
+
+    The span grows by itself if the queued keys spread wider than it; passing max_weight (the
+    largest edge weight) up front avoids ever having to grow during Dijkstra.
+
+    Use it for Dijkstra over small integer weights; with weights in the tens of thousands the
+    empty buckets make a heap the faster choice.
+    """
+    def __init__(self, max_weight=None):
+        # O(C)
+        self._span = max_weight + 1 if max_weight else 64
+        self._buckets = [[] for _ in range(self._span)]
+        self._cursor = 0
+        self._top = 0   # no queued key is above this
+        self._size = 0
+
+    # O(1)
+    def _check_key(self, key):
+        try:
+            whole = key == int(key)
+        except (OverflowError, ValueError):    # inf and nan
+            whole = False
+        if not whole or key < 0:
+            raise ValueError('BucketAPQ keys must be non-negative integers, got ' + repr(key))
+
+    # O(1), or O(n + C) when the circle has to grow
+    def _make_room(self, key):
+        """
+        Move the cursor down and widen the circle if key would not fit in it.
+        """
+        k = int(key)
+        if not self._size:
+            self._cursor = self._top = k
+        self._cursor = min(self._cursor, k)
+        self._top = max(self._top, k)
+        if self._top - self._cursor >= self._span:
+            self._grow()
+
+    # O(n + C), amortised O(1) over the adds that caused it
+    def _grow(self):
+        """
+        Widen the circle to cover [cursor, top], re-filing every queued element.
+        """
+        elements = [e for bucket in self._buckets for e in bucket]
+        self._span = max(2 * self._span, self._top - self._cursor + 1)
+        self._buckets = [[] for _ in range(self._span)]
+        for e in elements:
+            self._insert(e)
+
+    # O(1)
+    def _insert(self, element):
+        bucket = self._buckets[int(element._key) % self._span]
+        element._bucket = int(element._key) % self._span
+        element._index = len(bucket)
+        bucket.append(element)
+
+    # O(1)
+    def _detach(self, element):
+        """
+        Take element out of its bucket by swapping it with the bucket's last element.
+        """
+        bucket = self._buckets[element._bucket]
+        last = bucket.pop()
+        if last is not element:
+            bucket[element._index] = last
+            last._index = element._index
+
+    # O(1) amortised
+    def add(self, key, item):
+        """
+        add(key, item)
+        Add a new item into the priority queue with priority key,
+        and return its Element in the APQ.
+        """
+        self._check_key(key)
+        self._make_room(key)
+        element = Element(key, item, None, None)
+        self._insert(element)
+        self._size += 1
+        return element
+
+    # O(C) worst-case, O(1) amortised over a Dijkstra run
+    def _advance(self):
+        """
+        Move the cursor forward to the first non-empty bucket.
+        """
+        while not self._buckets[self._cursor % self._span]:
+            self._cursor += 1
+        return self._buckets[self._cursor % self._span]
+
+    # O(1) amortised
+    def min(self):
+        """
+        min()
+        Return the value with the minimum key.
+        """
+        if not self._size:
+            return None
+        return self._advance()[-1]._value
+
+    # O(1) amortised
+    def remove_min(self):
+        """
+        remove_min()
+        Remove and return the value with the minimum key.
+        """
+        if not self._size:
+            return None
+        removed = self._advance().pop()
+        self._size -= 1
+        value = removed._value
+        removed._wipe()
+        return value
+
+    # O(1)
+    def length(self):
+        """
+        length()
+        Return the number of items in the priority queue.
+        """
+        return self._size
+
+    # O(1)
+    def update_key(self, element, newkey):
+        """
+        update_key(element, newkey)
+        Update the key in element to be newkey, moving it to its new bucket.
+        """
+        self._check_key(newkey)
+        self._detach(element)
+        element._key = newkey
+        self._make_room(newkey)
+        self._insert(element)
+
+    # O(1)
+    def get_key(self, element):
+        """
+        get_key(element)
+        Return the current key for element.
+        """
+        return element._key
+
+    # O(1)
+    def remove(self, element):
+        """
+        remove(element)
+        Remove and return the (key, value) pair for this element.
+        """
+        self._detach(element)
+        self._size -= 1
+        key, value = element._key, element._value
+        element._wipe()
+        return (key, value)
@@ -0,0 +1,180 @@
+class Element:
+    """A key, value and index."""
+    __slots__ = ('_key', '_value', '_index')
+
+    def __init__(self, k, v, i):
+        # O(1)
+        self._key = k
+        self._value = v
+        self._index = i
+
+    # O(1)
+    def __eq__(self, other):
+        return self._key == other._key
+
+    # O(1)
+    def __lt__(self, other):
+        return self._key < other._key
+
+    # O(1)
+    def _wipe(self):
+        self._key = None
+        self._value = None
+        self._index = None
+
+
+class APQDaryHeap(object):
+    """
+    Adaptable priority queue as a d-ary heap stored in a list.
+
+    A wider node makes the tree shallower, so add and update_key (which only sift up during
+    Dijkstra) get cheaper, at the cost of comparing d children on the way down in remove_min.
+    d = 4 is a good default for decrease-key-heavy graphs; d = 2 is APQBinaryHeap.
+
+    Sifting moves a "hole" rather than swapping: elements are shifted into it and the moving
+    element is written, and its index updated, once at its final position.
+
+    Use it to compare heap arities - in CPython it is no faster than APQBinaryHeap.
+    """
+    def __init__(self, d=4):
+        # O(1)
+        if d < 2:
+            raise ValueError('APQDaryHeap arity must be at least 2, got ' + repr(d))
+        self._d = d
+        self._data = []  # d-ary heap stored as a list
+
+    # O(log_d n)
+    def _sift_up(self, index):
+        """
+        Move the element at index up until its parent is no larger.
+        """
+        data = self._data
+        d = self._d
+        element = data[index]
+        key = element._key
+        while index > 0:
+            parent = (index - 1) // d
+            if key < data[parent]._key:
+                data[index] = data[parent]
+                data[index]._index = index
+                index = parent
+            else:
+                break
+        data[index] = element
+        element._index = index
+
+    # O(d log_d n)
+    def _sift_down(self, index):
+        """
+        Move the element at index down until no child is smaller.
+        """
+        data = self._data
+        d = self._d
+        n = len(data)
+        element = data[index]
+        key = element._key
+        while True:
+            first = d * index + 1
+            if first >= n:
+                break
+            smallest = first
+            smallest_key = data[first]._key
+            for child in range(first + 1, min(first + d, n)):
+                if data[child]._key < smallest_key:
+                    smallest = child
+                    smallest_key = data[child]._key
+            if smallest_key < key:
+                data[index] = data[smallest]
+                data[index]._index = index
+                index = smallest
+            else:
+                break
+        data[index] = element
+        element._index = index
+
+    # O(log_d n)
+    def add(self, key, item):
+        """
+        add(key, item)
+        Add a new item into the priority queue with priority key,
+        and return its Element in the APQ.
+        """
+        element = Element(key, item, len(self._data))
+        self._data.append(element)
+        self._sift_up(element._index)
+        return element
+
+    # O(1)
+    def min(self):
+        """
+        min()
+        Return the value with the minimum key.
+        """
+        if not self._data:
+            return None
+        return self._data[0]._value
+
+    # O(d log_d n)
+    def remove_min(self):
+        """
+        remove_min()
+        Remove and return the value with the minimum key.
+        """
+        if not self._data:
+            return None
+        removed = self._data[0]
+        last = self._data.pop()
+        if self._data:
+            self._data[0] = last
+            last._index = 0
+            self._sift_down(0)
+        value = removed._value
+        removed._wipe()
+        return value
+
+    # O(1)
+    def length(self):
+        """
+        length()
+        Return the number of items in the priority queue.
+        """
+        return len(self._data)
+
+    # O(log_d n) to decrease, O(d log_d n) to increase
+    def update_key(self, element, newkey):
+        """
+        update_key(element, newkey)
+        Update the key in element to be newkey, and rebalance the APQ.
+        """
+        oldkey = element._key
+        element._key = newkey
+        if newkey < oldkey:
+            self._sift_up(element._index)
+        else:
+            self._sift_down(element._index)
+
+    # O(1)
+    def get_key(self, element):
+        """
+        get_key(element)
+        Return the current key for element.
+        """
+        return element._key
+
+    # O(d log_d n)
+    def remove(self, element):
+        """
+        remove(element)
+        Remove and return the (key, value) pair for this element,
+        and rebalance the APQ.
+        """
+        index = element._index
+        last = self._data.pop()
+        if last is not element:
+            self._data[index] = last
+            last._index = index
+            self._sift_up(index)
+            self._sift_down(last._index)
+        key, value = element._key, element._value
+        element._wipe()
+        return (key, value)
@@ -0,0 +1,193 @@
+class Element:
+    """A key and value, plus the links that place it in the pairing heap."""
+    __slots__ = ('_key', '_value', '_child', '_sibling', '_prev')
+
+    def __init__(self, k, v):
+        # O(1)
+        self._key = k
+        self._value = v
+        self._child = None     # first (leftmost) child
+        self._sibling = None   # next sibling to the right
+        self._prev = None      # left sibling, or the parent if this is the first child
+
+    # O(1)
+    def __eq__(self, other):
+        return self._key == other._key
+
+    # O(1)
+    def __lt__(self, other):
+        return self._key < other._key
+
+    # O(1)
+    def _wipe(self):
+        self._key = None
+        self._value = None
+        self._child = None
+        self._sibling = None
+        self._prev = None
+
+
+class APQPairingHeap(object):
+    """
+    Adaptable priority queue as a pairing heap - a heap-ordered multiway tree.
+
+    add and a decreasing update_key just cut a subtree and meld it with the root, so they are
+    O(1); remove_min does the work, pairing up the root's children in two passes, at O(log n)
+    amortised. That suits Dijkstra on graphs where most relaxations are decrease-keys.
+    """
+    def __init__(self):
+        # O(1)
+        self._root = None
+        self._size = 0
+
+    # O(1)
+    def _meld(self, a, b):
+        """
+        Link two heap roots, making the larger-keyed one the first child of the other.
+        """
+        if b._key < a._key:
+            a, b = b, a
+        b._sibling = a._child
+        if a._child is not None:
+            a._child._prev = b
+        b._prev = a
+        a._child = b
+        return a
+
+    # O(1)
+    def _cut(self, element):
+        """
+        Detach element (and its subtree) from its parent or left sibling.
+        """
+        if element._prev._child is element:
+            element._prev._child = element._sibling
+        else:
+            element._prev._sibling = element._sibling
+        if element._sibling is not None:
+            element._sibling._prev = element._prev
+        element._prev = None
+        element._sibling = None
+
+    # O(log n) amortised
+    def _merge_pairs(self, first):
+        """
+        Two-pass pairing: meld the children left to right in pairs, then meld the pairs
+        right to left into one tree. Returns the new root, or None if there were no children.
+        """
+        pairs = []
+        while first is not None:
+            a = first
+            b = a._sibling
+            if b is None:
+                a._prev = None
+                pairs.append(a)
+                break
+            first = b._sibling
+            a._prev = a._sibling = None
+            b._prev = b._sibling = None
+            pairs.append(self._meld(a, b))
+        if not pairs:
+            return None
+        root = pairs.pop()
+        while pairs:
+            root = self._meld(pairs.pop(), root)
+        return root
+
+    # O(1)
+    def add(self, key, item):
+        """
+        add(key, item)
+        Add a new item into the priority queue with priority key,
+        and return its Element in the APQ.
+        """
+        element = Element(key, item)
+        self._root = element if self._root is None else self._meld(self._root, element)
+        self._size += 1
+        return element
+
+    # O(1)
+    def min(self):
+        """
+        min()
+        Return the value with the minimum key.
+        """
+        if self._root is None:
+            return None
+        return self._root._value
+
+    # O(log n) amortised
+    def remove_min(self):
+        """
+        remove_min()
+        Remove and return the value with the minimum key.
+        """
+        if self._root is None:
+            return None
+        removed = self._root
+        self._root = self._merge_pairs(removed._child)
+        self._size -= 1
+        value = removed._value
+        removed._wipe()
+        return value
+
+    # O(1)
+    def length(self):
+        """
+        length()
+        Return the number of items in the priority queue.
+        """
+        return self._size
+
+    # O(1) amortised for a decrease, O(log n) amortised for an increase
+    def update_key(self, element, newkey):
+        """
+        update_key(element, newkey)
+        Update the key in element to be newkey, and rebalance the APQ.
+        """
+        oldkey = element._key
+        element._key = newkey
+        if element is self._root:
+            if newkey > oldkey:
+                # the root may no longer be the minimum - re-pair its children under it
+                children = self._merge_pairs(element._child)
+                element._child = None
+                self._root = element if children is None else self._meld(element, children)
+            return
+        if newkey < oldkey:
+            self._cut(element)
+            self._root = self._meld(self._root, element)
+        elif newkey > oldkey:
+            # children may now be smaller than element, so pull them out and re-meld
+            self._cut(element)
+            children = self._merge_pairs(element._child)
+            element._child = None
+            self._root = self._meld(self._root, element)
+            if children is not None:
+                self._root = self._meld(self._root, children)
+
+    # O(1)
+    def get_key(self, element):
+        """
+        get_key(element)
+        Return the current key for element.
+        """
+        return element._key
+
+    # O(log n) amortised
+    def remove(self, element):
+        """
+        remove(element)
+        Remove and return the (key, value) pair for this element,
+        and rebalance the APQ.
+        """
+        if element is self._root:
+            self._root = self._merge_pairs(element._child)
+        else:
+            self._cut(element)
+            children = self._merge_pairs(element._child)
+            if children is not None:
+                self._root = self._meld(self._root, children)
+        self._size -= 1
+        key, value = element._key, element._value
+        element._wipe()
+        return (key, value)
@@ -0,0 +1,175 @@
+class Element:
+    """A key, value, bucket and index within the bucket."""
+    __slots__ = ('_key', '_value', '_bucket', '_index')
+
+    def __init__(self, k, v, b, i):
+        # O(1)
+        self._key = k
+        self._value = v
+        self._bucket = b
+        self._index = i
+
+    # O(1)
+    def __eq__(self, other):
+        return self._key == other._key
+
+    # O(1)
+    def __lt__(self, other):
+        return self._key < other._key
+
+    # O(1)
+    def _wipe(self):
+        self._key = None
+        self._value = None
+        self._bucket = None
+        self._index = None
+
+
+class RadixHeapAPQ(object):
+    """
+    A radix heap - a monotone priority queue for non-negative integer keys.
+
+    Keys must never go below the last key removed (self._last), which holds for Dijkstra with
+    non-negative integer weights. Bucket 0 holds keys equal to _last, and bucket i holds keys
+    whose highest bit differing from _last is bit i-1. remove_min empties the lowest non-empty
+    bucket into lower ones; each element can only move down O(log C) times, so every operation
+    is O(1) amortised for a fixed key range.
+    """
+    def __init__(self):
+        # O(1)
+        self._buckets = [[]]
+        self._last = 0
+        self._size = 0
+
+    # O(1)
+    def _bucket_for(self, key):
+        return (int(key) ^ self._last).bit_length()
+
+    # O(1) amortised
+    def _insert(self, element):
+        b = self._bucket_for(element._key)
+        while b >= len(self._buckets):
+            self._buckets.append([])
+        bucket = self._buckets[b]
+        element._bucket = b
+        element._index = len(bucket)
+        bucket.append(element)
+
+    # O(1)
+    def _detach(self, element):
+        """
+        Take element out of its bucket by swapping it with the bucket's last element.
+        """
+        bucket = self._buckets[element._bucket]
+        last = bucket.pop()
+        if last is not element:
+            bucket[element._index] = last
+            last._index = element._index
+
+    # O(1)
+    def _check_key(self, key):
+        try:
+            whole = key == int(key)
+        except (OverflowError, ValueError):    # inf and nan
+            whole = False
+        if not whole or key < 0:
+            raise ValueError('RadixHeapAPQ keys must be non-negative integers, got ' + repr(key))
+        if self._size and key < self._last:
+            raise ValueError('RadixHeapAPQ keys must not go below the last key removed ('
+                             + repr(self._last) + '), got ' + repr(key))
+
+    # O(log C) amortised
+    def add(self, key, item):
+        """
+        add(key, item)
+        Add a new item into the priority queue with priority key,
+        and return its Element in the APQ.
+        """
+        self._check_key(key)
+        if not self._size:
+            self._last = 0   # nothing queued, so nothing to stay monotone with
+        element = Element(key, item, None, None)
+        self._insert(element)
+        self._size += 1
+        return element
+
+    # O(log C) amortised
+    def _settle(self):
+        """
+        Make sure bucket 0 is non-empty, by redistributing the lowest non-empty bucket around
+        its smallest key. Everything in it lands in a strictly lower bucket.
+        """
+        if self._buckets[0]:
+            return self._buckets[0]
+        b = 1
+        while not self._buckets[b]:
+            b += 1
+        bucket = self._buckets[b]
+        self._buckets[b] = []
+        self._last = int(min(bucket)._key)
+        for element in bucket:
+            self._insert(element)
+        return self._buckets[0]
+
+    # O(log C) amortised
+    def min(self):
+        """
+        min()
+        Return the value with the minimum key.
+        """
+        if not self._size:
+            return None
+        return self._settle()[-1]._value
+
+    # O(log C) amortised
+    def remove_min(self):
+        """
+        remove_min()
+        Remove and return the value with the minimum key.
+        """
+        if not self._size:
+            return None
+        removed = self._settle().pop()
+        self._size -= 1
+        value = removed._value
+        removed._wipe()
+        return value
+
+    # O(1)
+    def length(self):
+        """
+        length()
+        Return the number of items in the priority queue.
+        """
+        return self._size
+
+    # O(1)
+    def update_key(self, element, newkey):
+        """
+        update_key(element, newkey)
+        Update the key in element to be newkey, moving it to its new bucket.
+        """
+        self._check_key(newkey)
+        self._detach(element)
+        element._key = newkey
+        self._insert(element)
+
+    # O(1)
+    def get_key(self, element):
+        """
+        get_key(element)
+        Return the current key for element.
+        """
+        return element._key
+
+    # O(1)
+    def remove(self, element):
+        """
+        remove(element)
+        Remove and return the (key, value) pair for this element.
+        """
+        self._detach(element)
+        self._size -= 1
+        key, value = element._key, element._value
+        element._wipe()
+        return (key, value)
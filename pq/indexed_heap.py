@@ -0,0 +1,196 @@
+from array import array
+
+
+class IndexedMinHeap(object):
+    """
+    A binary min-heap over dense integer ids (e.g. CSRGraph vertex ids), kept in flat arrays.
+
+    There are no Element objects. Three parallel arrays do all the work:
+        _keys[id]  -- the key of id (array('d'), indexed by id)
+        _heap[i]   -- the id in heap slot i (array('q'))
+        _pos[id]   -- the heap slot of id, or -1 if id is not queued (array('q'))
+    so adding, decreasing and removing never allocate a per-item object. The id arrays grow by
+    doubling when a larger id shows up; pass capacity (e.g. graph.num_vertices()) to size them
+    once up front.
+
+    It also speaks the APQ API, with the id itself as the element handle - add(key, id) returns
+    id and update_key(id, newkey) re-keys it - so dijkstra_source_to_dest can use it on graphs
+    whose vertices are int ids (CSRGraph, ImplicitGridGraph). It cannot queue the Vertex objects
+    of a Graph, and raises TypeError if asked to.
+
+    Use it to queue many int ids in little memory and few objects; it is no faster than
+    APQBinaryHeap.
+    """
+    def __init__(self, capacity=0):
+        # O(capacity)
+        self._keys = array('d', [0.0]) * capacity
+        self._pos = array('q', [-1]) * capacity
+        self._heap = array('q')
+
+    # O(1) amortised
+    def _ensure(self, vertex_id):
+        """
+        Grow the per-id arrays so vertex_id is a valid index.
+        """
+        size = len(self._pos)
+        try:
+            grow = vertex_id >= size
+        except TypeError:
+            raise TypeError('IndexedMinHeap queues int ids, not ' + type(vertex_id).__name__
+                            + ' - use it with a CSRGraph or ImplicitGridGraph') from None
+        if grow:
+            extra = max(size, vertex_id + 1 - size, 16)
+            self._keys.extend(array('d', [0.0]) * extra)
+            self._pos.extend(array('q', [-1]) * extra)
+
+    # O(log n)
+    def _sift_up(self, slot):
+        heap, pos, keys = self._heap, self._pos, self._keys
+        vertex_id = heap[slot]
+        key = keys[vertex_id]
+        while slot > 0:
+            parent = (slot - 1) >> 1
+            parent_id = heap[parent]
+            if key < keys[parent_id]:
+                heap[slot] = parent_id
+                pos[parent_id] = slot
+                slot = parent
+            else:
+                break
+        heap[slot] = vertex_id
+        pos[vertex_id] = slot
+
+    # O(log n)
+    def _sift_down(self, slot):
+        heap, pos, keys = self._heap, self._pos, self._keys
+        n = len(heap)
+        vertex_id = heap[slot]
+        key = keys[vertex_id]
+        while True:
+            child = 2 * slot + 1
+            if child >= n:
+                break
+            child_id = heap[child]
+            if child + 1 < n and keys[heap[child + 1]] < keys[child_id]:
+                child += 1
+                child_id = heap[child]
+            if keys[child_id] < key:
+                heap[slot] = child_id
+                pos[child_id] = slot
+                slot = child
+            else:
+                break
+        heap[slot] = vertex_id
+        pos[vertex_id] = slot
+
+    # O(1)
+    def __contains__(self, vertex_id):
+        return vertex_id < len(self._pos) and self._pos[vertex_id] >= 0
+
+    # O(log n)
+    def decrease_key(self, vertex_id, key):
+        """
+        decrease_key(vertex_id, key)
+        Queue vertex_id with key, or lower its key if it is already queued with a higher one.
+        Return True if anything changed.
+        """
+        self._ensure(vertex_id)
+        slot = self._pos[vertex_id]
+        if slot < 0:
+            self._keys[vertex_id] = key
+            self._heap.append(vertex_id)
+            self._sift_up(len(self._heap) - 1)
+            return True
+        if key < self._keys[vertex_id]:
+            self._keys[vertex_id] = key
+            self._sift_up(slot)
+            return True
+        return False
+
+    # O(log n)
+    def add(self, key, item):
+        """
+        add(key, item)
+        Add the integer id item with priority key, and return item as its handle.
+        """
+        self._ensure(item)
+        if self._pos[item] >= 0:
+            raise ValueError('id ' + repr(item) + ' is already in the IndexedMinHeap')
+        self._keys[item] = key
+        self._heap.append(item)
+        self._sift_up(len(self._heap) - 1)
+        return item
+
+    # O(1)
+    def min(self):
+        """
+        min()
+        Return the id with the minimum key.
+        """
+        if not self._heap:
+            return None
+        return self._heap[0]
+
+    # O(log n)
+    def remove_min(self):
+        """
+        remove_min()
+        Remove and return the id with the minimum key.
+        """
+        heap = self._heap
+        if not heap:
+            return None
+        top = heap[0]
+        last = heap.pop()
+        self._pos[top] = -1
+        if heap:
+            heap[0] = last
+            self._pos[last] = 0
+            self._sift_down(0)
+        return top
+
+    # O(1)
+    def length(self):
+        """
+        length()
+        Return the number of ids in the priority queue.
+        """
+        return len(self._heap)
+
+    # O(log n)
+    def update_key(self, element, newkey):
+        """
+        update_key(element, newkey)
+        Update the key of the queued id element to be newkey, and rebalance.
+        """
+        oldkey = self._keys[element]
+        self._keys[element] = newkey
+        if newkey < oldkey:
+            self._sift_up(self._pos[element])
+        else:
+            self._sift_down(self._pos[element])
+
+    # O(1)
+    def get_key(self, element):
+        """
+        get_key(element)
+        Return the current key for the id element.
+        """
+        return self._keys[element]
+
+    # O(log n)
+    def remove(self, element):
+        """
+        remove(element)
+        Remove the queued id element and return its (key, id) pair.
+        """
+        heap = self._heap
+        slot = self._pos[element]
+        last = heap.pop()
+        self._pos[element] = -1
+        if last != element:
+            heap[slot] = last
+            self._pos[last] = slot
+            self._sift_up(slot)
+            self._sift_down(self._pos[last])
+        return (self._keys[element], element)
@@ -11,6 +11,8 @@ class PQBinaryHeap:
     class Element:
         """ An element with a key and value. """
         
+        __slots__ = ('_key', '_value', '_index')
+
         def __init__(self, k, v):
             self._key = k
             self._value = v
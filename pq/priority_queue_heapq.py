@@ -0,0 +1,97 @@
+import heapq
+from itertools import count
+
+
+class PQLazyHeap(object):
+    """
+    A non-adaptable priority queue on top of the C-accelerated heapq module.
+
+    There is no update_key. Adding an item that is already queued with a lower priority just
+    pushes a second entry, and the old one is left in the heap as a stale duplicate. The queue
+    remembers the current priority of every live item, so remove_min skips stale entries and
+    never hands back the same item twice. Once the stale entries outnumber the live ones by
+    compact_ratio (and there are at least min_compact of them) the heap is rebuilt without them,
+    so memory stays proportional to the live items.
+
+    Items must be hashable - vertices and vertex ids both are.
+    """
+    def __init__(self, compact_ratio=1.0, min_compact=1024):
+        # O(1)
+        self._heap = []      # (priority, tie-breaker, item) triples, stale ones included
+        self._live = {}      # item -> its one live (priority, tie-breaker, item) entry
+        self._counter = count()   # keeps heapq from ever comparing two items
+        self._stale = 0
+        self._compact_ratio = compact_ratio
+        self._min_compact = min_compact
+
+    # O(log n)
+    def add(self, priority, item):
+        """
+        add(priority, item)
+        Queue item with priority. If item is already queued, the lower of the two
+        priorities wins.
+        """
+        current = self._live.get(item)
+        if current is not None:
+            if current[0] <= priority:
+                return
+            self._stale += 1
+        entry = (priority, next(self._counter), item)
+        self._live[item] = entry
+        heapq.heappush(self._heap, entry)
+
+    # O(n), amortised O(1) over the adds that made the stale entries
+    def _compact(self):
+        """
+        Rebuild the heap from just the live entries.
+        """
+        live = self._live
+        self._heap = [entry for entry in self._heap if live.get(entry[2]) is entry]
+        heapq.heapify(self._heap)
+        self._stale = 0
+
+    # O(log n) amortised
+    def _drop_stale(self):
+        """
+        Pop stale entries off the top until a live one is there.
+        """
+        heap = self._heap
+        live = self._live
+        while heap and live.get(heap[0][2]) is not heap[0]:
+            heapq.heappop(heap)
+            self._stale -= 1
+
+    # O(log n) amortised
+    def remove_min(self):
+        """
+        remove_min()
+        Remove and return the item with the lowest priority.
+        """
+        self._drop_stale()
+        if not self._heap:
+            return None
+        item = heapq.heappop(self._heap)[2]
+        del self._live[item]
+        if (self._stale >= self._min_compact
+                and self._stale > self._compact_ratio * len(self._live)):
+            self._compact()
+        return item
+
+    # O(log n) amortised
+    def min(self):
+        """
+        min()
+        Return the item with the lowest priority, without removing it.
+        """
+        self._drop_stale()
+        if not self._heap:
+            return None
+        return self._heap[0][2]
+
+    # O(1)
+    def length(self):
+        """
+        length()
+        Return the number of live items in the priority queue.
+        """
+        return len(self._live)
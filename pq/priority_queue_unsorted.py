@@ -1,4 +1,6 @@
 class Element(object):
+    __slots__ = ('_priority', '_element')
+
     def __init__(self, priority, item):
         self._priority = int(priority)
         self._element = item
@@ -0,0 +1,55 @@
+import sys
+import tracemalloc
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, PQBinaryHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+''' Memory report - peak bytes allocated per grid size, measured with tracemalloc.
+
+    For each grid size:
+        build the grid graph                       -> peak bytes for the Vertex/Edge objects
+        run a full dijkstra_source_to_dest on it   -> peak bytes on top, mostly the
+                                                      closed dictionary and the queue Elements
+    The PQBinaryHeap column pushes one Element per vertex through the plain binary heap.
+
+    Output Format:
+    Grid Size | Build Peak (MB) | Dijkstra APQBinaryHeap Peak (MB) | PQBinaryHeap Elements Peak (MB)
+'''
+
+
+def measure_peak(func, *args):
+    '''
+    Runs func(*args) and returns (its result, the peak bytes traced while it ran).
+    '''
+    tracemalloc.reset_peak()
+    start = tracemalloc.get_traced_memory()[0]
+    result = func(*args)
+    return result, tracemalloc.get_traced_memory()[1] - start
+
+
+def fill_pq_binary_heap(graph):
+    pq = PQBinaryHeap()
+    for i, v in enumerate(graph.vertices()):
+        pq.add(i, v)
+    return pq
+
+
+def memory_report(sizes):
+    tracemalloc.start()
+    print("Grid Size | Build Peak (MB) | Dijkstra APQBinaryHeap Peak (MB) | "
+          "PQBinaryHeap Elements Peak (MB)")
+    for size in sizes:
+        graph, build_peak = measure_peak(generate_weighted_grid_graph, size, size, size)
+        start = graph.get_vertex_by_label((0, 0))
+        closed, run_peak = measure_peak(dijkstra_source_to_dest, start, None, graph,
+                                        APQBinaryHeap)
+        pq, pq_peak = measure_peak(fill_pq_binary_heap, graph)
+        print(f"{size}x{size} | {build_peak / 2 ** 20:.2f} | {run_peak / 2 ** 20:.2f} | "
+              f"{pq_peak / 2 ** 20:.2f}")
+        del graph, closed, pq
+    tracemalloc.stop()
+
+
+if __name__ == "__main__":
+    sizes = [int(arg) for arg in sys.argv[1:]] or [50, 100, 200, 300]
+    memory_report(sizes)
@@ -1,44 +1,15 @@
 from pq import APQUnsortedList
-from graph import Graph
+from graph import read_graph
 from dijkstra_algos.dijkstra import *
 
 
 def graphreader(filename):
     """ Read and return the route map in filename. """
-    graph = Graph()
-
-    with open(filename, 'r') as file:  # Ensures the file is closed properly
-        entry = file.readline().strip()  # Read first entry (Node or Edge)
-        num_vertices = 0
-
-        # Read Nodes
-        while entry == 'Node':
-            num_vertices += 1
-            node_id = int(file.readline().split()[1])
-            graph.add_vertex(node_id)
-            entry = file.readline().strip()  # Read next line
-
-        print(f"GraphReader - Read {num_vertices} vertices and added into the graph")
-
-        num_edges = 0
-
-        # Read Edges
-        while entry == 'Edge':
-            num_edges += 1
-            source = int(file.readline().split()[1])
-            target = int(file.readline().split()[1])
-            length = float(file.readline().split()[1])
-
-            sv = graph.get_vertex_by_label(source)
-            tv = graph.get_vertex_by_label(target)
-            graph.add_edge(sv, tv, length)
-
-            file.readline()  # Read the one-way data
-            entry = file.readline().strip()  # Read next entry (Node or Edge)
-
-        print(f"GraphReader - Read {num_edges} edges and added into the graph")
-
-    print(graph)
+    # read_graph does the parsing in big chunks - it used to be a readline() per field here,
+    # followed by a print(graph) that got quadratically slow on big files.
+    graph = read_graph(filename)
+    print(f"GraphReader - Read {graph.num_vertices()} vertices and added into the graph")
+    print(f"GraphReader - Read {graph.num_edges()} edges and added into the graph")
     return graph
 
 
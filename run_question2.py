@@ -1,46 +1,9 @@
-import random
 from graph import Graph
+from grid_graph import generate_weighted_grid_graph
 from dijkstra_algos.dijkstra import *
 from pq import APQUnsortedList
 
 
-def generate_weighted_grid_graph(n, m):
-    """
-    Generates a weighted grid graph of size n x m.
-
-    Parameters:
-    n (int): Number of rows in the grid.
-    m (int): Number of columns in the grid.
-
-    Returns:
-    Graph: An instance of a grid-graph representing the weighted grid.
-
-    Description:
-    The function constructs a grid graph. NOTE: vertexs have neighbours to
-    the south and east - 2 max. And only have a 1 predecessor point to it -
-    this predecessor is either located to the north or west
-    """
-
-    graph = Graph()
-    max_weight = max(n, m) // 2
-
-    vertices = {}
-    for i in range(n):
-        for j in range(m):
-            # Going to use the (i,j) as a tuple to identify each vertex
-            vertices[(i, j)] = graph.add_vertex((i, j))
-
-    for i in range(n):
-        for j in range(m):
-            if i + 1 < n:
-                weight = random.randint(1, max_weight)
-                graph.add_edge(vertices[(i, j)], vertices[(i + 1, j)], weight)
-            if j + 1 < m:
-                weight = random.randint(1, max_weight)
-                graph.add_edge(vertices[(i, j)], vertices[(i, j + 1)], weight)
-
-    return graph
-
 def get_shortest_path(start, end, predecessors):
     """ Reconstruct and print the shortest path from start to end using the predecessors dictionary. """
     path = []
@@ -55,7 +18,7 @@ def get_shortest_path(start, end, predecessors):
 
 if __name__ == "__main__":
     n, m = 4, 4
-    grid_graph = generate_weighted_grid_graph(n, m)
+    grid_graph = generate_weighted_grid_graph(n, m, graph_class=Graph)
     print(grid_graph)
     print("===================")
     # Using the i,j tuple as the vertex identifier now
@@ -0,0 +1,97 @@
+import gc
+import random
+import sys
+import time
+import tracemalloc
+from graph import Graph
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, APQDaryHeap, BucketAPQ, IndexedMinHeap, PQLazyHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+''' Queue report - how long a full dijkstra_source_to_dest takes with each priority queue.
+
+    Graphs:
+        grid (Graph)        -> an n x n grid_graph grid, weights 1..n/2, as built
+        grid (CSR)          -> the same grid after freeze()
+        random w<=1000      -> 20k vertices, 200k random edges, integer weights 1..1000, frozen
+        random w<=100000    -> the same with integer weights 1..100000
+    Each time is the best of three runs from the same start vertex. IndexedMinHeap only
+    queues int ids, so it has no time on the object Graph.
+
+    A second table queues 90k ids at once and reports the peak bytes and how many objects
+    the garbage collector has to walk while they are queued.
+
+    Output Format:
+    Queue | grid (Graph) (s) | grid (CSR) (s) | random w<=1000 (s) | random w<=100000 (s)
+    Queue | 90k queued Peak (MB) | GC Objects | GC Pass (ms)
+'''
+
+QUEUES = [APQBinaryHeap, APQDaryHeap, BucketAPQ, IndexedMinHeap, PQLazyHeap]
+
+
+def random_graph(n, m, max_weight, seed):
+    rng = random.Random(seed)
+    graph = Graph()
+    vertices = graph.add_vertices_from(range(n))
+    starts = [vertices[rng.randrange(n)] for _ in range(m)]
+    ends = [vertices[rng.randrange(n)] for _ in range(m)]
+    graph.add_edges_from(starts, ends, [rng.randint(1, max_weight) for _ in range(m)])
+    return graph.freeze()
+
+
+def best_time(graph, start, pq_class, runs=3):
+    best = float('inf')
+    for _ in range(runs):
+        begin = time.perf_counter()
+        dijkstra_source_to_dest(start, None, graph, pq_class)
+        best = min(best, time.perf_counter() - begin)
+    return best
+
+
+def time_report(size):
+    grid = generate_weighted_grid_graph(size, size, seed=size)
+    csr = grid.freeze()
+    graphs = [(grid, grid.get_vertex_by_label((0, 0))), (csr, 0),
+              (random_graph(20000, 200000, 1000, 1), 0),
+              (random_graph(20000, 200000, 100000, 1), 0)]
+    print(f"Queue | grid {size}x{size} (Graph) (s) | grid {size}x{size} (CSR) (s) | "
+          "random w<=1000 (s) | random w<=100000 (s)")
+    for pq_class in QUEUES:
+        times = []
+        for graph, start in graphs:
+            if pq_class is IndexedMinHeap and graph is grid:
+                times.append("-")
+            else:
+                times.append(f"{best_time(graph, start, pq_class):.2f}")
+        print(pq_class.__name__ + " | " + " | ".join(times))
+
+
+def fill(pq_class, n):
+    pq = pq_class()
+    for i in range(n):
+        pq.add(float(n - i), i)
+    return pq
+
+
+def memory_report(n):
+    print("Queue | 90k queued Peak (MB) | GC Objects | GC Pass (ms)")
+    for pq_class in QUEUES:
+        gc.collect()
+        tracked = len(gc.get_objects())
+        tracemalloc.start()
+        pq = fill(pq_class, n)
+        peak = tracemalloc.get_traced_memory()[1]
+        tracemalloc.stop()
+        objects = len(gc.get_objects()) - tracked
+        begin = time.perf_counter()
+        gc.collect()
+        collect = time.perf_counter() - begin
+        print(f"{pq_class.__name__} | {peak / 2 ** 20:.2f} | {objects} | {collect * 1000:.1f}")
+        del pq
+
+
+if __name__ == "__main__":
+    size = int(sys.argv[1]) if len(sys.argv) > 1 else 300
+    time_report(size)
+    print()
+    memory_report(90000)
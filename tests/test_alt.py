@@ -0,0 +1,108 @@
+import os
+import random
+import tempfile
+import unittest
+from graph import Graph
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, PriorityQueue
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.alt import ALTIndex
+
+
+class TestALTIndex(unittest.TestCase):
+    def setUp(self):
+        random.seed(5)
+        self.graph = generate_weighted_grid_graph(12, 12)
+        self.start = self.graph.get_vertex_by_label((6, 6))
+        self.expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+        self.targets = [self.graph.get_vertex_by_label(label)
+                        for label in [(0, 0), (11, 11), (6, 7), (2, 10)]]
+
+    def check_queries(self, index, **kwargs):
+        for end in self.targets:
+            closed = index.query(self.start, end, **kwargs)
+            self.assertEqual(closed[end][0], self.expected[end][0])
+
+    def test_farthest_selection(self):
+        index = ALTIndex.build(self.graph, 4, seed=1)
+        self.assertEqual(len(index.landmarks()), 4)
+        self.check_queries(index)
+        self.check_queries(index, pq_class=PriorityQueue, active=2)
+
+    def test_avoid_selection(self):
+        index = ALTIndex.build(self.graph, 4, selection='avoid', seed=1)
+        self.assertEqual(len(set(index.landmarks())), 4)
+        self.check_queries(index)
+
+    def test_avoid_selection_zero_weight_edges(self):
+        # A zero weight edge puts a child at the same distance as its parent.
+        graph = Graph()
+        vertices = graph.add_vertices_from(range(8))
+        graph.add_edges_from(vertices[:-1], vertices[1:], [1, 0, 2, 0, 0, 3, 1])
+        start, end = vertices[0], vertices[-1]
+        expected = dijkstra_source_to_dest(start, None, graph, APQBinaryHeap)[end][0]
+        for seed in range(10):
+            index = ALTIndex.build(graph, 3, selection='avoid', seed=seed)
+            self.assertEqual(index.query(start, end)[end][0], expected)
+
+    def test_lower_bound_is_admissible(self):
+        index = ALTIndex.build(self.graph, 3, seed=2)
+        for v, (distance, predecessor) in self.expected.items():
+            self.assertLessEqual(index.lower_bound(self.start, v), distance)
+
+    def test_save_and_load(self):
+        index = ALTIndex.build(self.graph, 3, seed=3)
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            index.save(filename)
+            loaded = ALTIndex.load(filename, self.graph)
+        finally:
+            os.remove(filename)
+        self.assertEqual(loaded.landmarks(), index.landmarks())
+        self.check_queries(loaded)
+
+    def test_load_rejects_other_files(self):
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            # a pickle, as version 1 wrote - refused, not unpickled
+            with open(filename, 'wb') as file:
+                file.write(b'\x80\x05\x95' + bytes(40))
+            with self.assertRaises(ValueError):
+                ALTIndex.load(filename, self.graph)
+            ALTIndex.build(self.graph, 2, seed=4).save(filename)
+            with open(filename, 'ab') as file:
+                file.write(b'extra')
+            with self.assertRaises(ValueError):
+                ALTIndex.load(filename, self.graph)
+        finally:
+            os.remove(filename)
+
+    def test_save_and_load_repeated_labels(self):
+        graph = Graph()
+        a, b, c, d = graph.add_vertices_from(['x', 'y', 'x', 'z'])
+        graph.add_edges_from([a, b, c], [b, c, d], [1, 1, 1])
+        graph.add_edge(a, d, 10)
+        index = ALTIndex.build(graph, 2, seed=1)
+        fd, filename = tempfile.mkstemp()
+        os.close(fd)
+        try:
+            index.save(filename)
+            loaded = ALTIndex.load(filename, graph)
+            self.assertEqual(loaded.query(d, a)[a][0], 3)
+            # Same labels in another order cannot be matched up row by row.
+            other = Graph()
+            other.add_vertices_from(['y', 'x', 'x', 'z'])
+            with self.assertRaises(ValueError):
+                ALTIndex.load(filename, other)
+        finally:
+            os.remove(filename)
+
+    def test_bad_selection(self):
+        with self.assertRaises(ValueError):
+            ALTIndex.build(self.graph, 2, selection='random')
+
+
+if __name__ == "__main__":
+    unittest.main()
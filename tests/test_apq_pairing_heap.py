@@ -0,0 +1,78 @@
+import random
+import unittest
+from pq.apq_pairing_heap import APQPairingHeap
+
+
+class TestAPQPairingHeap(unittest.TestCase):
+    def setUp(self):
+        # O(1): Create a new APQPairingHeap instance before each test.
+        self.apq = APQPairingHeap()
+
+    # O(1)
+    def test_add_and_length(self):
+        self.assertEqual(self.apq.length(), 0)
+        self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.add(15, "c")
+        self.assertEqual(self.apq.length(), 3)
+
+    # O(1)
+    def test_min(self):
+        self.assertIsNone(self.apq.min())
+        self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.add(15, "c")
+        self.assertEqual(self.apq.min(), "b")
+
+    # O(log n)
+    def test_remove_min(self):
+        self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.add(15, "c")
+        self.assertEqual(self.apq.remove_min(), "b")
+        self.assertEqual(self.apq.length(), 2)
+        self.assertEqual(self.apq.min(), "a")
+
+    # O(log n)
+    def test_update_key_and_get_key(self):
+        element = self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        other = self.apq.add(7, "c")
+        self.apq.update_key(element, 2)
+        self.assertEqual(self.apq.get_key(element), 2)
+        self.assertEqual(self.apq.min(), "a")
+        # and back up again, past the others
+        self.apq.update_key(element, 20)
+        self.assertEqual(self.apq.min(), "b")
+        self.apq.update_key(other, 1)
+        self.assertEqual([self.apq.remove_min() for _ in range(3)], ["c", "b", "a"])
+
+    # O(log n)
+    def test_remove_element(self):
+        e1 = self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.add(15, "c")
+        self.assertEqual(self.apq.remove(e1), (10, "a"))
+        self.assertEqual(self.apq.length(), 2)
+        self.assertEqual(self.apq.remove_min(), "b")
+        self.assertEqual(self.apq.remove_min(), "c")
+
+    # O(n log n)
+    def test_heap_sort_with_updates(self):
+        random.seed(1)
+        elements = [self.apq.add(random.randint(0, 1000), i) for i in range(200)]
+        keys = {}
+        for i, element in enumerate(elements):
+            keys[i] = random.randint(0, 1000)
+            self.apq.update_key(element, keys[i])
+        removed = [keys[self.apq.remove_min()] for _ in range(200)]
+        self.assertEqual(removed, sorted(keys.values()))
+
+    # O(1)
+    def test_remove_from_empty(self):
+        self.assertIsNone(self.apq.min())
+        self.assertIsNone(self.apq.remove_min())
+
+
+if __name__ == '__main__':
+    unittest.main()
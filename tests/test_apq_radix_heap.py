@@ -0,0 +1,86 @@
+import random
+import unittest
+from pq.apq_radix_heap import RadixHeapAPQ
+from pq.apq_binary_heap import APQBinaryHeap
+from grid_graph import generate_weighted_grid_graph
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+
+class TestRadixHeapAPQ(unittest.TestCase):
+    def setUp(self):
+        # O(1): Create a new RadixHeapAPQ instance before each test.
+        self.apq = RadixHeapAPQ()
+
+    # O(1)
+    def test_add_and_length(self):
+        self.assertEqual(self.apq.length(), 0)
+        self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.add(15, "c")
+        self.assertEqual(self.apq.length(), 3)
+
+    # O(1)
+    def test_min(self):
+        self.assertIsNone(self.apq.min())
+        self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.add(15, "c")
+        self.assertEqual(self.apq.min(), "b")
+
+    # O(1)
+    def test_remove_min_in_order(self):
+        for key, item in [(10, "a"), (5, "b"), (15, "c"), (5, "d"), (200, "e")]:
+            self.apq.add(key, item)
+        keys = []
+        while self.apq.length() > 0:
+            keys.append(self.apq.remove_min())
+        self.assertEqual(sorted(keys[:2]), ["b", "d"])
+        self.assertEqual(keys[2:], ["a", "c", "e"])
+
+    # O(1)
+    def test_update_key_and_get_key(self):
+        element = self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.update_key(element, 2)
+        self.assertEqual(self.apq.get_key(element), 2)
+        self.assertEqual(self.apq.min(), "a")
+
+    # O(1)
+    def test_remove_element(self):
+        e1 = self.apq.add(10, "a")
+        self.apq.add(5, "b")
+        self.apq.add(15, "c")
+        self.assertEqual(self.apq.remove(e1), (10, "a"))
+        self.assertEqual(self.apq.length(), 2)
+        self.assertEqual(self.apq.remove_min(), "b")
+        self.assertEqual(self.apq.remove_min(), "c")
+
+    # O(1)
+    def test_rejects_non_monotone_and_fractional_keys(self):
+        self.apq.add(10, "a")
+        self.apq.add(12, "b")
+        self.apq.remove_min()
+        with self.assertRaises(ValueError):
+            self.apq.add(3, "c")
+        with self.assertRaises(ValueError):
+            self.apq.add(11.5, "d")
+        with self.assertRaises(ValueError):
+            self.apq.add(float('inf'), "e")
+
+    # O(1)
+    def test_remove_from_empty(self):
+        self.assertIsNone(self.apq.min())
+        self.assertIsNone(self.apq.remove_min())
+
+    def test_dijkstra_matches_binary_heap(self):
+        random.seed(8)
+        graph = generate_weighted_grid_graph(20, 20)
+        start = graph.get_vertex_by_label((10, 10))
+        expected = dijkstra_source_to_dest(start, None, graph, APQBinaryHeap)
+        results = dijkstra_source_to_dest(start, None, graph, RadixHeapAPQ)
+        self.assertEqual({v: d for v, (d, p) in results.items()},
+                         {v: d for v, (d, p) in expected.items()})
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import random
+import unittest
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, APQUnsortedList, PriorityQueue
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest, astar_source_to_dest
+from dijkstra_algos.heuristics import zero_heuristic, grid_manhattan_heuristic, coordinate_heuristic
+
+
+class TestAStar(unittest.TestCase):
+    def setUp(self):
+        random.seed(3)
+        self.graph = generate_weighted_grid_graph(15, 15)
+        self.start = self.graph.get_vertex_by_label((7, 7))
+        self.expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+
+    def test_manhattan_matches_dijkstra(self):
+        heuristic = grid_manhattan_heuristic(self.graph)
+        for pq_class in (APQBinaryHeap, APQUnsortedList, PriorityQueue):
+            for label in [(0, 0), (14, 14), (7, 8), (3, 12)]:
+                end = self.graph.get_vertex_by_label(label)
+                closed = astar_source_to_dest(self.start, end, self.graph, pq_class, heuristic)
+                self.assertEqual(closed[end][0], self.expected[end][0])
+
+    def test_heuristic_settles_no_more_than_dijkstra(self):
+        end = self.graph.get_vertex_by_label((14, 14))
+        plain = astar_source_to_dest(self.start, end, self.graph, APQBinaryHeap, zero_heuristic)
+        guided = astar_source_to_dest(self.start, end, self.graph, APQBinaryHeap,
+                                      grid_manhattan_heuristic(self.graph))
+        self.assertLessEqual(len(guided), len(plain))
+
+    def test_coordinate_heuristic(self):
+        heuristic = coordinate_heuristic(lambda v: v.element(), cost_per_unit=1, norm='manhattan')
+        a = self.graph.get_vertex_by_label((0, 0))
+        b = self.graph.get_vertex_by_label((3, 4))
+        self.assertEqual(heuristic(a, b), 7)
+        euclidean = coordinate_heuristic(lambda v: v.element())
+        self.assertEqual(euclidean(a, b), 5)
+        with self.assertRaises(ValueError):
+            coordinate_heuristic(lambda v: v.element(), norm='chebyshev')
+
+
+if __name__ == "__main__":
+    unittest.main()
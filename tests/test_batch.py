@@ -0,0 +1,66 @@
+import gc
+import random
+import unittest
+from multiprocessing import shared_memory
+from graph import Graph
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, IndexedMinHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.batch import BatchExecutor
+
+
+class TestBatchExecutor(unittest.TestCase):
+    def setUp(self):
+        random.seed(16)
+        self.graph = generate_weighted_grid_graph(10, 10)
+        labels = [((0, 0), (9, 9)), ((5, 5), (0, 9)), ((9, 2), (9, 2)), ((3, 8), (7, 1))]
+        self.queries = [(self.graph.get_vertex_by_label(a), self.graph.get_vertex_by_label(b))
+                        for a, b in labels]
+
+    def test_matches_serial_dijkstra(self):
+        with BatchExecutor(self.graph, processes=2) as executor:
+            results = executor.map(self.queries)
+        for (start, end), (distance, path) in zip(self.queries, results):
+            closed = dijkstra_source_to_dest(start, end, self.graph, APQBinaryHeap)
+            self.assertEqual(distance, closed[end][0])
+            self.assertEqual(path[0], start)
+            self.assertEqual(path[-1], end)
+            total = sum(self.graph.get_edge(u, v).element() for u, v in zip(path, path[1:]))
+            self.assertAlmostEqual(total, distance)
+
+    def test_imap_yields_every_query_once(self):
+        csr = self.graph.freeze()
+        csr_queries = [(csr.get_vertex_by_label(s.element()), csr.get_vertex_by_label(e.element()))
+                       for s, e in self.queries]
+        with BatchExecutor(csr, processes=2, pq_class=IndexedMinHeap) as executor:
+            seen = sorted(index for index, s, e, d, p in executor.imap(csr_queries * 2))
+        self.assertEqual(seen, list(range(2 * len(self.queries))))
+
+    def test_unreachable(self):
+        graph = Graph()
+        a = graph.add_vertex('a')
+        b = graph.add_vertex('b')
+        with BatchExecutor(graph, processes=1) as executor:
+            self.assertEqual(executor.map([(a, b), (a, a)]),
+                             [(float('inf'), None), (0, [a])])
+
+    def test_dropped_executor_frees_shared_memory(self):
+        executor = BatchExecutor(self.graph, processes=1)
+        name = executor._memory.name
+        pool = executor._pool
+        self.assertEqual(executor.map(self.queries[:1])[0][1][0], self.queries[0][0])
+        del executor
+        gc.collect()
+        with self.assertRaises(FileNotFoundError):
+            shared_memory.SharedMemory(name=name)
+        with self.assertRaises(ValueError):
+            pool.apply(abs, (1,))    # the pool was terminated too
+
+    def test_close_twice(self):
+        executor = BatchExecutor(self.graph, processes=1)
+        executor.close()
+        executor.close()
+
+
+if __name__ == "__main__":
+    unittest.main()
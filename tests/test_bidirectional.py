@@ -0,0 +1,46 @@
+import random
+import unittest
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, APQUnsortedList, PriorityQueue
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.bidirectional import bidirectional_dijkstra
+
+
+class TestBidirectionalDijkstra(unittest.TestCase):
+    def setUp(self):
+        random.seed(7)
+        self.graph = generate_weighted_grid_graph(15, 15)
+        self.start = self.graph.get_vertex_by_label((7, 7))
+
+    def path_length(self, closed, end):
+        """ Walk the predecessors back from end, summing real edge weights. """
+        total = 0
+        current = end
+        while closed[current][1] is not None:
+            previous = closed[current][1]
+            total += self.graph.get_edge(previous, current).element()
+            current = previous
+        self.assertEqual(current, self.start)
+        return total
+
+    def test_matches_dijkstra(self):
+        expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+        for pq_class in (APQBinaryHeap, APQUnsortedList, PriorityQueue):
+            for label in [(0, 0), (14, 14), (7, 8), (3, 12)]:
+                end = self.graph.get_vertex_by_label(label)
+                closed = bidirectional_dijkstra(self.start, end, self.graph, pq_class)
+                self.assertEqual(closed[end][0], expected[end][0])
+                self.assertEqual(self.path_length(closed, end), expected[end][0])
+
+    def test_start_is_end(self):
+        closed = bidirectional_dijkstra(self.start, self.start, self.graph, APQBinaryHeap)
+        self.assertEqual(closed, {self.start: (0, None)})
+
+    def test_unreachable(self):
+        island = self.graph.add_vertex("island")
+        closed = bidirectional_dijkstra(self.start, island, self.graph, APQBinaryHeap)
+        self.assertNotIn(island, closed)
+
+
+if __name__ == "__main__":
+    unittest.main()
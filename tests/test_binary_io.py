@@ -0,0 +1,102 @@
+import os
+import random
+import tempfile
+import unittest
+import struct
+from graph import Graph, DiGraph, CSRGraph, save_graph, load_graph
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+
+class TestBinaryGraphFile(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix='.csrg')
+        os.close(handle)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def assertSameGraph(self, loaded, csr):
+        self.assertIsInstance(loaded, CSRGraph)
+        self.assertEqual(loaded.num_vertices(), csr.num_vertices())
+        self.assertEqual(loaded.num_edges(), csr.num_edges())
+        for v in csr.vertices():
+            self.assertEqual(loaded.label(v), csr.label(v))
+            self.assertEqual(loaded.neighbours(v), csr.neighbours(v))
+
+    def test_grid_round_trip(self):
+        random.seed(20)
+        csr = generate_weighted_grid_graph(7, 5).freeze()
+        save_graph(csr, self.filename)
+        for use_mmap in (True, False):
+            loaded = load_graph(self.filename, use_mmap)
+            self.assertSameGraph(loaded, csr)
+            start = loaded.get_vertex_by_label((0, 0))
+            end = loaded.get_vertex_by_label((6, 4))
+            self.assertEqual(dijkstra_source_to_dest(start, end, loaded, APQBinaryHeap)[end],
+                             dijkstra_source_to_dest(start, end, csr, APQBinaryHeap)[end])
+
+    def test_label_kinds(self):
+        for labels in ([10, 20, 30], ['a', 'b', 'c'], [0, 1, 2], [(0, 'x'), (1, 'y'), 2]):
+            graph = Graph()
+            vertices = [graph.add_vertex(label) for label in labels]
+            graph.add_edge(vertices[0], vertices[1], 1.5)
+            graph.add_edge(vertices[1], vertices[2], 2)
+            save_graph(graph, self.filename)
+            loaded = load_graph(self.filename)
+            self.assertSameGraph(loaded, graph.freeze())
+            self.assertEqual(loaded.get_vertex_by_label(labels[2]), 2)
+
+    def test_json_labels(self):
+        # labels that are neither ints nor int pairs are stored as JSON, tuples and all
+        labels = ['a', (1, 'x', (2.5, None)), 3.0, True]
+        graph = Graph()
+        vertices = graph.add_vertices_from(labels)
+        graph.add_edges_from(vertices[:-1], vertices[1:], [1, 2, 3])
+        save_graph(graph, self.filename)
+        loaded = load_graph(self.filename)
+        self.assertEqual([loaded.label(v) for v in loaded.vertices()], labels)
+        self.assertEqual(loaded.get_vertex_by_label((1, 'x', (2.5, None))), 1)
+        graph.add_vertex(object())
+        with self.assertRaises(ValueError):
+            save_graph(graph, self.filename)
+
+    def test_directed_round_trip(self):
+        graph = DiGraph()
+        a, b, c = graph.add_vertices_from('abc')
+        graph.add_edge(a, b, 1)
+        graph.add_edge(b, c, 2, oneway=False)
+        csr = graph.freeze()
+        save_graph(csr, self.filename)
+        for use_mmap in (True, False):
+            loaded = load_graph(self.filename, use_mmap)
+            self.assertTrue(loaded.is_directed())
+            self.assertSameGraph(loaded, csr)
+            self.assertIsNone(loaded.get_edge(1, 0))
+            self.assertEqual(loaded.get_edge(2, 1), 2)
+
+    def test_rejects_version_1(self):
+        save_graph(Graph(), self.filename)
+        with open(self.filename, 'r+b') as file:
+            file.seek(4)
+            file.write(struct.pack('<I', 1))
+        with self.assertRaises(ValueError):
+            load_graph(self.filename)
+
+    def test_rejects_other_files(self):
+        with open(self.filename, 'wb') as file:
+            file.write(b'Node\nid: 1\n' * 10)
+        with self.assertRaises(ValueError):
+            load_graph(self.filename)
+        save_graph(Graph(), self.filename)
+        self.assertEqual(load_graph(self.filename).num_vertices(), 0)
+        with open(self.filename, 'r+b') as file:
+            file.seek(4)
+            file.write(b'\x63')
+        with self.assertRaises(ValueError):
+            load_graph(self.filename)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,56 @@
+import random
+import unittest
+from graph import Graph
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, APQUnsortedList, PriorityQueue
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.contraction import ContractionHierarchy
+
+
+class TestContractionHierarchy(unittest.TestCase):
+    def setUp(self):
+        random.seed(11)
+        self.graph = generate_weighted_grid_graph(10, 10)
+        self.hierarchy = ContractionHierarchy.build(self.graph)
+        self.start = self.graph.get_vertex_by_label((4, 5))
+        self.expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+
+    def test_distances_match_dijkstra(self):
+        for pq_class in (APQBinaryHeap, APQUnsortedList, PriorityQueue):
+            for end in self.graph.vertices():
+                self.assertEqual(self.hierarchy.distance(self.start, end, pq_class),
+                                 self.expected[end][0])
+
+    def test_path_is_unpacked_to_original_edges(self):
+        end = self.graph.get_vertex_by_label((9, 0))
+        path = self.hierarchy.shortest_path(self.start, end)
+        self.assertEqual(path[0], self.start)
+        self.assertEqual(path[-1], end)
+        total = 0
+        for v, w in zip(path, path[1:]):
+            edge = self.graph.get_edge(v, w)
+            self.assertIsNotNone(edge)
+            total += edge.element()
+        self.assertEqual(total, self.expected[end][0])
+
+    def test_query_returns_closed_path(self):
+        end = self.graph.get_vertex_by_label((0, 9))
+        closed = self.hierarchy.query(self.start, end)
+        self.assertEqual(closed[end][0], self.expected[end][0])
+        self.assertEqual(closed[self.start], (0, None))
+
+    def test_unreachable_and_same_vertex(self):
+        graph = Graph()
+        a = graph.add_vertex("a")
+        b = graph.add_vertex("b")
+        c = graph.add_vertex("c")
+        graph.add_edge(a, b, 2)
+        hierarchy = ContractionHierarchy.build(graph)
+        self.assertEqual(hierarchy.distance(a, b), 2)
+        self.assertEqual(hierarchy.distance(a, a), 0)
+        self.assertIsNone(hierarchy.shortest_path(a, c))
+        self.assertEqual(hierarchy.query(a, c), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
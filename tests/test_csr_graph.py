@@ -0,0 +1,72 @@
+import unittest
+from graph import Graph, CSRGraph
+from pq import APQBinaryHeap, APQUnsortedList, PriorityQueue
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+
+class TestCSRGraph(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.a = self.graph.add_vertex("A")
+        self.b = self.graph.add_vertex("B")
+        self.c = self.graph.add_vertex("C")
+        self.d = self.graph.add_vertex("D")
+        self.graph.add_edge(self.a, self.b, 1)
+        self.graph.add_edge(self.b, self.c, 2)
+        self.graph.add_edge(self.a, self.c, 5)
+        self.graph.add_edge(self.c, self.d, 1)
+        self.csr = self.graph.freeze()
+
+    def test_freeze_returns_csr(self):
+        self.assertIsInstance(self.csr, CSRGraph)
+        self.assertEqual(self.csr.num_vertices(), 4)
+        self.assertEqual(self.csr.num_edges(), 4)
+
+    def test_labels_and_ids(self):
+        c = self.csr.get_vertex_by_label("C")
+        self.assertEqual(self.csr.label(c), "C")
+        self.assertIsNone(self.csr.get_vertex_by_label("Z"))
+
+    def test_neighbours_and_degree(self):
+        c = self.csr.get_vertex_by_label("C")
+        labels = {self.csr.label(w): weight for w, weight in self.csr.neighbours(c)}
+        self.assertEqual(labels, {"A": 5, "B": 2, "D": 1})
+        self.assertEqual(self.csr.degree(c), 3)
+
+    def test_repeated_labels_give_first_vertex(self):
+        graph = Graph()
+        first = graph.add_vertex("X")
+        second = graph.add_vertex("X")
+        graph.add_edge(first, second, 1)
+        self.assertIs(graph.get_vertex_by_label("X"), first)
+        self.assertEqual(graph.freeze().get_vertex_by_label("X"), 0)
+        bulk = Graph()
+        vertices = bulk.add_vertices_from(["Y", "Z", "Y"])
+        self.assertIs(bulk.get_vertex_by_label("Y"), vertices[0])
+        self.assertEqual(bulk.freeze().get_vertex_by_label("Y"), 0)
+
+    def test_get_edge(self):
+        a = self.csr.get_vertex_by_label("A")
+        b = self.csr.get_vertex_by_label("B")
+        d = self.csr.get_vertex_by_label("D")
+        self.assertEqual(self.csr.get_edge(a, b), 1)
+        self.assertIsNone(self.csr.get_edge(a, d))
+
+    def test_dijkstra_matches_object_graph(self):
+        for pq_class in (APQBinaryHeap, APQUnsortedList, PriorityQueue):
+            expected = dijkstra_source_to_dest(self.a, self.d, self.graph, pq_class)
+            start = self.csr.get_vertex_by_label("A")
+            end = self.csr.get_vertex_by_label("D")
+            results = dijkstra_source_to_dest(start, end, self.csr, pq_class)
+            self.assertEqual(len(results), len(expected))
+            for v, (distance, predecessor) in expected.items():
+                distance_csr, predecessor_csr = results[self.csr.get_vertex_by_label(v.element())]
+                self.assertEqual(distance_csr, distance)
+                if predecessor is None:
+                    self.assertIsNone(predecessor_csr)
+                else:
+                    self.assertEqual(self.csr.label(predecessor_csr), predecessor.element())
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import random
+import unittest
+from graph import Graph
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+if numpy is not None:
+    from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+    from dijkstra_algos.delta_stepping import delta_stepping
+
+
+@unittest.skipIf(numpy is None, "delta-stepping needs numpy")
+class TestDeltaStepping(unittest.TestCase):
+    def setUp(self):
+        random.seed(17)
+        self.graph = generate_weighted_grid_graph(15, 15)
+        self.start = self.graph.get_vertex_by_label((3, 4))
+        self.expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+
+    def check(self, closed, graph):
+        self.assertEqual(set(closed), set(self.expected))
+        for v, (distance, predecessor) in closed.items():
+            self.assertEqual(distance, self.expected[v][0])
+            if predecessor is not None:
+                # Ties may pick a different predecessor, but it has to be on a shortest path.
+                weight = graph.get_edge(predecessor, v)
+                weight = weight if isinstance(weight, float) else weight.element()
+                self.assertEqual(closed[predecessor][0] + weight, distance)
+
+    def test_matches_dijkstra_for_any_delta(self):
+        for delta in (None, 0.5, 1, 3, 1000):
+            self.check(delta_stepping(self.start, self.graph, delta), self.graph)
+
+    def test_csr_graph(self):
+        csr = self.graph.freeze()
+        start = csr.get_vertex_by_label((3, 4))
+        closed = delta_stepping(start, csr, 2)
+        self.assertEqual(closed[start], (0.0, None))
+        self.assertEqual(len(closed), len(self.expected))
+        for v, (distance, predecessor) in self.expected.items():
+            self.assertEqual(closed[csr.get_vertex_by_label(v.element())][0], distance)
+
+    def test_worker_processes(self):
+        closed = delta_stepping(self.start, self.graph, 4, processes=2, min_parallel=1)
+        self.check(closed, self.graph)
+
+    def test_unreachable_and_bad_delta(self):
+        graph = Graph()
+        a = graph.add_vertex('a')
+        graph.add_vertex('b')
+        self.assertEqual(delta_stepping(a, graph), {a: (0.0, None)})
+        with self.assertRaises(ValueError):
+            delta_stepping(a, graph, 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
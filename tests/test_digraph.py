@@ -0,0 +1,193 @@
+import os
+import random
+import tempfile
+import unittest
+from graph import DiGraph, save_graph, load_graph, read_graph
+from pq import APQBinaryHeap, PriorityQueue, PQLazyHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.bidirectional import bidirectional_dijkstra
+from dijkstra_algos.search import DijkstraSearch
+from dijkstra_algos.matrix import distance_matrix
+from dijkstra_algos.contraction import ContractionHierarchy
+
+
+def random_digraph(n, edges, seed):
+    rng = random.Random(seed)
+    graph = DiGraph()
+    vertices = [graph.add_vertex(i) for i in range(n)]
+    for _ in range(edges):
+        v, w = rng.sample(vertices, 2)
+        graph.add_edge(v, w, rng.randint(1, 20), oneway=rng.random() < 0.7)
+    return graph, vertices
+
+
+class TestDiGraph(unittest.TestCase):
+    def setUp(self):
+        # a -> b -> c one way, c -- a both ways
+        self.graph = DiGraph()
+        self.a = self.graph.add_vertex('a')
+        self.b = self.graph.add_vertex('b')
+        self.c = self.graph.add_vertex('c')
+        self.ab = self.graph.add_edge(self.a, self.b, 1)
+        self.bc = self.graph.add_edge(self.b, self.c, 2)
+        self.ca = self.graph.add_edge(self.c, self.a, 10, oneway=False)
+
+    def test_adjacency(self):
+        # the two-way c -- a counts once per direction, as it does frozen
+        self.assertEqual(self.graph.num_edges(), 4)
+        self.assertEqual(self.graph.num_edges(), self.graph.freeze().num_edges())
+        self.assertEqual(len(self.graph.edges()), 4)
+        self.assertIs(self.graph.get_edge(self.a, self.b), self.ab)
+        self.assertIsNone(self.graph.get_edge(self.b, self.a))
+        self.assertIs(self.graph.get_edge(self.a, self.c), self.ca)
+        self.assertEqual(self.graph.degree(self.a), 2)
+        self.assertEqual(self.graph.in_degree(self.a), 1)
+        self.assertEqual(set(self.graph.get_in_edges(self.c)), {self.bc, self.ca})
+        self.assertTrue(self.graph.is_directed())
+
+    def test_remove(self):
+        self.graph.remove_edge(self.a, self.c)
+        self.assertIsNone(self.graph.get_edge(self.a, self.c))
+        self.assertIs(self.graph.get_edge(self.c, self.a), self.ca)
+        self.assertEqual(self.graph.num_edges(), 3)
+        self.assertIn(self.ca, self.graph.edges())
+        self.graph.remove_vertex(self.b)
+        self.assertEqual(self.graph.num_vertices(), 2)
+        self.assertEqual(self.graph.get_in_edges(self.c), [])
+        self.assertIsNone(self.graph.get_vertex_by_label('b'))
+
+    def test_remove_one_direction_of_two_way(self):
+        graph = DiGraph()
+        a, b = graph.add_vertices_from('ab')
+        graph.add_edge(a, b, 3, oneway=False)
+        graph.remove_edge(a, b)
+        self.assertIsNone(graph.get_edge(a, b))
+        back = graph.get_edge(b, a)
+        self.assertEqual((back.start(), back.end(), back.element()), (b, a, 3))
+        self.assertEqual(graph.num_edges(), 1)
+        self.assertEqual(graph.edges(), [back])
+        self.assertEqual(graph.get_in_edges(a), [back])
+        self.assertEqual(graph.freeze().num_edges(), 1)
+        self.assertEqual(dijkstra_source_to_dest(b, None, graph, APQBinaryHeap)[a], (3, b))
+
+    def test_overwrite_one_direction_of_two_way(self):
+        graph = DiGraph()
+        a, b = graph.add_vertices_from('ab')
+        graph.add_edge(a, b, 3, oneway=False)
+        ab = graph.add_edge(a, b, 7)
+        back = graph.get_edge(b, a)
+        self.assertIsNot(back, ab)
+        self.assertEqual((back.start(), back.end(), back.element()), (b, a, 3))
+        self.assertEqual(graph.num_edges(), 2)
+        self.assertEqual(set(graph.edges()), {ab, back})
+        self.assertIs(graph.get_in_edges(a)[0], back)
+        self.assertEqual(graph.freeze().num_edges(), 2)
+        # the same through the bulk builder
+        graph.add_edges_from([b], [a], [5], oneway=False)
+        graph.add_edges_from([b], [a], [9])
+        self.assertEqual(graph.get_edge(a, b).element(), 5)
+        self.assertEqual(graph.get_edge(b, a).element(), 9)
+        self.assertEqual(graph.num_edges(), 2)
+
+    def test_dijkstra_follows_direction(self):
+        for pq_class in (APQBinaryHeap, PriorityQueue, PQLazyHeap):
+            closed = dijkstra_source_to_dest(self.a, None, self.graph, pq_class)
+            self.assertEqual(closed[self.c], (3, self.b))
+            closed = dijkstra_source_to_dest(self.c, None, self.graph, pq_class)
+            self.assertEqual(closed[self.b], (11, self.a))
+
+    def test_reverse_search(self):
+        search = DijkstraSearch(self.c, self.graph, APQBinaryHeap, reverse=True)
+        closed = search.run()
+        # distances *to* c
+        self.assertEqual(closed[self.b][0], 2)
+        self.assertEqual(closed[self.a][0], 3)
+
+    def test_freeze_and_save(self):
+        csr = self.graph.freeze()
+        self.assertTrue(csr.is_directed())
+        self.assertEqual(csr.num_edges(), 4)
+        handle, filename = tempfile.mkstemp()
+        os.close(handle)
+        try:
+            save_graph(csr, filename)
+            loaded = load_graph(filename)
+        finally:
+            os.remove(filename)
+        self.assertTrue(loaded.is_directed())
+        c = loaded.get_vertex_by_label('c')
+        closed = dijkstra_source_to_dest(c, None, loaded, APQBinaryHeap)
+        self.assertEqual(closed[loaded.get_vertex_by_label('b')][0], 11)
+        with self.assertRaises(ValueError):
+            DijkstraSearch(c, loaded, APQBinaryHeap, reverse=True)
+
+    def test_bulk_add(self):
+        graph = DiGraph()
+        a, b, c = graph.add_vertices_from('abc')
+        graph.add_edges_from([a, b], [b, c], [1, 2], oneway=[True, False])
+        self.assertIsNone(graph.get_edge(b, a))
+        self.assertIs(graph.get_edge(c, b), graph.get_edge(b, c))
+        self.assertEqual(graph.in_degree(b), 2)
+        graph.add_edges_from('c', 'a', [3], by_label=True, oneway=False)
+        self.assertEqual(graph.num_edges(), 5)
+        with self.assertRaises(ValueError):
+            graph.add_edges_from([a], [c], [1], oneway=[True, False])
+
+    def test_undirected_only_preprocessing(self):
+        with self.assertRaises(ValueError):
+            ContractionHierarchy.build(self.graph)
+
+
+class TestDirectedAlgorithms(unittest.TestCase):
+    def setUp(self):
+        self.graph, self.vertices = random_digraph(60, 200, seed=22)
+
+    def test_bidirectional_matches_dijkstra(self):
+        rng = random.Random(1)
+        for _ in range(30):
+            s, t = rng.sample(self.vertices, 2)
+            expected = dijkstra_source_to_dest(s, t, self.graph, APQBinaryHeap)
+            closed = bidirectional_dijkstra(s, t, self.graph, APQBinaryHeap)
+            if t not in expected:
+                self.assertNotIn(t, closed)
+                continue
+            self.assertEqual(closed[t][0], expected[t][0])
+            # walking the predecessors back only uses edges in their own direction
+            v = t
+            while closed[v][1] is not None:
+                self.assertIsNotNone(self.graph.get_edge(closed[v][1], v))
+                v = closed[v][1]
+            self.assertIs(v, s)
+
+    def test_many_to_one_matrix(self):
+        sources = self.vertices[:10]
+        targets = self.vertices[50:52]
+        matrix = distance_matrix(sources, targets, self.graph, APQBinaryHeap)
+        for s, row in zip(sources, matrix):
+            closed = dijkstra_source_to_dest(s, None, self.graph, APQBinaryHeap)
+            self.assertEqual(list(row), [closed[t][0] if t in closed else float('inf')
+                                         for t in targets])
+
+
+class TestReadDirected(unittest.TestCase):
+    def test_oneway_field(self):
+        handle, filename = tempfile.mkstemp()
+        with os.fdopen(handle, 'w') as file:
+            file.write("Node\nid: 1\nNode\nid: 2\nNode\nid: 3\n"
+                       "Edge\nfrom: 1\nto: 2\nlength: 4\noneway: true\n"
+                       "Edge\nfrom: 2\nto: 3\nlength: 1\noneway: false\n")
+        try:
+            graph = read_graph(filename, directed=True)
+        finally:
+            os.remove(filename)
+        one, two, three = (graph.get_vertex_by_label(i) for i in (1, 2, 3))
+        self.assertIsInstance(graph, DiGraph)
+        self.assertIsNotNone(graph.get_edge(one, two))
+        self.assertIsNone(graph.get_edge(two, one))
+        self.assertIs(graph.get_edge(two, three), graph.get_edge(three, two))
+        self.assertEqual(graph.num_edges(), 3)    # 2 -- 3 counts once per direction
+        self.assertEqual(graph.in_degree(two), 2)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,59 @@
+import unittest
+from graph import Graph
+from pq import APQBinaryHeap, APQUnsortedList, PriorityQueue, PQLazyHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+
+class _NoFullScan(dict):
+    """ A _structure that allows look-ups but fails if anything walks every vertex. """
+
+    def __iter__(self):
+        raise AssertionError('setup walked every vertex in the graph')
+
+
+class TestDijkstra(unittest.TestCase):
+    def setUp(self):
+        # A path a-b-c-d with a shortcut a-c, plus a far-away tail d-e-f
+        self.graph = Graph()
+        self.a = self.graph.add_vertex("a")
+        self.b = self.graph.add_vertex("b")
+        self.c = self.graph.add_vertex("c")
+        self.d = self.graph.add_vertex("d")
+        self.e = self.graph.add_vertex("e")
+        self.f = self.graph.add_vertex("f")
+        self.graph.add_edge(self.a, self.b, 1)
+        self.graph.add_edge(self.b, self.c, 2)
+        self.graph.add_edge(self.a, self.c, 5)
+        self.graph.add_edge(self.c, self.d, 1)
+        self.graph.add_edge(self.d, self.e, 10)
+        self.graph.add_edge(self.e, self.f, 10)
+
+    def test_full_run(self):
+        for pq_class in (APQBinaryHeap, APQUnsortedList, PriorityQueue, PQLazyHeap):
+            closed = dijkstra_source_to_dest(self.a, self.f, self.graph, pq_class)
+            self.assertEqual(len(closed), 6)
+            self.assertEqual(closed[self.a], (0, None))
+            self.assertEqual(closed[self.c], (3, self.b))
+            self.assertEqual(closed[self.f], (24, self.e))
+
+    def test_early_break_only_holds_explored_region(self):
+        closed = dijkstra_source_to_dest(self.a, self.c, self.graph, APQBinaryHeap, True)
+        self.assertEqual(closed[self.c], (3, self.b))
+        self.assertNotIn(self.e, closed)
+        self.assertNotIn(self.f, closed)
+
+    def test_setup_does_not_walk_every_vertex(self):
+        self.graph._structure = _NoFullScan(self.graph._structure)
+        for pq_class in (APQBinaryHeap, PriorityQueue):
+            closed = dijkstra_source_to_dest(self.a, self.c, self.graph, pq_class, True)
+            self.assertEqual(closed[self.c], (3, self.b))
+
+    def test_unreachable_vertex(self):
+        g = self.graph.add_vertex("g")
+        closed = dijkstra_source_to_dest(self.a, g, self.graph, APQBinaryHeap, True)
+        self.assertNotIn(g, closed)
+        self.assertEqual(len(closed), 6)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,5 +1,11 @@
 import unittest
 from graph import Vertex, Edge, Graph
+from graph import graph_dijkstra
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
 
 
 class TestGraphADT(unittest.TestCase):
@@ -88,6 +94,50 @@ class TestGraphADT(unittest.TestCase):
         self.graph.remove_edge(self.v2, self.v3)
         self.assertIsNone(self.graph.get_edge(self.v2, self.v3))
 
+    def test_add_vertices_and_edges_from(self):
+        e, f, g = self.graph.add_vertices_from(["E", "F", "G"])
+        self.assertIs(self.graph.get_vertex_by_label("F"), f)
+        edges = self.graph.add_edges_from([e, f], [f, self.v1], [4, 5])
+        self.assertEqual(len(edges), 2)
+        self.assertIs(self.graph.get_edge(self.v1, f), edges[1])
+        self.assertEqual(self.graph.get_edge(f, e).element(), 4)
+        self.graph.add_edges_from(["G"], ["A"], [6], by_label=True)
+        self.assertEqual(self.graph.get_edge(self.v1, g).element(), 6)
+        self.assertEqual(self.graph.num_edges(), 6)
+
+    def test_add_edges_from_checks_everything_first(self):
+        outsider = Vertex("X")
+        with self.assertRaises(ValueError):
+            self.graph.add_edges_from([self.v1, self.v2], [self.v4, outsider], [1, 2])
+        with self.assertRaises(ValueError):
+            self.graph.add_edges_from(["A"], ["nope"], [1], by_label=True)
+        with self.assertRaises(ValueError):
+            self.graph.add_edges_from([self.v1], [self.v4], [1, 2])
+        self.assertIsNone(self.graph.get_edge(self.v1, self.v4))
+        self.assertEqual(self.graph.num_edges(), 3)
+
+    @unittest.skipIf(numpy is None, "needs numpy")
+    def test_bulk_from_numpy_arrays(self):
+        graph = Graph()
+        graph.add_vertices_from(numpy.arange(4))
+        edges = graph.add_edges_from(numpy.array([0, 1, 2]), numpy.array([1, 2, 3]),
+                                     numpy.array([1.5, 2.5, 3.5]), by_label=True)
+        self.assertEqual(graph.num_edges(), 3)
+        # NumPy scalars come out as plain Python numbers
+        self.assertIs(type(edges[0].element()), float)
+        self.assertIs(type(graph.get_vertex_by_label(3).element()), int)
+
+
+
+class TestGraphDijkstraBulk(unittest.TestCase):
+    def test_add_edges_from_by_label_uses_first_vertex(self):
+        graph = graph_dijkstra.Graph()
+        first, y, second = graph.add_vertices_from(['x', 'y', 'x'])
+        self.assertIs(graph.get_vertex_by_label('x'), first)
+        edge, = graph.add_edges_from(['x'], ['y'], [3], by_label=True)
+        self.assertEqual(edge.vertices(), (first, y))
+        self.assertEqual(graph.degree(second), 0)
+
 
 if __name__ == "__main__":
-    unittest.main()
\ No newline at end of file
+    unittest.main()
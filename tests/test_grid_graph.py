@@ -0,0 +1,60 @@
+import random
+import unittest
+from graph import Graph
+from grid_graph import generate_weighted_grid_graph
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+def weights(graph):
+    """ Return the edge weights keyed by the (label, label) pairs they join. """
+    return {(e.start().element(), e.end().element()): e.element() for e in graph.edges()}
+
+
+class TestGenerateWeightedGridGraph(unittest.TestCase):
+    def test_shape(self):
+        graph = generate_weighted_grid_graph(4, 5, seed=1)
+        self.assertEqual(graph.num_vertices(), 20)
+        self.assertEqual(graph.num_edges(), 4 * 4 + 3 * 5)
+        # Vertices are in row-major order, so CSR ids are i * m + j.
+        self.assertEqual([v.element() for v in graph.vertices()][:6],
+                         [(0, 0), (0, 1), (0, 2), (0, 3), (0, 4), (1, 0)])
+        for (a, b), weight in weights(graph).items():
+            self.assertIn((b[0] - a[0], b[1] - a[1]), ((1, 0), (0, 1)))
+            self.assertTrue(1 <= weight <= 2)
+
+    def test_seed_reproduces_graph(self):
+        first = weights(generate_weighted_grid_graph(12, 9, seed=42))
+        self.assertEqual(first, weights(generate_weighted_grid_graph(12, 9, seed=42)))
+        self.assertNotEqual(first, weights(generate_weighted_grid_graph(12, 9, seed=43)))
+
+    @unittest.skipIf(numpy is None, "without numpy a seed gives other weights")
+    def test_seed_gives_fixed_weights(self):
+        graph = generate_weighted_grid_graph(3, 6, seed=7)
+        south = [[3, 2, 3, 3, 2, 3], [3, 1, 1, 1, 1, 3]]
+        east = [[1, 2, 3, 1, 2], [3, 1, 3, 2, 2], [2, 2, 2, 3, 3]]
+        expected = {((i, j), (i + 1, j)): south[i][j] for i in range(2) for j in range(6)}
+        expected.update({((i, j), (i, j + 1)): east[i][j] for i in range(3) for j in range(5)})
+        self.assertEqual(weights(graph), expected)
+
+    def test_random_seed_still_fixes_graph(self):
+        random.seed(18)
+        first = weights(generate_weighted_grid_graph(8, 8))
+        random.seed(18)
+        self.assertEqual(first, weights(generate_weighted_grid_graph(8, 8)))
+
+    def test_graph_class(self):
+        graph = generate_weighted_grid_graph(4, 5, seed=3, graph_class=Graph)
+        self.assertIsInstance(graph, Graph)
+        self.assertEqual(weights(graph), weights(generate_weighted_grid_graph(4, 5, seed=3)))
+
+    def test_tiny_grids(self):
+        self.assertEqual(generate_weighted_grid_graph(1, 1, seed=0).num_edges(), 0)
+        self.assertEqual(generate_weighted_grid_graph(0, 0, seed=0).num_vertices(), 0)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,62 @@
+import unittest
+from graph import ImplicitGridGraph
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, IndexedMinHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+try:
+    import numpy
+except ImportError:
+    numpy = None
+
+
+@unittest.skipIf(numpy is None, "ImplicitGridGraph.random needs numpy")
+class TestImplicitGridGraph(unittest.TestCase):
+    def setUp(self):
+        self.grid = ImplicitGridGraph.random(6, 9, seed=19)
+        self.graph = generate_weighted_grid_graph(6, 9, seed=19)
+
+    def test_counts_and_labels(self):
+        self.assertEqual(self.grid.num_vertices(), 54)
+        self.assertEqual(self.grid.num_edges(), self.graph.num_edges())
+        v = self.grid.get_vertex_by_label((2, 7))
+        self.assertEqual(v, 2 * 9 + 7)
+        self.assertEqual(self.grid.label(v), (2, 7))
+        self.assertIsNone(self.grid.get_vertex_by_label((6, 0)))
+        self.assertEqual(self.grid.degree(0), 2)
+        self.assertEqual(self.grid.degree(v), 4)
+
+    def test_same_weights_as_object_grid(self):
+        for e in self.graph.edges():
+            v = self.grid.get_vertex_by_label(e.start().element())
+            w = self.grid.get_vertex_by_label(e.end().element())
+            self.assertEqual(self.grid.get_edge(v, w), e.element())
+            self.assertEqual(self.grid.get_edge(w, v), e.element())
+        self.assertIsNone(self.grid.get_edge(0, 10))
+
+    def test_dijkstra_runs_unchanged(self):
+        start = self.graph.get_vertex_by_label((1, 1))
+        expected = dijkstra_source_to_dest(start, None, self.graph, APQBinaryHeap)
+        closed = dijkstra_source_to_dest(self.grid.get_vertex_by_label((1, 1)), None,
+                                         self.grid, APQBinaryHeap)
+        self.assertEqual(len(closed), len(expected))
+        for v, (distance, predecessor) in expected.items():
+            self.assertEqual(closed[self.grid.get_vertex_by_label(v.element())][0], distance)
+
+    def test_freeze(self):
+        csr = self.grid.freeze()
+        self.assertEqual(csr.num_edges(), self.grid.num_edges())
+        for v in self.grid.vertices():
+            self.assertEqual(csr.neighbours(v), self.grid.neighbours(v))
+        end = self.grid.get_vertex_by_label((5, 8))
+        closed = dijkstra_source_to_dest(0, end, csr, IndexedMinHeap, True)
+        self.assertEqual(closed[end][0],
+                         dijkstra_source_to_dest(0, end, self.grid, APQBinaryHeap, True)[end][0])
+
+    def test_shape_mismatch(self):
+        with self.assertRaises(ValueError):
+            ImplicitGridGraph(numpy.ones((2, 3)), numpy.ones((3, 3)))
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,84 @@
+import random
+import unittest
+from pq.indexed_heap import IndexedMinHeap
+from pq.apq_binary_heap import APQBinaryHeap
+from grid_graph import generate_weighted_grid_graph
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+
+class TestIndexedMinHeap(unittest.TestCase):
+    def setUp(self):
+        # O(1): Create a new IndexedMinHeap instance before each test.
+        self.heap = IndexedMinHeap()
+
+    # O(log n)
+    def test_add_min_and_length(self):
+        self.assertEqual(self.heap.length(), 0)
+        self.assertEqual(self.heap.add(10, 3), 3)
+        self.heap.add(5, 0)
+        self.heap.add(15, 40)     # beyond the initial capacity, so the arrays grow
+        self.assertEqual(self.heap.length(), 3)
+        self.assertEqual(self.heap.min(), 0)
+        self.assertIn(40, self.heap)
+        self.assertNotIn(7, self.heap)
+
+    # O(log n)
+    def test_decrease_key(self):
+        self.assertTrue(self.heap.decrease_key(1, 10))
+        self.assertTrue(self.heap.decrease_key(2, 5))
+        self.assertTrue(self.heap.decrease_key(1, 2))
+        self.assertFalse(self.heap.decrease_key(1, 8))
+        self.assertEqual(self.heap.get_key(1), 2)
+        self.assertEqual(self.heap.remove_min(), 1)
+        self.assertEqual(self.heap.remove_min(), 2)
+        self.assertNotIn(1, self.heap)
+
+    # O(log n)
+    def test_update_key_and_remove(self):
+        self.heap.add(10, 1)
+        self.heap.add(5, 2)
+        self.heap.add(7, 3)
+        self.heap.update_key(2, 20)
+        self.assertEqual(self.heap.min(), 3)
+        self.assertEqual(self.heap.remove(3), (7, 3))
+        self.assertEqual([self.heap.remove_min() for _ in range(2)], [1, 2])
+
+    # O(1)
+    def test_add_twice_raises(self):
+        self.heap.add(1, 4)
+        with self.assertRaises(ValueError):
+            self.heap.add(2, 4)
+
+    # O(n log n)
+    def test_heap_sort(self):
+        random.seed(2)
+        keys = {i: random.random() for i in range(300)}
+        heap = IndexedMinHeap(300)
+        for i, key in keys.items():
+            heap.decrease_key(i, key)
+        removed = [keys[heap.remove_min()] for _ in range(300)]
+        self.assertEqual(removed, sorted(keys.values()))
+
+    # O(1)
+    def test_remove_from_empty(self):
+        self.assertIsNone(self.heap.min())
+        self.assertIsNone(self.heap.remove_min())
+
+    def test_dijkstra_on_csr_graph(self):
+        random.seed(9)
+        graph = generate_weighted_grid_graph(20, 20).freeze()
+        start = graph.get_vertex_by_label((3, 3))
+        expected = dijkstra_source_to_dest(start, None, graph, APQBinaryHeap)
+        results = dijkstra_source_to_dest(start, None, graph, IndexedMinHeap)
+        self.assertEqual({v: d for v, (d, p) in results.items()},
+                         {v: d for v, (d, p) in expected.items()})
+
+    def test_rejects_vertex_objects(self):
+        graph = generate_weighted_grid_graph(3, 3)
+        start = graph.get_vertex_by_label((0, 0))
+        with self.assertRaises(TypeError):
+            dijkstra_source_to_dest(start, None, graph, IndexedMinHeap)
+
+
+if __name__ == '__main__':
+    unittest.main()
@@ -0,0 +1,43 @@
+import random
+import unittest
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, PriorityQueue
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.isochrone import dijkstra_within, isochrones
+
+
+class TestIsochrones(unittest.TestCase):
+    def setUp(self):
+        random.seed(15)
+        self.graph = generate_weighted_grid_graph(12, 12)
+        self.start = self.graph.get_vertex_by_label((6, 6))
+        self.expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+
+    def test_within_matches_filtered_full_run(self):
+        for pq_class in (APQBinaryHeap, PriorityQueue):
+            for bound in (0, 5, 12, 30):
+                closed = dijkstra_within(self.start, self.graph, pq_class, bound)
+                expected = {v for v, (d, p) in self.expected.items() if d <= bound}
+                self.assertEqual(set(closed), expected)
+                for v, (distance, predecessor) in closed.items():
+                    self.assertEqual(distance, self.expected[v][0])
+
+    def test_rings_partition_the_ball(self):
+        rings = isochrones(self.start, self.graph, APQBinaryHeap, [20, 5, 10])
+        self.assertEqual(sorted(rings), [5, 10, 20])
+        previous = -1
+        seen = set()
+        for cutoff in (5, 10, 20):
+            for v, distance in rings[cutoff].items():
+                self.assertTrue(previous < distance <= cutoff)
+                self.assertNotIn(v, seen)
+                seen.add(v)
+            previous = cutoff
+        self.assertEqual(seen, set(dijkstra_within(self.start, self.graph, APQBinaryHeap, 20)))
+
+    def test_no_cutoffs(self):
+        self.assertEqual(isochrones(self.start, self.graph, APQBinaryHeap, []), {})
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,46 @@
+import random
+import unittest
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, PQLazyHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.matrix import distance_matrix
+
+
+class TestDistanceMatrix(unittest.TestCase):
+    def setUp(self):
+        random.seed(14)
+        self.graph = generate_weighted_grid_graph(10, 10)
+        self.sources = [self.graph.get_vertex_by_label(l) for l in [(0, 0), (5, 5), (9, 2)]]
+        self.targets = [self.graph.get_vertex_by_label(l) for l in [(9, 9), (0, 0), (4, 7), (9, 9)]]
+
+    def expected(self):
+        rows = []
+        for s in self.sources:
+            closed = dijkstra_source_to_dest(s, None, self.graph, APQBinaryHeap)
+            rows.append([closed[t][0] for t in self.targets])
+        return rows
+
+    def test_search_method(self):
+        for pq_class in (APQBinaryHeap, PQLazyHeap):
+            matrix = distance_matrix(self.sources, self.targets, self.graph, pq_class)
+            self.assertEqual([list(row) for row in matrix], self.expected())
+
+    def test_bucket_method(self):
+        matrix = distance_matrix(self.sources, self.targets, self.graph, APQBinaryHeap,
+                                 method='buckets')
+        self.assertEqual([list(row) for row in matrix], self.expected())
+
+    def test_unreachable_target(self):
+        island = self.graph.add_vertex("island")
+        for method in ('search', 'buckets'):
+            matrix = distance_matrix(self.sources[:1], [island], self.graph, APQBinaryHeap,
+                                     method=method)
+            self.assertEqual(matrix[0][0], float('inf'))
+
+    def test_bad_method(self):
+        with self.assertRaises(ValueError):
+            distance_matrix(self.sources, self.targets, self.graph, APQBinaryHeap, method='x')
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,55 @@
+import unittest
+from pq.priority_queue_heapq import PQLazyHeap
+
+
+class TestPQLazyHeap(unittest.TestCase):
+
+    def test_add_and_remove_min(self):
+        pq = PQLazyHeap()
+        pq.add(5, "A")
+        pq.add(3, "B")
+        pq.add(7, "C")
+        self.assertEqual(pq.length(), 3)
+        self.assertEqual(pq.min(), "B")
+        self.assertEqual(pq.remove_min(), "B")
+        self.assertEqual(pq.remove_min(), "A")
+        self.assertEqual(pq.remove_min(), "C")
+
+    def test_lower_priority_replaces_duplicate(self):
+        pq = PQLazyHeap()
+        pq.add(5, "A")
+        pq.add(4, "B")
+        pq.add(1, "A")    # lowers A, the old entry goes stale
+        pq.add(9, "B")    # higher than B's current priority, ignored
+        self.assertEqual(pq.length(), 2)
+        self.assertEqual(pq.remove_min(), "A")
+        self.assertEqual(pq.remove_min(), "B")
+        self.assertIsNone(pq.remove_min())
+
+    def test_item_can_be_queued_again_after_removal(self):
+        pq = PQLazyHeap()
+        pq.add(2, "A")
+        self.assertEqual(pq.remove_min(), "A")
+        pq.add(6, "A")
+        self.assertEqual(pq.length(), 1)
+        self.assertEqual(pq.remove_min(), "A")
+
+    def test_compaction_drops_stale_entries(self):
+        pq = PQLazyHeap(compact_ratio=1.0, min_compact=10)
+        for item in range(20):
+            pq.add(100, item)
+        for item in range(20):
+            pq.add(50 - item, item)
+        pq.remove_min()
+        self.assertEqual(len(pq._heap), pq.length())
+        self.assertEqual([pq.remove_min() for _ in range(19)], list(range(18, -1, -1)))
+
+    def test_empty_queue(self):
+        pq = PQLazyHeap()
+        self.assertIsNone(pq.min())
+        self.assertIsNone(pq.remove_min())
+        self.assertEqual(pq.length(), 0)
+
+
+if __name__ == '__main__':
+    unittest.main()
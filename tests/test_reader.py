@@ -0,0 +1,113 @@
+import os
+import tempfile
+import unittest
+from graph import Graph, read_graph
+
+TEXT = """Node
+id: 1
+Node
+id: 2
+Node
+id: 3
+Edge
+from: 1
+to: 2
+length: 2.5
+oneway: false
+Edge
+from: 2
+to: 3
+length: 4
+oneway: true
+"""
+
+
+class TestReadGraph(unittest.TestCase):
+    def setUp(self):
+        handle, self.filename = tempfile.mkstemp(suffix='.txt')
+        os.close(handle)
+        with open(self.filename, 'w') as file:
+            file.write(TEXT)
+
+    def tearDown(self):
+        os.remove(self.filename)
+
+    def check(self, graph):
+        self.assertEqual(graph.num_vertices(), 3)
+        self.assertEqual(graph.num_edges(), 2)
+        a, b, c = (graph.get_vertex_by_label(label) for label in (1, 2, 3))
+        self.assertEqual(graph.get_edge(a, b).element(), 2.5)
+        self.assertEqual(graph.get_edge(c, b).element(), 4.0)
+        self.assertIsNone(graph.get_edge(a, c))
+
+    def test_read(self):
+        self.check(read_graph(self.filename))
+
+    def test_records_split_across_chunks(self):
+        # Every chunk size from tiny up cuts some record in half somewhere.
+        for chunk_size in range(1, 40):
+            self.check(read_graph(self.filename, chunk_size=chunk_size))
+
+    def write(self, text, newline):
+        with open(self.filename, 'w', newline=newline) as file:
+            file.write(text)
+
+    def test_crlf_line_endings(self):
+        self.write(TEXT, '\r\n')
+        for chunk_size in (1, 7, 13, 40, 1 << 20):
+            self.check(read_graph(self.filename, chunk_size=chunk_size))
+
+    def test_indented_records(self):
+        self.write(''.join('    ' + line for line in TEXT.splitlines(True)), '\r\n')
+        for chunk_size in range(1, 60):
+            self.check(read_graph(self.filename, chunk_size=chunk_size))
+        # and they are split into chunks, rather than held back to the end of the file
+        reports = []
+        read_graph(self.filename, chunk_size=32, progress=lambda *report: reports.append(report))
+        self.assertGreater(reports[len(reports) // 2][2], 0)
+
+    def test_record_straddling_chunk_boundary(self):
+        # The second edge's length line is cut after its first digit, and the text before
+        # the cut holds a line starting with Edge that is not a record.
+        text = TEXT.replace('length: 4\n', 'length: 40\nEdges follow\n')
+        cut = text.index('length: 40') + len('length: 4')
+        self.write(text, '\n')
+        graph = read_graph(self.filename, chunk_size=cut)
+        b, c = graph.get_vertex_by_label(2), graph.get_vertex_by_label(3)
+        self.assertEqual(graph.get_edge(b, c).element(), 40.0)
+        self.assertEqual(graph.num_edges(), 2)
+
+    def test_progress(self):
+        reports = []
+        read_graph(self.filename, chunk_size=32,
+                   progress=lambda *report: reports.append(report))
+        self.assertEqual(reports[-1], (len(TEXT), len(TEXT), 3, 2))
+        self.assertEqual([r[0] for r in reports], sorted(r[0] for r in reports))
+
+    def test_adds_to_given_graph(self):
+        graph = Graph()
+        graph.add_vertex('x')
+        self.assertIs(read_graph(self.filename, graph), graph)
+        self.assertEqual(graph.num_vertices(), 4)
+
+    def test_unknown_node(self):
+        with open(self.filename, 'a') as file:
+            file.write("Edge\nfrom: 1\nto: 9\nlength: 1\noneway: false\n")
+        with self.assertRaises(ValueError):
+            read_graph(self.filename)
+
+    def test_repeated_node_keeps_first_vertex(self):
+        with open(self.filename, 'a') as file:
+            file.write("Node\nid: 1\nEdge\nfrom: 1\nto: 3\nlength: 7\noneway: false\n")
+        graph = read_graph(self.filename)
+        first = graph.get_vertex_by_label(1)
+        self.assertEqual(graph.get_edge(first, graph.get_vertex_by_label(3)).element(), 7.0)
+
+    def test_sample_file(self):
+        here = os.path.dirname(os.path.abspath(__file__))
+        graph = read_graph(os.path.join(here, '..', 'simplegraph2-2.txt'))
+        self.assertEqual(graph.num_vertices(), 28)
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,102 @@
+import random
+import unittest
+from grid_graph import generate_weighted_grid_graph
+from pq import APQBinaryHeap, PriorityQueue, PQLazyHeap
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+from dijkstra_algos.search import DijkstraSearch, dijkstra_iter
+
+
+class TestDijkstraSearch(unittest.TestCase):
+    def setUp(self):
+        random.seed(12)
+        self.graph = generate_weighted_grid_graph(12, 12)
+        self.start = self.graph.get_vertex_by_label((6, 6))
+        self.expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+
+    def test_sweep_of_targets_resumes(self):
+        for pq_class in (APQBinaryHeap, PriorityQueue, PQLazyHeap):
+            search = DijkstraSearch(self.start, self.graph, pq_class)
+            settled_before = 0
+            for i in range(7, 12):
+                target = self.graph.get_vertex_by_label((i, i))
+                closed = search.settle_until(target)
+                self.assertEqual(closed[target][0], self.expected[target][0])
+                # never goes backwards - the earlier work is kept
+                self.assertGreaterEqual(len(closed), settled_before)
+                settled_before = len(closed)
+
+    def test_already_settled_target_is_free(self):
+        search = DijkstraSearch(self.start, self.graph, APQBinaryHeap)
+        far = self.graph.get_vertex_by_label((11, 11))
+        near = self.graph.get_vertex_by_label((6, 7))
+        search.settle_until(far)
+        self.assertTrue(search.is_settled(near))
+        size = len(search.closed())
+        self.assertEqual(search.distance(near), self.expected[near][0])
+        self.assertEqual(len(search.closed()), size)
+
+    def test_run_matches_full_dijkstra(self):
+        search = DijkstraSearch(self.start, self.graph, APQBinaryHeap)
+        closed = search.run()
+        self.assertEqual({v: d for v, (d, p) in closed.items()},
+                         {v: d for v, (d, p) in self.expected.items()})
+        self.assertIsNone(search.settle_next())
+
+    def test_unreachable_target(self):
+        island = self.graph.add_vertex("island")
+        search = DijkstraSearch(self.start, self.graph, APQBinaryHeap)
+        self.assertEqual(search.distance(island), float('inf'))
+
+    def test_csr_graph(self):
+        frozen = self.graph.freeze()
+        start = frozen.get_vertex_by_label((6, 6))
+        search = DijkstraSearch(start, frozen, APQBinaryHeap)
+        for label in [(7, 7), (0, 0), (11, 0)]:
+            target = frozen.get_vertex_by_label(label)
+            vertex = self.graph.get_vertex_by_label(label)
+            self.assertEqual(search.distance(target), self.expected[vertex][0])
+
+
+class TestDijkstraIter(unittest.TestCase):
+    def setUp(self):
+        random.seed(13)
+        self.graph = generate_weighted_grid_graph(10, 10)
+        self.start = self.graph.get_vertex_by_label((0, 0))
+        self.expected = dijkstra_source_to_dest(self.start, None, self.graph, APQBinaryHeap)
+
+    def test_yields_every_vertex_in_distance_order(self):
+        for pq_class in (APQBinaryHeap, PriorityQueue, PQLazyHeap):
+            settled = list(dijkstra_iter(self.start, self.graph, pq_class))
+            self.assertEqual(settled[0], (self.start, 0, None))
+            distances = [distance for vertex, distance, predecessor in settled]
+            self.assertEqual(distances, sorted(distances))
+            self.assertEqual({v: d for v, d, p in settled},
+                             {v: d for v, (d, p) in self.expected.items()})
+
+    def test_stopping_early(self):
+        nearest = []
+        for vertex, distance, predecessor in dijkstra_iter(self.start, self.graph, APQBinaryHeap):
+            nearest.append(vertex)
+            if len(nearest) == 5:
+                break
+        ranked = sorted(self.expected, key=lambda v: self.expected[v][0])
+        self.assertEqual(sorted(self.expected[v][0] for v in nearest),
+                         [self.expected[v][0] for v in ranked[:5]])
+
+    def test_no_closed_dictionary_without_keep_closed(self):
+        search = DijkstraSearch(self.start, self.graph, APQBinaryHeap, keep_closed=False)
+        next(iter(search))
+        self.assertTrue(search.is_settled(self.start))
+        with self.assertRaises(ValueError):
+            search.closed()
+
+    def test_iterating_resumes_a_search(self):
+        search = DijkstraSearch(self.start, self.graph, APQBinaryHeap)
+        search.settle_until(self.graph.get_vertex_by_label((2, 2)))
+        already = len(search.closed())
+        remaining = list(search)
+        self.assertEqual(already + len(remaining), len(self.expected))
+
+
+if __name__ == "__main__":
+    unittest.main()
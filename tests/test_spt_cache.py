@@ -0,0 +1,79 @@
+import unittest
+from graph import Graph, WeightProfiles
+from pq import APQBinaryHeap, PQLazyHeap
+from dijkstra_algos.spt_cache import SPTCache
+
+
+class TestSPTCache(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.a = self.graph.add_vertex("a")
+        self.b = self.graph.add_vertex("b")
+        self.c = self.graph.add_vertex("c")
+        self.graph.add_edge(self.a, self.b, 1)
+        self.graph.add_edge(self.b, self.c, 2)
+        self.cache = SPTCache(APQBinaryHeap, max_entries=2)
+
+    def test_repeat_query_is_a_hit(self):
+        first = self.cache.tree(self.graph, self.a)
+        second = self.cache.dijkstra_source_to_dest(self.a, self.c, self.graph, APQBinaryHeap, True)
+        self.assertIs(first, second)
+        self.assertEqual(second[self.c], (3, self.b))
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 1))
+
+    def test_pq_class_and_profile_are_keys(self):
+        base = self.cache.dijkstra_source_to_dest(self.a, None, self.graph, APQBinaryHeap)
+        lazy = self.cache.dijkstra_source_to_dest(self.a, None, self.graph, PQLazyHeap)
+        self.assertIsNot(base, lazy)
+        self.assertEqual(lazy, base)
+        profile = WeightProfiles(self.graph).add_profile("double", lambda v, w, weight: 2 * weight)
+        doubled = self.cache.dijkstra_source_to_dest(self.a, None, self.graph, profile=profile)
+        self.assertEqual(doubled[self.c], (6, self.b))
+        self.assertIs(self.cache.dijkstra_source_to_dest(self.a, None, self.graph, profile=profile),
+                      doubled)
+        self.assertEqual((self.cache.hits, self.cache.misses), (1, 3))
+
+    def test_add_edge_invalidates(self):
+        self.cache.tree(self.graph, self.a)
+        self.graph.add_edge(self.a, self.c, 1)
+        self.assertEqual(self.cache.tree(self.graph, self.a)[self.c], (1, self.a))
+        self.assertEqual(self.cache.misses, 2)
+
+    def test_remove_edge_and_vertex_invalidate(self):
+        self.cache.tree(self.graph, self.a)
+        self.graph.remove_edge(self.b, self.c)
+        self.assertNotIn(self.c, self.cache.tree(self.graph, self.a))
+        self.graph.remove_vertex(self.b)
+        self.assertEqual(self.cache.tree(self.graph, self.a), {self.a: (0, None)})
+        self.assertEqual(self.cache.misses, 3)
+
+    def test_lru_eviction(self):
+        self.cache.tree(self.graph, self.a)
+        self.cache.tree(self.graph, self.b)
+        self.cache.tree(self.graph, self.a)      # a is now most recent
+        self.cache.tree(self.graph, self.c)      # evicts b
+        self.assertEqual(len(self.cache), 2)
+        self.cache.tree(self.graph, self.a)
+        self.assertEqual(self.cache.hits, 2)
+        self.cache.tree(self.graph, self.b)
+        self.assertEqual(self.cache.misses, 4)
+
+    def test_vertex_budget(self):
+        cache = SPTCache(APQBinaryHeap, max_entries=10, max_vertices=4)
+        cache.tree(self.graph, self.a)
+        cache.tree(self.graph, self.b)
+        self.assertEqual(len(cache), 1)
+
+    def test_invalidate(self):
+        self.cache.tree(self.graph, self.a)
+        self.cache.invalidate(self.graph)
+        self.assertEqual(len(self.cache), 0)
+
+    def test_frozen_graph(self):
+        frozen = self.graph.freeze()
+        a = frozen.get_vertex_by_label("a")
+        self.assertIs(self.cache.tree(frozen, a), self.cache.tree(frozen, a))
+
+
+if __name__ == "__main__":
+    unittest.main()
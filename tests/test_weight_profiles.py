@@ -0,0 +1,132 @@
+import unittest
+from graph import Graph, DiGraph, CSRGraph, ImplicitGridGraph, WeightProfiles
+from pq import APQBinaryHeap, PQLazyHeap
+from grid_graph import generate_weighted_grid_graph
+from dijkstra_algos.dijkstra import dijkstra_source_to_dest
+
+
+class TestWeightProfiles(unittest.TestCase):
+    def setUp(self):
+        self.graph = Graph()
+        self.a = self.graph.add_vertex("A")
+        self.b = self.graph.add_vertex("B")
+        self.c = self.graph.add_vertex("C")
+        self.ab = self.graph.add_edge(self.a, self.b, 1)
+        self.bc = self.graph.add_edge(self.b, self.c, 1)
+        self.ac = self.graph.add_edge(self.a, self.c, 5)
+        self.profiles = WeightProfiles(self.graph)
+
+    def test_edges_numbered_once(self):
+        self.assertEqual(self.profiles.num_edges(), 3)
+        edges = self.profiles.edges()
+        self.assertEqual([edge_id for edge_id, _, _, _ in edges], [0, 1, 2])
+        self.assertEqual(sorted(weight for _, _, _, weight in edges), [1, 1, 5])
+
+    def test_profile_changes_route(self):
+        # With B expensive, going straight to C wins.
+        self.profiles.add_profile("slow b", lambda v, w, weight: weight * 10 if self.b in (v, w) else weight)
+        closed = dijkstra_source_to_dest(self.a, self.c, self.graph, APQBinaryHeap)
+        self.assertEqual(closed[self.c], (2, self.b))
+        closed = dijkstra_source_to_dest(self.a, self.c, self.graph, APQBinaryHeap,
+                                         profile=self.profiles.profile("slow b"))
+        self.assertEqual(closed[self.c], (5, self.a))
+        # the graph's own weights are untouched
+        self.assertEqual(self.ab.element(), 1)
+
+    def test_default_profile_copies_graph_weights(self):
+        profile = self.profiles.add_profile("base")
+        closed = dijkstra_source_to_dest(self.a, None, self.graph, APQBinaryHeap, profile=profile)
+        self.assertEqual(closed, dijkstra_source_to_dest(self.a, None, self.graph, APQBinaryHeap))
+
+    def test_weights_by_edge_id(self):
+        profile = self.profiles.add_profile("flat", [2, 2, 2])
+        self.assertEqual(len(profile), 3)
+        self.assertEqual(profile.weight(0), 2)
+        closed = dijkstra_source_to_dest(self.a, None, self.graph, APQBinaryHeap, profile=profile)
+        self.assertEqual(closed[self.c], (2, self.a))
+        with self.assertRaises(ValueError):
+            self.profiles.add_profile("short", [1, 2])
+
+    def test_eight_bytes_per_edge_per_profile(self):
+        self.profiles.add_profile("one")
+        self.profiles.add_profile("two")
+        self.assertEqual(self.profiles.nbytes(), 2 * 8 * 3)
+        self.assertEqual(self.profiles.profile_names(), ["one", "two"])
+        self.profiles.remove_profile("one")
+        self.assertEqual(self.profiles.profile_names(), ["two"])
+
+    def test_rejects_other_or_changed_graph(self):
+        profile = self.profiles.add_profile("base")
+        with self.assertRaises(ValueError):
+            dijkstra_source_to_dest(self.a, None, Graph(), APQBinaryHeap, profile=profile)
+        self.graph.remove_edge(self.a, self.c)
+        with self.assertRaises(ValueError):
+            dijkstra_source_to_dest(self.a, None, self.graph, APQBinaryHeap, profile=profile)
+
+    def test_weights_for(self):
+        profile = self.profiles.add_profile("base")
+        weights, edge_index = profile.weights_for(self.graph)
+        self.assertIs(weights, profile.weights())
+        self.assertEqual(weights[edge_index[self.ac]], 5)
+        with self.assertRaises(ValueError):
+            profile.weights_for(Graph())
+
+    def test_rejects_implicit_grid(self):
+        # its Edges are new objects on every look-up, so they have no stable identity
+        try:
+            import numpy
+        except ImportError:
+            self.skipTest('ImplicitGridGraph needs numpy')
+        grid = ImplicitGridGraph(numpy.ones((2, 3)), numpy.ones((3, 2)))
+        with self.assertRaises(ValueError):
+            WeightProfiles(grid)
+        profiles = WeightProfiles(grid.freeze())
+        self.assertEqual(profiles.num_edges(), grid.num_edges())
+
+    def test_digraph_two_way_edge_has_one_id(self):
+        graph = DiGraph()
+        a, b, c = graph.add_vertices_from(["A", "B", "C"])
+        graph.add_edge(a, b, 1, oneway=False)
+        graph.add_edge(b, c, 1)
+        profiles = WeightProfiles(graph)
+        self.assertEqual(profiles.num_edges(), 2)
+        self.assertEqual(profiles.num_edges(), graph.freeze().num_edge_ids())
+
+
+class TestCSRWeightProfiles(unittest.TestCase):
+    def setUp(self):
+        self.graph = generate_weighted_grid_graph(6, 5, seed=7)
+        self.csr = self.graph.freeze()
+
+    def test_edge_ids_pair_both_slots(self):
+        edge_ids = self.csr.edge_ids()
+        self.assertEqual(self.csr.num_edge_ids(), self.csr.num_edges())
+        for v in self.csr.vertices():
+            for k in range(self.csr._offsets[v], self.csr._offsets[v + 1]):
+                w = self.csr._targets[k]
+                back = [j for j in range(self.csr._offsets[w], self.csr._offsets[w + 1])
+                        if self.csr._targets[j] == v]
+                self.assertEqual(edge_ids[back[0]], edge_ids[k])
+
+    def test_ids_match_graph_profiles(self):
+        # A profile built on the Graph lines up with the frozen graph's edge ids.
+        weights = WeightProfiles(self.graph).add_profile("base").weights()
+        self.assertEqual(list(WeightProfiles(self.csr).add_profile("base").weights()), list(weights))
+
+    def test_profiles_match_scaled_graph(self):
+        profiles = WeightProfiles(self.csr)
+        profile = profiles.add_profile("double", lambda v, w, weight: 2 * weight)
+        start = self.csr.get_vertex_by_label((0, 0))
+        base = dijkstra_source_to_dest(start, None, self.csr, PQLazyHeap)
+        doubled = dijkstra_source_to_dest(start, None, self.csr, PQLazyHeap, profile=profile)
+        self.assertEqual({v: 2 * d for v, (d, _) in base.items()},
+                         {v: d for v, (d, _) in doubled.items()})
+
+    def test_unpaired_slot(self):
+        csr = CSRGraph([0, 1], [0, 1, 1], [1], [1.0])
+        with self.assertRaises(ValueError):
+            csr.edge_ids()
+
+
+if __name__ == '__main__':
+    unittest.main()